@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from config.config_manager import ConfigManager
+from utils.logging_utils import ConsoleLogHandler
+from features.skin_processor.processor import SkinProcessor
+from features.skin_processor.catalog import SkinCatalog
+from .synthetic import generate_installed_tree
+from .stand_in_tools import CALL_LOG_VARIABLE, REPO_ROOT, install_stand_in_tools, read_call_counts
+
+RESULTS_VERSION = 1
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="benchmarks.run", description="Time the skin pipeline against a synthetic installed/ tree")
+    parser.add_argument("--skins", type=int, default=40, help="number of synthetic skins")
+    parser.add_argument("--wads-per-skin", type=int, default=1)
+    parser.add_argument("--dds-per-wad", type=int, default=8)
+    parser.add_argument("--dds-kb", type=int, default=256, help="size of each .dds file in KiB")
+    parser.add_argument("--other-files", type=int, default=4, help="non-texture files per WAD")
+    parser.add_argument("--duplicate-dds", type=float, default=0.25, help="fraction of .dds files that reuse a shared payload (texture cache hits with --subprocess-tex)")
+    parser.add_argument("--tool-latency-ms", type=float, default=0.0, help="extra start-up latency of every stand-in tool call")
+    parser.add_argument("--jobs", type=int, default=1, help="skins processed concurrently")
+    parser.add_argument("--conversion-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--texture-cache-mb", type=int, default=0)
+    parser.add_argument("--backup-store", action="store_true", help="enable the deduplicating backup store")
+    parser.add_argument("--no-staging", action="store_true", help="copy skins to a process directory instead of staging")
+    parser.add_argument("--subprocess-wad", action="store_true", help="use wad-extract.exe/wad-make.exe instead of the in-process WAD code")
+    parser.add_argument("--subprocess-tex", action="store_true", help="use tex2dds.exe instead of the in-process DDS converter")
+    parser.add_argument("--pipeline", action="store_true", help="run process_skins in stage-pipelined mode")
+    parser.add_argument("--scratch-memory", default="off", help="'auto', 'off' or a tmpfs directory for work trees")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workdir", help="directory for the synthetic tree (default: a temporary directory)")
+    parser.add_argument("--keep", action="store_true", help="keep the working directory")
+    parser.add_argument("--output", default="benchmark_results.json", help="results file")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    parser.add_argument("--log-level", default="warning", choices=["debug", "info", "warning", "error"])
+    return parser
+
+def git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=REPO_ROOT, timeout=10)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+def summarize(samples):
+    return {
+        'runs': [round(sample, 6) for sample in samples],
+        'min': round(min(samples), 6),
+        'median': round(statistics.median(samples), 6),
+        'mean': round(statistics.fmean(samples), 6)
+    }
+
+class PipelineBenchmark:
+    def __init__(self, args, workdir):
+        self.args = args
+        self.workdir = Path(workdir)
+        self.cslol_root = self.workdir / "cslol"
+        self.pristine = self.workdir / "pristine"
+        self.call_log = self.workdir / "tool_calls.log"
+        self.timings = {}
+        self.tool_calls = {}
+        self.reports = {}
+        self.stages = {}
+    
+    def setup(self):
+        started = time.perf_counter()
+        tree = generate_installed_tree(
+            self.pristine,
+            skins=self.args.skins,
+            wads_per_skin=self.args.wads_per_skin,
+            dds_per_wad=self.args.dds_per_wad,
+            dds_size=self.args.dds_kb * 1024,
+            other_files=self.args.other_files,
+            duplicate_dds=self.args.duplicate_dds,
+            hash_table=self.cslol_root / "cslol-tools" / "hashes.game.txt"
+        )
+        install_stand_in_tools(self.cslol_root / "cslol-tools", self.args.tool_latency_ms)
+        os.environ[CALL_LOG_VARIABLE] = str(self.call_log)
+        self.reset_installed()
+        tree['seconds'] = round(time.perf_counter() - started, 3)
+        return tree
+    
+    def reset_installed(self):
+        installed = self.cslol_root / "installed"
+        shutil.rmtree(installed, ignore_errors=True)
+        shutil.rmtree(self.cslol_root / "tools_helper_staging", ignore_errors=True)
+        shutil.copytree(self.pristine / "installed", installed)
+        for data_file in ("processed_skins.json", "skin_catalog.json", "batch_journal.jsonl"):
+            (self.workdir / data_file).unlink(missing_ok=True)
+        for data_dir in ("texture_cache", "backups"):
+            shutil.rmtree(self.workdir / data_dir, ignore_errors=True)
+    
+    def create_processor(self):
+        config = ConfigManager()
+        config.config.update({
+            'cslol_manager_path': str(self.cslol_root),
+            'max_workers': self.args.jobs,
+            'conversion_workers': self.args.conversion_workers,
+            'texture_cache_size_mb': self.args.texture_cache_mb,
+            'use_staging': not self.args.no_staging,
+            'backup_store_enabled': self.args.backup_store,
+            'pipeline_enabled': self.args.pipeline,
+            'scratch_memory': self.args.scratch_memory
+        })
+        logger = ConsoleLogHandler(self.args.log_level)
+        processor = SkinProcessor(config, logger)
+        processor.wad_tools.native_wad = not self.args.subprocess_wad
+        processor.wad_tools.native_tex = not self.args.subprocess_tex
+        return processor
+    
+    def measure(self, name, function):
+        self.call_log.unlink(missing_ok=True)
+        started = time.perf_counter()
+        result = function()
+        self.timings.setdefault(name, []).append(time.perf_counter() - started)
+        self.tool_calls[name] = read_call_counts(self.call_log)
+        return result
+    
+    def run(self):
+        for run in range(self.args.repeat):
+            print(f"Run {run + 1}/{self.args.repeat}", file=sys.stderr)
+            self.reset_installed()
+            processor = self.create_processor()
+            skins = processor.get_available_skins()
+            
+            processor.catalog = SkinCatalog(processor.config.get_data_path("skin_catalog.json"))
+            self.measure("get_skins_by_champion_cold", processor.get_skins_by_champion)
+            self.measure("get_skins_by_champion_warm", processor.get_skins_by_champion)
+            
+            staged = self.measure("stage", lambda: [processor.stage_skin(skin) for skin in skins])
+            self.measure("swap", lambda: self.swap_all(processor, skins, staged))
+            
+            self.measure("copy", lambda: self.copy_all(processor, skins))
+            self.measure("replace", lambda: [
+                processor.replace_installed_skin(skin, processor.process_path / skin) for skin in skins
+            ])
+            shutil.rmtree(processor.process_path, ignore_errors=True)
+            
+            report = self.measure("process_skins", lambda: self.process(processor, skins, force=True))
+            self.reports["process_skins"] = report.to_dict() if report else None
+            self.stages = processor.tracer.stage_totals()
+            report = self.measure("process_skins_unchanged", lambda: self.process(processor, skins, force=False))
+            self.reports["process_skins_unchanged"] = report.to_dict() if report else None
+            
+            shutil.rmtree(processor.backup_path, ignore_errors=True)
+            shutil.rmtree(processor.process_path, ignore_errors=True)
+            processor.logger.close()
+    
+    def swap_all(self, processor, skins, staged):
+        for skin, staged_path in zip(skins, staged):
+            processor.swap_staged_skin(skin, staged_path)
+        shutil.rmtree(processor.staging_backup_path, ignore_errors=True)
+    
+    def copy_all(self, processor, skins):
+        processor.process_path.mkdir(parents=True, exist_ok=True)
+        for skin in skins:
+            shutil.copytree(processor.installed_path / skin, processor.process_path / skin)
+    
+    def process(self, processor, skins, force):
+        try:
+            return processor.process_skins(skins, max_workers=self.args.jobs, force=force)
+        except Exception:
+            return processor.last_report
+
+def compare(results, baseline_file):
+    with open(baseline_file, 'r') as f:
+        baseline = json.load(f)
+    
+    print(f"\nCompared with {baseline.get('commit') or baseline_file}:")
+    for name, timing in results['timings'].items():
+        previous = baseline.get('timings', {}).get(name)
+        if not previous:
+            continue
+        ratio = timing['median'] / previous['median'] if previous['median'] else float('inf')
+        print(f"  {name:28} {previous['median']:9.4f}s -> {timing['median']:9.4f}s  ({ratio:.2f}x)")
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    output = Path(args.output).resolve()
+    baseline = Path(args.compare).resolve() if args.compare else None
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="tools_helper_bench_")).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+    original_cwd = Path.cwd()
+    
+    os.chdir(workdir)
+    try:
+        benchmark = PipelineBenchmark(args, workdir)
+        tree = benchmark.setup()
+        print(
+            f"Generated {tree['skins']} skins, {tree['wads']} WADs, {tree['dds_files']} .dds files "
+            f"({tree['duplicate_dds']} shared payloads, {tree['bytes']} bytes) in {tree['seconds']}s",
+            file=sys.stderr
+        )
+        benchmark.run()
+    finally:
+        os.chdir(original_cwd)
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    results = {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'parameters': {name: value for name, value in vars(args).items() if name not in ("output", "compare", "workdir", "keep")},
+        'tree': tree,
+        'timings': {name: summarize(samples) for name, samples in benchmark.timings.items()},
+        'tool_calls': benchmark.tool_calls,
+        'stages': benchmark.stages,
+        'reports': benchmark.reports
+    }
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    
+    for name, timing in results['timings'].items():
+        print(f"{name:28} median {timing['median']:9.4f}s  min {timing['min']:9.4f}s")
+    print(f"Results written to {output}")
+    if baseline:
+        compare(results, baseline)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
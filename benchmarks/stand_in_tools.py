@@ -0,0 +1,96 @@
+import os
+import stat
+import struct
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CALL_LOG_VARIABLE = "TOOLS_HELPER_BENCH_CALL_LOG"
+TOOL_NAMES = ("wad-extract.exe", "tex2dds.exe", "wad-make.exe")
+
+SCRIPT_TEMPLATE = """#!{python}
+import sys
+sys.path.insert(0, {repo_root!r})
+from benchmarks.stand_in_tools import main
+sys.exit(main({tool_name!r}, sys.argv[1:], {latency!r}))
+"""
+
+def install_stand_in_tools(tools_dir, latency_ms=0.0):
+    tools_dir = Path(tools_dir)
+    tools_dir.mkdir(parents=True, exist_ok=True)
+    if not isinstance(latency_ms, dict):
+        latency_ms = {tool_name: latency_ms for tool_name in TOOL_NAMES}
+    
+    for tool_name in TOOL_NAMES:
+        tool_path = tools_dir / tool_name
+        tool_path.write_text(SCRIPT_TEMPLATE.format(
+            python=sys.executable,
+            repo_root=str(REPO_ROOT),
+            tool_name=tool_name,
+            latency=latency_ms.get(tool_name, 0.0) / 1000.0
+        ))
+        tool_path.chmod(tool_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return tools_dir
+
+def read_call_counts(call_log):
+    counts = {tool_name: 0 for tool_name in TOOL_NAMES}
+    try:
+        with open(call_log, 'r') as f:
+            for line in f:
+                tool_name = line.strip()
+                counts[tool_name] = counts.get(tool_name, 0) + 1
+    except FileNotFoundError:
+        pass
+    return counts
+
+def record_call(tool_name):
+    call_log = os.environ.get(CALL_LOG_VARIABLE)
+    if call_log:
+        with open(call_log, 'a') as f:
+            f.write(tool_name + "\n")
+
+def wad_extract(wad_file):
+    from features.skin_processor.wad_file import HashTable, WadReader
+    wad_file = Path(wad_file)
+    hashtable = HashTable(Path(sys.argv[0]).resolve().parent / "hashes.game.txt")
+    with WadReader(wad_file) as reader:
+        names = hashtable.resolve([entry.path_hash for entry in reader])
+        reader.extract(wad_file.with_name(wad_file.name[:-len(".client")]), names=names)
+
+def tex2dds(dds_name):
+    dds_file = Path(dds_name)
+    data = dds_file.read_bytes()
+    if data[:4] != b"DDS ":
+        raise ValueError(f"{dds_file.name} is not a DDS file")
+    height, width = struct.unpack_from("<II", data, 12)
+    header = b"TEX\x00" + struct.pack("<HHBBBB", width, height, 1, 12, 0, 0)
+    dds_file.with_suffix(".tex").write_bytes(header + data[128:])
+
+def wad_make(extracted_dir):
+    from features.skin_processor.wad_file import WadWriter
+    from features.skin_processor.wad_tools import WadTools
+    extracted_dir = Path(extracted_dir)
+    writer = WadWriter(version=(3, 0))
+    for file_path in sorted(extracted_dir.rglob("*")):
+        if file_path.is_file() and file_path.suffix != ".dds":
+            entry_path = WadTools.entry_path_for(extracted_dir, file_path)
+            if entry_path is not None:
+                writer.replace(entry_path, file_path)
+    writer.write(extracted_dir.with_name(extracted_dir.name + ".client"))
+
+def main(tool_name, args, latency):
+    record_call(tool_name)
+    if latency:
+        time.sleep(latency)
+    if len(args) != 1:
+        print(f"usage: {tool_name} <path>", file=sys.stderr)
+        return 2
+    
+    tools = {'wad-extract.exe': wad_extract, 'tex2dds.exe': tex2dds, 'wad-make.exe': wad_make}
+    try:
+        tools[tool_name](args[0])
+    except Exception as e:
+        print(f"{tool_name}: {e}", file=sys.stderr)
+        return 1
+    return 0
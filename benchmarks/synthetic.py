@@ -0,0 +1,74 @@
+import json
+import random
+import struct
+from pathlib import Path
+from features.skin_processor.wad_file import WadWriter, path_hash
+
+CHAMPIONS = (
+    "Ahri", "Akali", "Ashe", "Caitlyn", "Darius", "Ekko", "Ezreal", "Jinx", "Kaisa", "LeeSin",
+    "Lux", "MissFortune", "Riven", "Sett", "Sylas", "Thresh", "Vayne", "Viego", "Yasuo", "Zed"
+)
+
+DDS_HEADER = struct.Struct("<4sIIIIIII44sIII")
+
+def dds_bytes(rng, size):
+    side = 4
+    while (side * 2) * (side * 2) // 2 <= size - 128:
+        side *= 2
+    header = DDS_HEADER.pack(b"DDS ", 124, 0x1007, side, side, 0, 0, 1, b"\x00" * 44, 32, 0x4, 0x31545844)
+    header += b"\x00" * (128 - len(header))
+    return header + rng.randbytes(side * side // 2)
+
+def generate_installed_tree(cslol_root, skins=50, wads_per_skin=1, dds_per_wad=8, dds_size=256 * 1024,
+                            other_files=4, other_size=32 * 1024, duplicate_dds=0.25, hash_table=None, seed=1):
+    rng = random.Random(seed)
+    installed = Path(cslol_root) / "installed"
+    installed.mkdir(parents=True, exist_ok=True)
+    shared_dds = [dds_bytes(rng, dds_size) for _ in range(max(1, dds_per_wad // 2))]
+    names = []
+    
+    stats = {'skins': 0, 'wads': 0, 'dds_files': 0, 'duplicate_dds': 0, 'bytes': 0}
+    for index in range(skins):
+        champion = CHAMPIONS[index % len(CHAMPIONS)]
+        skin_name = f"{champion} Bench Skin {index:04d}"
+        wad_dir = installed / skin_name / "WAD"
+        wad_dir.mkdir(parents=True, exist_ok=True)
+        
+        meta_dir = installed / skin_name / "META"
+        meta_dir.mkdir(exist_ok=True)
+        with open(meta_dir / "info.json", 'w') as f:
+            json.dump({'Name': skin_name, 'Author': "benchmark", 'Version': "1.0"}, f)
+        
+        for wad_index in range(wads_per_skin):
+            wad_name = champion if wad_index == 0 else f"{champion}_{wad_index}"
+            writer = WadWriter(version=(3, 0))
+            base = f"assets/characters/{champion.lower()}/skins/skin{index:04d}"
+            for dds_index in range(dds_per_wad):
+                name = f"{base}/texture_{wad_index}_{dds_index}.dds"
+                if rng.random() < duplicate_dds:
+                    data = rng.choice(shared_dds)
+                    stats['duplicate_dds'] += 1
+                else:
+                    data = dds_bytes(rng, dds_size)
+                writer.replace(name, data)
+                names.extend([name, name[:-len(".dds")] + ".tex"])
+            for other_index in range(other_files):
+                name = f"{base}/data_{wad_index}_{other_index}.bin"
+                writer.replace(name, b"PROP" + rng.randbytes(max(0, other_size - 4)))
+                names.append(name)
+            
+            wad_file = wad_dir / f"{wad_name}.wad.client"
+            writer.write(wad_file)
+            stats['wads'] += 1
+            stats['dds_files'] += dds_per_wad
+            stats['bytes'] += wad_file.stat().st_size
+        stats['skins'] += 1
+    
+    if hash_table:
+        hash_table = Path(hash_table)
+        hash_table.parent.mkdir(parents=True, exist_ok=True)
+        with open(hash_table, 'w', encoding='utf-8') as f:
+            for name in names:
+                f.write(f"{path_hash(name):016x} {name}\n")
+    
+    return stats
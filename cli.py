@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sys
+
+from config.config_manager import ConfigManager
+from utils.logging_utils import ConsoleLogHandler
+from utils.file_log import RotatingFileLog
+from features.skin_processor.processor import SkinProcessor
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli", description="Tools Helper - headless CSLoL skin processor")
+    parser.add_argument("--cslol-path", help="CSLoL Manager directory (overrides config.json for this run)")
+    parser.add_argument("--scratch-dir", help="directory for process/backup work trees (overrides config.json for this run)")
+    parser.add_argument("--scratch-memory", help="'auto', 'off' or a tmpfs/RAM-disk directory for work trees")
+    parser.add_argument("--log-level", choices=["debug", "info", "warning", "error"], help="console and file log level")
+    parser.add_argument("--no-file-log", action="store_true", help="do not write logs/tools_helper.log")
+    
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    list_parser = commands.add_parser("list", help="list installed skins grouped by champion")
+    list_parser.add_argument("--champion", action="append", help="only list these champions")
+    list_parser.add_argument("--json", action="store_true", help="print JSON instead of text")
+    
+    scan_parser = commands.add_parser("scan", help="show which installed skins need processing")
+    scan_parser.add_argument("--champion", action="append", help="only scan these champions")
+    scan_parser.add_argument("--json", action="store_true", help="print JSON instead of text")
+    
+    process_parser = commands.add_parser("process", help="process skins")
+    process_parser.add_argument("skins", nargs="*", help="skin names to process")
+    process_parser.add_argument("--all", action="store_true", help="process every installed skin")
+    process_parser.add_argument("--champion", action="append", help="process every skin of these champions")
+    process_parser.add_argument("--jobs", "-j", type=int, help="number of skins processed concurrently")
+    process_parser.add_argument("--force", action="store_true", help="reprocess skins even if unchanged")
+    process_parser.add_argument("--pipeline", action="store_true", default=None, help="overlap extract/convert/rebuild across skins")
+    process_parser.add_argument("--report", help="write the batch report as JSON to this file")
+    
+    resume_parser = commands.add_parser("resume", help="resume the last interrupted batch")
+    resume_parser.add_argument("--status", action="store_true", help="only show what would be resumed")
+    resume_parser.add_argument("--discard", action="store_true", help="forget the interrupted batch instead of resuming it")
+    resume_parser.add_argument("--jobs", "-j", type=int, help="number of skins processed concurrently")
+    resume_parser.add_argument("--pipeline", action="store_true", default=None, help="overlap extract/convert/rebuild across skins")
+    resume_parser.add_argument("--report", help="write the batch report as JSON to this file")
+    
+    restore_parser = commands.add_parser("restore", help="restore skins from the backup store")
+    restore_parser.add_argument("skins", nargs="+", help="skin names to restore")
+    restore_parser.add_argument("--list", action="store_true", help="only list the available backups")
+    restore_parser.add_argument("--snapshot", help="backup id to restore (default: latest)")
+    
+    config_parser = commands.add_parser("config", help="show or change the settings saved in config.json")
+    config_parser.add_argument("--workers", type=int, help="number of skins processed concurrently")
+    config_parser.add_argument("--pipeline", action=argparse.BooleanOptionalAction, help="overlap extract/convert/rebuild across skins")
+    config_parser.add_argument("--conversion-workers", type=int, help="parallel texture conversions per skin")
+    config_parser.add_argument("--texture-cache-mb", type=int, help="texture cache size in MB (0 disables it)")
+    config_parser.add_argument("--staging", action=argparse.BooleanOptionalAction, help="stage skins before replacing installed files")
+    config_parser.add_argument("--backup-store", action=argparse.BooleanOptionalAction, help="keep deduplicated backups of installed skins")
+    config_parser.add_argument("--backup-compression", choices=["none", "zlib", "lzma"], help="compression of backup objects")
+    config_parser.add_argument("--backup-retention", type=int, help="backups kept per skin")
+    config_parser.add_argument("--log-level", dest="saved_log_level", choices=["debug", "info", "warning", "error"], help="default console and file log level")
+    config_parser.add_argument("--file-log", dest="saved_file_log", action=argparse.BooleanOptionalAction, help="write logs/tools_helper.log")
+    config_parser.add_argument("--log-max-size-mb", type=int, help="size of a log file before it is rotated")
+    config_parser.add_argument("--log-backup-count", type=int, help="rotated log files kept")
+    config_parser.add_argument("--trace", action=argparse.BooleanOptionalAction, help="record a timing trace of every batch")
+    config_parser.add_argument("--scratch-dir", dest="saved_scratch_dir", help="directory for process/backup work trees ('' for the current directory)")
+    config_parser.add_argument("--scratch-memory", dest="saved_scratch_memory", help="'auto', 'off' or a tmpfs/RAM-disk directory for work trees")
+    config_parser.add_argument("--scratch-memory-limit-mb", type=int, help="most scratch memory used (0 for no limit)")
+    config_parser.add_argument("--scratch-memory-reserve-mb", type=int, help="memory left free when using scratch memory")
+    return parser
+
+def filter_champions(champion_skins, champions):
+    if not champions:
+        return champion_skins
+    wanted = {name.lower() for name in champions}
+    return {name: data for name, data in champion_skins.items() if name.lower() in wanted}
+
+def command_list(processor, args):
+    champion_skins = filter_champions(processor.get_skins_by_champion(), args.champion)
+    if args.json:
+        print(json.dumps({name: data['skins'] for name, data in sorted(champion_skins.items())}, indent=2))
+        return 0
+    
+    for champion_name in sorted(champion_skins):
+        skins = champion_skins[champion_name]['skins']
+        print(f"{champion_name} ({len(skins)})")
+        for skin in skins:
+            print(f"  {skin}")
+    return 0
+
+def command_scan(processor, args):
+    champion_skins = filter_champions(processor.get_skins_by_champion(), args.champion)
+    tool_fingerprint = processor.wad_tools.tool_fingerprint()
+    
+    status = {}
+    for champion_data in champion_skins.values():
+        for skin in champion_data['skins']:
+            up_to_date = processor.manifest.is_up_to_date(skin, processor.installed_path / skin, tool_fingerprint)
+            status[skin] = "up to date" if up_to_date else "pending"
+    
+    if args.json:
+        print(json.dumps(dict(sorted(status.items())), indent=2))
+    else:
+        for skin in sorted(status):
+            print(f"{status[skin]:>10}  {skin}")
+        pending = sum(1 for value in status.values() if value == "pending")
+        print(f"{len(status)} skins, {pending} pending, {len(status) - pending} up to date")
+    return 0
+
+def command_process(processor, args):
+    if args.all or args.champion:
+        champion_skins = filter_champions(processor.get_skins_by_champion(), args.champion)
+        skins = sorted(skin for data in champion_skins.values() for skin in data['skins'])
+    else:
+        skins = []
+    skins += [skin for skin in args.skins if skin not in skins]
+    
+    if not skins:
+        print("No skins selected (use skin names, --champion or --all)", file=sys.stderr)
+        return 2
+    
+    try:
+        report = processor.process_skins(
+            skins,
+            progress_callback=processor.logger.info,
+            max_workers=args.jobs,
+            force=args.force,
+            pipeline=args.pipeline
+        )
+    except Exception:
+        report = processor.last_report
+    return finish_report(report, args.report)
+
+def command_resume(processor, args):
+    state = processor.pending_batch()
+    if state is None:
+        print("No interrupted batch to resume")
+        return 0
+    
+    print(f"Interrupted {state.describe()}")
+    if args.status:
+        for skin in state.pending:
+            entry = state.progress.get(skin)
+            print(f"{entry['stage'] if entry else 'not started':>12}  {skin}")
+        return 0
+    if args.discard:
+        processor.discard_batch()
+        return 0
+    
+    try:
+        report = processor.resume_batch(progress_callback=processor.logger.info, max_workers=args.jobs, pipeline=args.pipeline)
+    except Exception:
+        report = processor.last_report
+    return finish_report(report, args.report)
+
+def command_restore(processor, args):
+    if args.snapshot and len(args.skins) > 1:
+        print("--snapshot can only be used with a single skin", file=sys.stderr)
+        return 2
+    
+    if args.list:
+        for skin in args.skins:
+            snapshots = processor.list_backups(skin)
+            print(f"{skin} ({len(snapshots)})")
+            for snapshot_id in reversed(snapshots):
+                print(f"  {snapshot_id}")
+        return 0
+    
+    failed = 0
+    for skin in args.skins:
+        try:
+            processor.restore_skin(skin, args.snapshot)
+        except Exception as e:
+            processor.logger.error(f"❌ Could not restore {skin}: {e}")
+            failed += 1
+    return 1 if failed else 0
+
+def command_config(config_manager, args):
+    if args.workers is not None:
+        config_manager.set_max_workers(args.workers)
+    if args.pipeline is not None:
+        config_manager.set_pipeline_enabled(args.pipeline)
+    if args.conversion_workers is not None:
+        config_manager.set_conversion_workers(args.conversion_workers)
+    if args.texture_cache_mb is not None:
+        config_manager.set_texture_cache_size_mb(args.texture_cache_mb)
+    if args.staging is not None:
+        config_manager.set_use_staging(args.staging)
+    backup_settings = (args.backup_store, args.backup_compression, args.backup_retention)
+    if any(value is not None for value in backup_settings):
+        config_manager.set_backup_settings(*backup_settings)
+    if args.saved_log_level is not None:
+        config_manager.set_log_level(args.saved_log_level)
+    file_log_settings = (args.saved_file_log, args.log_max_size_mb, args.log_backup_count)
+    if any(value is not None for value in file_log_settings):
+        config_manager.set_file_log_settings(*file_log_settings)
+    if args.trace is not None:
+        config_manager.set_trace_enabled(args.trace)
+    scratch_settings = (args.saved_scratch_dir, args.saved_scratch_memory, args.scratch_memory_limit_mb, args.scratch_memory_reserve_mb)
+    if any(value is not None for value in scratch_settings):
+        config_manager.set_scratch_settings(*scratch_settings)
+    
+    settings = {
+        'cslol_manager_path': config_manager.get_cslol_path(),
+        'max_workers': config_manager.get_max_workers(),
+        'pipeline_enabled': config_manager.get_pipeline_enabled(),
+        'conversion_workers': config_manager.get_conversion_workers(),
+        'texture_cache_size_mb': config_manager.get_texture_cache_size_mb(),
+        'use_staging': config_manager.get_use_staging(),
+        'backup_store_enabled': config_manager.get_backup_store_enabled(),
+        'backup_compression': config_manager.get_backup_compression(),
+        'backup_retention': config_manager.get_backup_retention(),
+        'log_level': config_manager.get_log_level(),
+        'file_log_enabled': config_manager.get_file_log_enabled(),
+        'log_max_size_mb': config_manager.get_log_max_size_mb(),
+        'log_backup_count': config_manager.get_log_backup_count(),
+        'trace_enabled': config_manager.get_trace_enabled(),
+        'scratch_dir': config_manager.get_scratch_dir(),
+        'scratch_memory': config_manager.get_scratch_memory(),
+        'scratch_memory_limit_mb': config_manager.get_scratch_memory_limit_mb(),
+        'scratch_memory_reserve_mb': config_manager.get_scratch_memory_reserve_mb()
+    }
+    for name, value in settings.items():
+        print(f"{name:>26}  {value}")
+    return 0
+
+def finish_report(report, report_file):
+    if report_file and report:
+        with open(report_file, 'w') as f:
+            json.dump(report.to_dict(), f, indent=2)
+    return 1 if report is None or report.failed else 0
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    
+    config_manager = ConfigManager()
+    if args.command == "config":
+        return command_config(config_manager, args)
+    
+    if args.cslol_path:
+        config_manager.config['cslol_manager_path'] = args.cslol_path
+    if args.scratch_dir:
+        config_manager.config['scratch_dir'] = args.scratch_dir
+    if args.scratch_memory:
+        config_manager.config['scratch_memory'] = args.scratch_memory
+    
+    logger = ConsoleLogHandler(args.log_level or config_manager.get_log_level())
+    file_log = None if args.no_file_log else RotatingFileLog.from_config(config_manager)
+    if file_log:
+        logger.add_sink(file_log)
+    logger.install_crash_handlers()
+    
+    if not config_manager.validate_cslol_path():
+        logger.error(f"❌ CSLoL Manager path is not configured or has no installed folder: {config_manager.get_cslol_path() or '(empty)'}")
+        return 2
+    
+    processor = SkinProcessor(config_manager, logger)
+    commands = {'list': command_list, 'scan': command_scan, 'process': command_process, 'resume': command_resume, 'restore': command_restore}
+    try:
+        return commands[args.command](processor, args)
+    finally:
+        logger.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 class ConfigManager:
@@ -22,6 +23,9 @@ class ConfigManager:
         except Exception:
             pass
     
+    def get_data_path(self, name):
+        return self.config_file.parent / name
+    
     def get_cslol_path(self):
         return self.config.get('cslol_manager_path', '')
     
@@ -29,6 +33,135 @@ class ConfigManager:
         self.config['cslol_manager_path'] = str(path)
         self.save_config()
     
+    def get_max_workers(self):
+        return self.config.get('max_workers', 1)
+    
+    def set_max_workers(self, count):
+        self.config['max_workers'] = max(1, int(count))
+        self.save_config()
+    
+    def get_conversion_workers(self):
+        return self.config.get('conversion_workers', os.cpu_count() or 1)
+    
+    def set_conversion_workers(self, count):
+        self.config['conversion_workers'] = max(1, int(count))
+        self.save_config()
+    
+    def get_texture_cache_size_mb(self):
+        return self.config.get('texture_cache_size_mb', 2048)
+    
+    def set_texture_cache_size_mb(self, size_mb):
+        self.config['texture_cache_size_mb'] = max(0, int(size_mb))
+        self.save_config()
+    
+    def get_use_staging(self):
+        return self.config.get('use_staging', True)
+    
+    def set_use_staging(self, enabled):
+        self.config['use_staging'] = bool(enabled)
+        self.save_config()
+    
+    def get_backup_store_enabled(self):
+        return self.config.get('backup_store_enabled', True)
+    
+    def get_backup_compression(self):
+        return self.config.get('backup_compression', 'none')
+    
+    def get_backup_retention(self):
+        return self.config.get('backup_retention', 5)
+    
+    def set_backup_settings(self, enabled=None, compression=None, retention=None):
+        if enabled is not None:
+            self.config['backup_store_enabled'] = bool(enabled)
+        if compression is not None:
+            self.config['backup_compression'] = compression
+        if retention is not None:
+            self.config['backup_retention'] = max(1, int(retention))
+        self.save_config()
+    
+    def get_log_level(self):
+        return self.config.get('log_level', 'info')
+    
+    def set_log_level(self, level):
+        self.config['log_level'] = str(level).lower()
+        self.save_config()
+    
+    def get_file_log_enabled(self):
+        return self.config.get('file_log_enabled', True)
+    
+    def get_log_max_size_mb(self):
+        return self.config.get('log_max_size_mb', 5)
+    
+    def get_log_backup_count(self):
+        return self.config.get('log_backup_count', 5)
+    
+    def set_file_log_settings(self, enabled=None, max_size_mb=None, backup_count=None):
+        if enabled is not None:
+            self.config['file_log_enabled'] = bool(enabled)
+        if max_size_mb is not None:
+            self.config['log_max_size_mb'] = max(1, int(max_size_mb))
+        if backup_count is not None:
+            self.config['log_backup_count'] = max(0, int(backup_count))
+        self.save_config()
+    
+    def get_watch_enabled(self):
+        return self.config.get('watch_enabled', False)
+    
+    def set_watch_enabled(self, enabled):
+        self.config['watch_enabled'] = bool(enabled)
+        self.save_config()
+    
+    def get_watch_poll_interval(self):
+        return self.config.get('watch_poll_interval', 2.0)
+    
+    def get_watch_settle_seconds(self):
+        return self.config.get('watch_settle_seconds', 5.0)
+    
+    def get_trace_enabled(self):
+        return self.config.get('trace_enabled', True)
+    
+    def set_trace_enabled(self, enabled):
+        self.config['trace_enabled'] = bool(enabled)
+        self.save_config()
+    
+    def get_pipeline_enabled(self):
+        return self.config.get('pipeline_enabled', False)
+    
+    def set_pipeline_enabled(self, enabled):
+        self.config['pipeline_enabled'] = bool(enabled)
+        self.save_config()
+    
+    def get_pipeline_queue_size(self):
+        return self.config.get('pipeline_queue_size', 2)
+    
+    def get_pipeline_stage_workers(self):
+        workers = {'prepare': 1, 'extract': 1, 'convert': 1, 'rebuild': 1, 'install': 1}
+        workers.update(self.config.get('pipeline_stage_workers', {}))
+        return workers
+    
+    def get_scratch_dir(self):
+        return self.config.get('scratch_dir', '')
+    
+    def get_scratch_memory(self):
+        return self.config.get('scratch_memory', 'off')
+    
+    def get_scratch_memory_limit_mb(self):
+        return self.config.get('scratch_memory_limit_mb', 0)
+    
+    def get_scratch_memory_reserve_mb(self):
+        return self.config.get('scratch_memory_reserve_mb', 512)
+    
+    def set_scratch_settings(self, directory=None, memory=None, limit_mb=None, reserve_mb=None):
+        if directory is not None:
+            self.config['scratch_dir'] = str(directory)
+        if memory is not None:
+            self.config['scratch_memory'] = str(memory)
+        if limit_mb is not None:
+            self.config['scratch_memory_limit_mb'] = max(0, int(limit_mb))
+        if reserve_mb is not None:
+            self.config['scratch_memory_reserve_mb'] = max(0, int(reserve_mb))
+        self.save_config()
+    
     def validate_cslol_path(self):
         path = Path(self.get_cslol_path())
         if not path.exists():
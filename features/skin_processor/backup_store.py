@@ -0,0 +1,243 @@
+import hashlib
+import json
+import lzma
+import os
+import shutil
+import threading
+import time
+import zlib
+from pathlib import Path
+
+class BackupStore:
+    CHUNK_SIZE = 1024 * 1024
+    GC_GRACE_SECONDS = 3600
+    SUFFIXES = {'none': "", 'zlib': ".zz", 'lzma': ".xz"}
+    
+    def __init__(self, root, compression="none", retention=5):
+        if compression not in self.SUFFIXES:
+            raise ValueError(f"Unknown backup compression: {compression}")
+        self.root = Path(root)
+        self.objects_path = self.root / "objects"
+        self.snapshots_path = self.root / "snapshots"
+        self.compression = compression
+        self.retention = max(1, retention)
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def compressor(compression):
+        if compression == 'zlib':
+            return zlib.compressobj(6)
+        if compression == 'lzma':
+            return lzma.LZMACompressor(preset=6)
+        return None
+    
+    @staticmethod
+    def decompressor(compression):
+        if compression == 'zlib':
+            return zlib.decompressobj()
+        if compression == 'lzma':
+            return lzma.LZMADecompressor()
+        return None
+    
+    def object_base(self, digest):
+        return self.objects_path / digest[:2] / digest
+    
+    def find_object(self, digest):
+        base = self.object_base(digest)
+        for compression, suffix in self.SUFFIXES.items():
+            candidate = base.with_name(base.name + suffix)
+            if candidate.exists():
+                return candidate, compression
+        return None, None
+    
+    def hash_file(self, path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def touch_object(path):
+        if path.stat().st_nlink > 1:
+            temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            shutil.copy2(path, temp_path)
+            os.replace(temp_path, path)
+        os.utime(path)
+    
+    def store_object(self, path, digest):
+        existing, _ = self.find_object(digest)
+        if existing is not None:
+            self.touch_object(existing)
+            return 0
+        
+        base = self.object_base(digest)
+        target = base.with_name(base.name + self.SUFFIXES[self.compression])
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_target = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+        
+        compressor = self.compressor(self.compression)
+        with open(path, 'rb') as src, open(temp_target, 'wb') as dst:
+            while True:
+                chunk = src.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                dst.write(compressor.compress(chunk) if compressor else chunk)
+            if compressor:
+                dst.write(compressor.flush())
+        os.replace(temp_target, target)
+        return target.stat().st_size
+    
+    def skin_snapshots_path(self, skin_name):
+        return self.snapshots_path / skin_name
+    
+    def snapshots(self, skin_name):
+        snapshot_dir = self.skin_snapshots_path(skin_name)
+        if not snapshot_dir.exists():
+            return []
+        return sorted((path.stem for path in snapshot_dir.glob("*.json")), key=self.snapshot_key)
+    
+    @staticmethod
+    def snapshot_key(snapshot_id):
+        stamp, _, sequence = snapshot_id.rpartition("-")
+        return stamp, int(sequence) if sequence.isdigit() else -1
+    
+    def skins(self):
+        if not self.snapshots_path.exists():
+            return []
+        return sorted(d.name for d in self.snapshots_path.iterdir() if d.is_dir() and self.snapshots(d.name))
+    
+    def load_snapshot(self, skin_name, snapshot_id=None):
+        snapshots = self.snapshots(skin_name)
+        if not snapshots:
+            raise Exception(f"No backup found for {skin_name}")
+        snapshot_id = snapshot_id or snapshots[-1]
+        if snapshot_id not in snapshots:
+            raise Exception(f"Backup {snapshot_id} not found for {skin_name}")
+        
+        with open(self.skin_snapshots_path(skin_name) / f"{snapshot_id}.json", 'r') as f:
+            return json.load(f)
+    
+    def new_snapshot_id(self, skin_name):
+        now_ns = time.time_ns()
+        snapshot_id = time.strftime("%Y%m%d-%H%M%S", time.localtime(now_ns // 1000000000)) + f"-{now_ns // 1000 % 1000000:06d}"
+        snapshots = self.snapshots(skin_name)
+        if snapshots and self.snapshot_key(snapshot_id) <= self.snapshot_key(snapshots[-1]):
+            stamp, sequence = self.snapshot_key(snapshots[-1])
+            snapshot_id = f"{stamp}-{sequence + 1:06d}"
+        return snapshot_id
+    
+    def backup(self, skin_path, skin_name):
+        skin_path = Path(skin_path)
+        try:
+            previous = {entry['path']: entry for entry in self.load_snapshot(skin_name)['files']}
+        except Exception:
+            previous = {}
+        
+        files = []
+        stats = {'files': 0, 'reused': 0, 'stored_bytes': 0}
+        for path in sorted(p for p in skin_path.rglob("*") if p.is_file()):
+            relative = path.relative_to(skin_path).as_posix()
+            stat = path.stat()
+            known = previous.get(relative)
+            
+            existing = self.find_object(known['hash'])[0] if known else None
+            if existing is not None and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+                self.touch_object(existing)
+                digest = known['hash']
+                stats['reused'] += 1
+            else:
+                digest = self.hash_file(path)
+                stored = self.store_object(path, digest)
+                stats['stored_bytes'] += stored
+                if not stored:
+                    stats['reused'] += 1
+            
+            stats['files'] += 1
+            files.append({
+                'path': relative,
+                'hash': digest,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns
+            })
+        
+        snapshot_dir = self.skin_snapshots_path(skin_name)
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            snapshot_id = self.new_snapshot_id(skin_name)
+            snapshot_file = snapshot_dir / f"{snapshot_id}.json"
+            temp_file = snapshot_file.with_name(f"{snapshot_file.name}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w') as f:
+                json.dump({'skin': skin_name, 'created_at': int(time.time()), 'files': files}, f, indent=2)
+            os.replace(temp_file, snapshot_file)
+        
+        self.apply_retention(skin_name)
+        return snapshot_id, stats
+    
+    def restore(self, skin_name, target_path, snapshot_id=None):
+        snapshot = self.load_snapshot(skin_name, snapshot_id)
+        target_path = Path(target_path)
+        target_path.mkdir(parents=True, exist_ok=True)
+        
+        stats = {'linked': 0, 'copied': 0, 'bytes': 0}
+        for entry in snapshot['files']:
+            source, compression = self.find_object(entry['hash'])
+            if source is None:
+                raise Exception(f"Backup object missing for {skin_name}/{entry['path']}")
+            
+            destination = target_path / Path(*entry['path'].split("/"))
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            
+            if compression == 'none':
+                try:
+                    os.link(source, destination)
+                    stats['linked'] += 1
+                except OSError:
+                    shutil.copyfile(source, destination)
+                    stats['copied'] += 1
+            else:
+                decompressor = self.decompressor(compression)
+                with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                    while True:
+                        chunk = src.read(self.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        dst.write(decompressor.decompress(chunk))
+                stats['copied'] += 1
+            stats['bytes'] += entry['size']
+        
+        return stats
+    
+    def apply_retention(self, skin_name):
+        snapshots = self.snapshots(skin_name)
+        expired = snapshots[:-self.retention]
+        for snapshot_id in expired:
+            (self.skin_snapshots_path(skin_name) / f"{snapshot_id}.json").unlink()
+        if expired:
+            self.collect_garbage()
+        return len(expired)
+    
+    def collect_garbage(self):
+        with self.lock:
+            referenced = set()
+            for skin_name in self.skins():
+                for snapshot_id in self.snapshots(skin_name):
+                    try:
+                        snapshot = self.load_snapshot(skin_name, snapshot_id)
+                    except (OSError, ValueError):
+                        continue
+                    referenced.update(entry['hash'] for entry in snapshot['files'])
+            
+            removed = 0
+            cutoff = time.time() - self.GC_GRACE_SECONDS
+            if self.objects_path.exists():
+                for path in self.objects_path.glob("*/*"):
+                    digest = path.name.split(".")[0]
+                    if digest in referenced or path.name.endswith(".tmp") or path.stat().st_mtime > cutoff:
+                        continue
+                    path.unlink()
+                    removed += 1
+            return removed
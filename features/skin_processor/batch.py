@@ -0,0 +1,120 @@
+import threading
+import time
+
+PROCESSED = "processed"
+SKIP_MISSING = "skin does not exist"
+SKIP_NO_WAD = "no WAD directory"
+SKIP_UNCHANGED = "unchanged since last run"
+
+class SkinResult:
+    def __init__(self, skin_name, status, error=None, duration=0.0, worker=None):
+        self.skin_name = skin_name
+        self.status = status
+        self.error = error
+        self.duration = duration
+        self.worker = worker
+    
+    def to_dict(self):
+        return {
+            'skin': self.skin_name,
+            'status': self.status,
+            'error': self.error,
+            'duration': round(self.duration, 3),
+            'worker': self.worker
+        }
+
+class BatchReport:
+    def __init__(self, skins, workers=1):
+        self.skins = list(skins)
+        self.workers = workers
+        self.results = {}
+        self.started_at = time.time()
+        self.finished_at = None
+        self.counters = {}
+        self.stages = {}
+        self.lock = threading.Lock()
+    
+    def record(self, skin_name, status, error=None, duration=0.0, worker=None):
+        with self.lock:
+            self.results[skin_name] = SkinResult(skin_name, status, error, duration, worker)
+    
+    def record_success(self, skin_name, duration=0.0, worker=None):
+        self.record(skin_name, PROCESSED, duration=duration, worker=worker)
+    
+    def record_skipped(self, skin_name, reason, duration=0.0, worker=None):
+        self.record(skin_name, "skipped", reason, duration, worker)
+    
+    def record_failure(self, skin_name, error, duration=0.0, worker=None):
+        self.record(skin_name, "failed", str(error), duration, worker)
+    
+    def add_counter(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def finish(self):
+        self.finished_at = time.time()
+    
+    def with_status(self, status):
+        with self.lock:
+            return [result for result in self.results.values() if result.status == status]
+    
+    @property
+    def processed(self):
+        return self.with_status(PROCESSED)
+    
+    @property
+    def skipped(self):
+        return self.with_status("skipped")
+    
+    @property
+    def failed(self):
+        return self.with_status("failed")
+    
+    @property
+    def duration(self):
+        end = self.finished_at or time.time()
+        return end - self.started_at
+    
+    def summary_lines(self):
+        lines = [
+            f"📊 Batch report: {len(self.processed)} processed, {len(self.skipped)} skipped, "
+            f"{len(self.failed)} failed ({self.duration:.1f}s, {self.workers} worker{'s' if self.workers != 1 else ''})"
+        ]
+        if 'rebuilds' in self.counters or 'rebuilds_avoided' in self.counters:
+            lines.append(
+                f"   🔧 WAD rebuilds: {self.counters.get('rebuilds', 0)} performed, "
+                f"{self.counters.get('rebuilds_avoided', 0)} avoided (nothing to repack)"
+            )
+        if self.stages:
+            lines.append("   🔀 Pipeline stages:")
+            for name, stage in self.stages.items():
+                lines.append(
+                    f"      {name:<8} {stage['workers']} worker{'s' if stage['workers'] != 1 else ' '}  {stage['items']:>4} items  "
+                    f"busy {stage['busy']:7.2f}s ({stage['utilization']:.0%})  blocked {stage['blocked']:6.2f}s  "
+                    f"queue avg {stage['queue_avg']:.1f} max {stage['queue_max']}"
+                )
+        for result in self.skipped:
+            lines.append(f"   ⏭ {result.skin_name}: {result.error}")
+        for result in self.failed:
+            lines.append(f"   ❌ {result.skin_name}: {result.error}")
+        return lines
+    
+    def failure_message(self):
+        failed = self.failed
+        names = ", ".join(result.skin_name for result in failed[:5])
+        if len(failed) > 5:
+            names += ", ..."
+        return f"{len(failed)} of {len(self.skins)} skins failed: {names}"
+    
+    def to_dict(self):
+        with self.lock:
+            results = [result.to_dict() for result in self.results.values()]
+        return {
+            'skins': len(self.skins),
+            'workers': self.workers,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'counters': dict(self.counters),
+            'stages': self.stages,
+            'results': results
+        }
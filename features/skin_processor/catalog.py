@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+class SkinCatalog:
+    VERSION = 1
+    
+    def __init__(self, catalog_file):
+        self.catalog_file = Path(catalog_file)
+        self.lock = threading.Lock()
+        self.entries = self.load()
+        self.dirty = False
+    
+    def load(self):
+        try:
+            if self.catalog_file.exists():
+                with open(self.catalog_file, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    return data.get('skins', {})
+        except Exception:
+            pass
+        return {}
+    
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                temp_file = self.catalog_file.with_name(self.catalog_file.name + ".tmp")
+                with open(temp_file, 'w') as f:
+                    json.dump({'version': self.VERSION, 'skins': self.entries}, f)
+                temp_file.replace(self.catalog_file)
+                self.dirty = False
+            except Exception:
+                pass
+    
+    @staticmethod
+    def scan_installed(installed_path):
+        skins = {}
+        try:
+            with os.scandir(installed_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        skins[entry.name] = entry.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+        return skins
+    
+    @staticmethod
+    def mtime_of(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    @staticmethod
+    def wad_listing(wad_path):
+        listing = []
+        try:
+            with os.scandir(wad_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".wad.client"):
+                        stat = entry.stat()
+                        listing.append([entry.name, stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            pass
+        return sorted(listing)
+    
+    def lookup(self, skin_name, dir_mtime_ns, wad_mtime_ns):
+        with self.lock:
+            entry = self.entries.get(skin_name)
+        if entry and entry['dir_mtime_ns'] == dir_mtime_ns and entry['wad_mtime_ns'] == wad_mtime_ns:
+            return entry
+        return None
+    
+    def update(self, skin_name, dir_mtime_ns, wad_mtime_ns, champion, wad_files):
+        with self.lock:
+            self.entries[skin_name] = {
+                'champion': champion,
+                'dir_mtime_ns': dir_mtime_ns,
+                'wad_mtime_ns': wad_mtime_ns,
+                'wad_files': wad_files,
+                'scanned_at': int(time.time())
+            }
+            self.dirty = True
+    
+    def prune(self, present_skins):
+        with self.lock:
+            missing = [name for name in self.entries if name not in present_skins]
+            for name in missing:
+                del self.entries[name]
+            if missing:
+                self.dirty = True
+        return len(missing)
@@ -0,0 +1,138 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+STAGES = ("prepared", "extracted", "converted", "rebuilt", "installed")
+
+class BatchState:
+    def __init__(self, header):
+        self.batch_id = header.get('batch')
+        self.skins = header.get('skins', [])
+        self.force = header.get('force', False)
+        self.directories = header.get('directories', {})
+        self.started_at = header.get('at', 0)
+        self.progress = {}
+        self.finished = set()
+    
+    def apply(self, record):
+        event = record.get('event')
+        skin_name = record.get('skin')
+        if event == "stage":
+            self.progress[skin_name] = record
+        elif event == "failed":
+            if self.progress.get(skin_name, {}).get('stage') != STAGES[-1]:
+                self.progress.pop(skin_name, None)
+        elif event == "done":
+            self.progress.pop(skin_name, None)
+            self.finished.add(skin_name)
+    
+    @property
+    def pending(self):
+        return [skin_name for skin_name in self.skins if skin_name not in self.finished]
+    
+    def work_paths(self):
+        return [Path(entry['work_path']) for entry in self.progress.values() if entry.get('work_path')]
+    
+    def describe(self):
+        started = time.strftime('%Y-%m-%d %H:%M', time.localtime(self.started_at))
+        in_progress = sum(1 for skin_name in self.pending if skin_name in self.progress)
+        return (
+            f"batch started {started}: {len(self.pending)} of {len(self.skins)} skins unfinished"
+            f"{f', {in_progress} partially processed' if in_progress else ''}"
+        )
+
+class BatchJournal:
+    def __init__(self, journal_file):
+        self.journal_file = Path(journal_file)
+        self.lock = threading.Lock()
+        self.handle = None
+    
+    def start(self, skins, force, directories):
+        self.close()
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            self.handle = open(self.journal_file, 'w', encoding='utf-8')
+        self.append({
+            'event': "batch",
+            'batch': f"{int(time.time() * 1000):x}",
+            'skins': list(skins),
+            'force': bool(force),
+            'directories': {name: str(path) for name, path in directories.items()}
+        })
+    
+    def resume(self):
+        self.close()
+        with self.lock:
+            with open(self.journal_file, 'rb+') as f:
+                f.truncate(f.read().rfind(b"\n") + 1)
+            self.handle = open(self.journal_file, 'a', encoding='utf-8')
+        self.append({'event': "resume"})
+    
+    def append(self, record):
+        with self.lock:
+            if self.handle is None:
+                return
+            record['at'] = time.time()
+            self.handle.write(json.dumps(record) + "\n")
+            self.handle.flush()
+            os.fsync(self.handle.fileno())
+    
+    def stage(self, job, stage, **data):
+        self.append(dict(
+            data,
+            event="stage",
+            skin=job.skin_name,
+            stage=stage,
+            work_path=str(job.work_path),
+            source_hash=job.source_hash,
+            tools=job.tool_fingerprint
+        ))
+    
+    def done(self, skin_name, status):
+        self.append({'event': "done", 'skin': skin_name, 'status': status})
+    
+    def failed(self, skin_name, error):
+        self.append({'event': "failed", 'skin': skin_name, 'error': str(error)})
+    
+    def finish(self):
+        self.append({'event': "end"})
+        self.close()
+    
+    def close(self):
+        with self.lock:
+            if self.handle is not None:
+                self.handle.close()
+                self.handle = None
+    
+    def records(self):
+        records = []
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+        except OSError:
+            pass
+        return records
+    
+    def load(self):
+        state = None
+        for record in self.records():
+            if record.get('event') == "batch":
+                state = BatchState(record)
+            elif record.get('event') == "end":
+                state = None
+            elif state is not None:
+                state.apply(record)
+        return state
+    
+    def discard(self):
+        self.close()
+        try:
+            self.journal_file.unlink()
+        except OSError:
+            pass
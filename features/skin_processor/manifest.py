@@ -0,0 +1,96 @@
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+class ProcessedManifest:
+    HASH_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, manifest_file):
+        self.manifest_file = Path(manifest_file)
+        self.lock = threading.Lock()
+        self.entries = self.load()
+    
+    def load(self):
+        try:
+            if self.manifest_file.exists():
+                with open(self.manifest_file, 'r') as f:
+                    return json.load(f).get('skins', {})
+        except Exception:
+            pass
+        return {}
+    
+    def save(self):
+        try:
+            temp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+            with open(temp_file, 'w') as f:
+                json.dump({'version': 1, 'skins': self.entries}, f, indent=2)
+            temp_file.replace(self.manifest_file)
+        except Exception:
+            pass
+    
+    @staticmethod
+    def wad_files(skin_path):
+        wad_path = Path(skin_path) / "WAD"
+        if not wad_path.exists():
+            return []
+        return sorted(wad_path.glob("*.wad.client"))
+    
+    @classmethod
+    def stat_signature(cls, skin_path):
+        signature = []
+        for wad_file in cls.wad_files(skin_path):
+            stat = wad_file.stat()
+            signature.append([wad_file.name, stat.st_size, stat.st_mtime_ns])
+        return signature
+    
+    @classmethod
+    def content_hash(cls, skin_path):
+        digest = hashlib.sha256()
+        for wad_file in cls.wad_files(skin_path):
+            digest.update(wad_file.name.encode('utf-8') + b"\0")
+            with open(wad_file, 'rb') as f:
+                while True:
+                    chunk = f.read(cls.HASH_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+        return digest.hexdigest()
+    
+    def is_up_to_date(self, skin_name, skin_path, tool_fingerprint):
+        with self.lock:
+            entry = self.entries.get(skin_name)
+        if not entry or entry.get('tools') != tool_fingerprint:
+            return False
+        
+        signature = self.stat_signature(skin_path)
+        if not signature:
+            return False
+        if signature == entry.get('output_stat'):
+            return True
+        
+        if self.content_hash(skin_path) != entry.get('output_hash'):
+            return False
+        
+        with self.lock:
+            entry['output_stat'] = signature
+            self.save()
+        return True
+    
+    def record(self, skin_name, source_hash, skin_path, tool_fingerprint):
+        entry = {
+            'source_hash': source_hash,
+            'output_hash': self.content_hash(skin_path),
+            'output_stat': self.stat_signature(skin_path),
+            'tools': tool_fingerprint,
+            'processed_at': int(time.time())
+        }
+        with self.lock:
+            self.entries[skin_name] = entry
+            self.save()
+    
+    def forget(self, skin_name):
+        with self.lock:
+            if self.entries.pop(skin_name, None) is not None:
+                self.save()
@@ -0,0 +1,206 @@
+import queue
+import threading
+import time
+from .batch import PROCESSED, SKIP_NO_WAD
+from .journal import STAGES
+
+class SkinJob:
+    def __init__(self, skin_name, work_path, source_hash, tool_fingerprint):
+        self.skin_name = skin_name
+        self.work_path = work_path
+        self.source_hash = source_hash
+        self.tool_fingerprint = tool_fingerprint
+        self.conversion = None
+        self.lease = None
+        self.used_bytes = 0
+        self.stage = STAGES[0]
+        self.resumed = False
+        self.started = time.perf_counter()
+    
+    def reached(self, stage):
+        return STAGES.index(self.stage) >= STAGES.index(stage)
+    
+    @property
+    def wad_dir(self):
+        return self.work_path / "WAD"
+
+class StageStats:
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self.depth_total = 0
+        self.depth_samples = 0
+        self.depth_max = 0
+        self.lock = threading.Lock()
+    
+    def sample_depth(self, depth):
+        with self.lock:
+            self.depth_total += depth
+            self.depth_samples += 1
+            self.depth_max = max(self.depth_max, depth)
+    
+    def add_busy(self, seconds):
+        with self.lock:
+            self.items += 1
+            self.busy += seconds
+    
+    def add_blocked(self, seconds):
+        with self.lock:
+            self.blocked += seconds
+    
+    def to_dict(self, wall_time):
+        capacity = wall_time * self.workers
+        return {
+            'workers': self.workers,
+            'items': self.items,
+            'busy': round(self.busy, 3),
+            'blocked': round(self.blocked, 3),
+            'utilization': round(self.busy / capacity, 3) if capacity else 0.0,
+            'queue_avg': round(self.depth_total / self.depth_samples, 2) if self.depth_samples else 0.0,
+            'queue_max': self.depth_max
+        }
+
+class StagePipeline:
+    STAGES = ("prepare", "extract", "convert", "rebuild", "install")
+    STOP = object()
+    
+    def __init__(self, processor, report, stage_workers=None, queue_size=2, force=False, progress_callback=None):
+        self.processor = processor
+        self.report = report
+        self.force = force
+        self.progress_callback = progress_callback
+        self.queue_size = max(1, queue_size)
+        
+        stage_workers = stage_workers or {}
+        self.stats = {name: StageStats(name, max(1, int(stage_workers.get(name, 1)))) for name in self.STAGES}
+        self.queues = [queue.Queue() if index == 0 else queue.Queue(maxsize=self.queue_size) for index in range(len(self.STAGES))]
+        self.remaining = {name: self.stats[name].workers for name in self.STAGES}
+        self.remaining_lock = threading.Lock()
+        self.done = 0
+        self.total = 0
+        self.wall_time = 0.0
+    
+    def run(self, skins):
+        self.total = len(skins)
+        started = time.perf_counter()
+        for skin_name in skins:
+            self.queues[0].put(skin_name)
+        for _ in range(self.stats[self.STAGES[0]].workers):
+            self.queues[0].put(self.STOP)
+        
+        threads = []
+        for index, name in enumerate(self.STAGES):
+            for worker in range(self.stats[name].workers):
+                thread = threading.Thread(target=self.stage_worker, args=(index,), name=f"pipeline-{name}_{worker}", daemon=True)
+                thread.start()
+                threads.append(thread)
+        
+        for thread in threads:
+            thread.join()
+        self.wall_time = time.perf_counter() - started
+        self.report.stages = self.stage_report()
+    
+    def stage_worker(self, index):
+        name = self.STAGES[index]
+        stats = self.stats[name]
+        handler = getattr(self, f"run_{name}")
+        inbox = self.queues[index]
+        outbox = self.queues[index + 1] if index + 1 < len(self.STAGES) else None
+        
+        try:
+            while True:
+                stats.sample_depth(inbox.qsize())
+                item = inbox.get()
+                if item is self.STOP:
+                    break
+                
+                skin_name = item if isinstance(item, str) else item.skin_name
+                started = time.perf_counter()
+                try:
+                    with self.processor.tracer.span(skin_name, category="skin", skin=skin_name):
+                        result = handler(item)
+                except Exception as e:
+                    stats.add_busy(time.perf_counter() - started)
+                    try:
+                        self.fail(item, e)
+                    except Exception as fail_error:
+                        self.processor.logger.error(f"❌ Could not record failure of {skin_name}: {fail_error}")
+                    continue
+                stats.add_busy(time.perf_counter() - started)
+                
+                if result is not None and outbox is not None:
+                    blocked_since = time.perf_counter()
+                    outbox.put(result)
+                    stats.add_blocked(time.perf_counter() - blocked_since)
+        finally:
+            with self.remaining_lock:
+                self.remaining[name] -= 1
+                last_worker = self.remaining[name] == 0
+            if last_worker and outbox is not None:
+                for _ in range(self.stats[self.STAGES[index + 1]].workers):
+                    outbox.put(self.STOP)
+    
+    def run_prepare(self, skin_name):
+        _, backup_root, process_root = self.processor.get_worker_directories()
+        job = self.processor.prepare_skin(skin_name, backup_root, process_root, self.force)
+        if isinstance(job, SkinJob):
+            return job
+        self.finish(skin_name, job, time.perf_counter())
+        return None
+    
+    def run_extract(self, job):
+        if not job.reached("installed") and not self.processor.has_wad_dir(job):
+            self.processor.release_skin_job(job)
+            self.finish(job.skin_name, SKIP_NO_WAD, job.started)
+            return None
+        self.processor.extract_skin(job)
+        return job
+    
+    def run_convert(self, job):
+        self.processor.convert_skin(job)
+        return job
+    
+    def run_rebuild(self, job):
+        self.processor.rebuild_skin(job, self.report)
+        return job
+    
+    def run_install(self, job):
+        try:
+            self.processor.install_skin(job)
+        finally:
+            self.processor.release_skin_job(job)
+        self.processor.record_processed(job)
+        self.finish(job.skin_name, PROCESSED, job.started)
+        return None
+    
+    def fail(self, item, error):
+        if isinstance(item, SkinJob):
+            self.processor.release_skin_job(item)
+            skin_name, started = item.skin_name, item.started
+        else:
+            skin_name, started = item, time.perf_counter()
+        self.processor.logger.error(f"❌ {skin_name} failed: {error}")
+        self.processor.journal.failed(skin_name, error)
+        self.report.record_failure(skin_name, error, time.perf_counter() - started)
+        self.advance(skin_name)
+    
+    def finish(self, skin_name, status, started):
+        self.processor.journal.done(skin_name, status)
+        if status == PROCESSED:
+            self.report.record_success(skin_name, time.perf_counter() - started)
+        else:
+            self.report.record_skipped(skin_name, status, time.perf_counter() - started)
+        self.advance(skin_name)
+    
+    def advance(self, skin_name):
+        with self.remaining_lock:
+            self.done += 1
+            done = self.done
+        if self.progress_callback:
+            self.progress_callback(f"Processed: {skin_name} ({done}/{self.total})")
+    
+    def stage_report(self):
+        return {name: self.stats[name].to_dict(self.wall_time) for name in self.STAGES}
@@ -1,45 +1,103 @@
 import shutil
 import threading
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from .wad_tools import WadTools
+from .batch import BatchReport, PROCESSED, SKIP_MISSING, SKIP_NO_WAD, SKIP_UNCHANGED
+from .manifest import ProcessedManifest
+from .texture_cache import TextureCache
+from .backup_store import BackupStore
+from .catalog import SkinCatalog
+from .pipeline import SkinJob, StagePipeline
+from .journal import BatchJournal
+from .scratch import ScratchSpace
 from utils.file_utils import FileManager
+from utils.profiling import PipelineTracer, directory_size
 
 class SkinProcessor:
     def __init__(self, config_manager, logger):
         self.config = config_manager
         self.logger = logger
         self.tools_path = self.determine_tools_path()
-        self.wad_tools = WadTools(self.tools_path, logger)
+        self.tracer = PipelineTracer(self.config.get_trace_enabled())
+        self.wad_tools = WadTools(
+            self.tools_path,
+            logger,
+            self.config.get_conversion_workers(),
+            self.create_texture_cache(),
+            self.tracer
+        )
         
         self.installed_path = Path(self.config.get_cslol_path()) / "installed"
-        self.backup_path = Path(FileManager.generate_unique_dir_name("backup"))
-        self.process_path = Path(FileManager.generate_unique_dir_name("process"))
+        self.scratch = self.create_scratch_space()
+        self.backup_path = self.scratch.disk_path / FileManager.generate_unique_dir_name("backup")
+        self.process_path = self.scratch.disk_path / FileManager.generate_unique_dir_name("process")
+        self.staging_path = self.installed_path.parent / "tools_helper_staging"
+        self.staging_backup_path = self.staging_path / self.backup_path.name
+        self.use_staging = self.config.get_use_staging()
+        self.backup_store = self.create_backup_store()
+        self.manifest = ProcessedManifest(self.config.get_data_path("processed_skins.json"))
+        self.catalog = SkinCatalog(self.config.get_data_path("skin_catalog.json"))
+        self.journal = BatchJournal(self.config.get_data_path("batch_journal.jsonl"))
+        self.resume_state = None
+        self.last_report = None
+        self.worker_slots = threading.local()
+        self.worker_counter = 0
+        self.worker_lock = threading.Lock()
+        self.batch_lock = threading.Lock()
+        self.active_skins = frozenset()
     
     def determine_tools_path(self):
         local_tools = Path("cslol-tools")
         if local_tools.exists() and (local_tools / "wad-extract.exe").exists():
-            self.logger.log("Using local CSLoL tools")
+            self.logger.info("Using local CSLoL tools")
             return local_tools
         
         cslol_path = Path(self.config.get_cslol_path())
         if cslol_path.exists():
             cslol_tools = cslol_path / "cslol-tools"
             if cslol_tools.exists() and (cslol_tools / "wad-extract.exe").exists():
-                self.logger.log("Using CSLoL Manager tools")
+                self.logger.info("Using CSLoL Manager tools")
                 return cslol_tools
         
-        self.logger.log("WARNING: No CSLoL tools found")
+        self.logger.warning("WARNING: No CSLoL tools found")
         return local_tools
     
+    def create_texture_cache(self):
+        cache_size_mb = self.config.get_texture_cache_size_mb()
+        if cache_size_mb <= 0:
+            return None
+        return TextureCache(self.config.get_data_path("texture_cache"), cache_size_mb * 1024 * 1024)
+    
+    def create_scratch_space(self):
+        return ScratchSpace(
+            self.config.get_scratch_dir(),
+            self.config.get_scratch_memory(),
+            self.config.get_scratch_memory_limit_mb() * 1024 * 1024,
+            self.config.get_scratch_memory_reserve_mb() * 1024 * 1024,
+            self.logger
+        )
+    
+    def create_backup_store(self):
+        if not self.config.get_backup_store_enabled():
+            return None
+        return BackupStore(
+            self.config.get_data_path("backups"),
+            self.config.get_backup_compression(),
+            self.config.get_backup_retention()
+        )
+    
     def get_available_skins(self):
-        if not self.installed_path.exists():
-            return []
-        return [d.name for d in self.installed_path.iterdir() if d.is_dir()]
+        return list(SkinCatalog.scan_installed(self.installed_path))
     
-    def get_skins_by_champion(self):
-        skins = self.get_available_skins()
+    def get_skins_by_champion(self, on_batch=None, cancel_event=None, batch_size=50):
+        installed = SkinCatalog.scan_installed(self.installed_path)
+        skins = list(installed)
         champion_skins = {}
+        analyzed = 0
+        batch = {}
         
         champion_emojis = {
             'aatrox': '⚔️',
@@ -199,8 +257,12 @@ class SkinProcessor:
             'zyra': '🌹'
         }
         
-        for skin in skins:
-            champion_name = self.extract_champion_from_wad(skin)
+        for scanned, skin in enumerate(skins, start=1):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            
+            champion_name, cached = self.catalog_champion(skin, installed[skin])
+            analyzed += not cached
             if champion_name:
                 if champion_name not in champion_skins:
                     emoji = champion_emojis.get(champion_name.lower(), '🎨')
@@ -209,35 +271,55 @@ class SkinProcessor:
                         'skins': []
                     }
                 champion_skins[champion_name]['skins'].append(skin)
+                if on_batch:
+                    batch.setdefault(champion_name, {'emoji': champion_skins[champion_name]['emoji'], 'skins': []})['skins'].append(skin)
+            
+            if on_batch and (scanned % batch_size == 0 or scanned == len(skins)):
+                on_batch(batch, scanned, len(skins))
+                batch = {}
         
         for champion_data in champion_skins.values():
             champion_data['skins'].sort()
         
+        self.catalog.prune(installed)
+        self.catalog.save()
+        self.logger.info(f"📇 Skin catalog: {len(skins) - analyzed} skins from cache, {analyzed} analyzed")
+        
         return champion_skins
     
+    def catalog_champion(self, skin_name, dir_mtime_ns):
+        wad_path = self.installed_path / skin_name / "WAD"
+        wad_mtime_ns = SkinCatalog.mtime_of(wad_path)
+        entry = self.catalog.lookup(skin_name, dir_mtime_ns, wad_mtime_ns)
+        if entry:
+            return entry['champion'], True
+        
+        champion_name = self.extract_champion_from_wad(skin_name)
+        self.catalog.update(skin_name, dir_mtime_ns, wad_mtime_ns, champion_name, SkinCatalog.wad_listing(wad_path))
+        return champion_name, False
+    
     def extract_champion_from_wad(self, skin_name):
         skin_path = self.installed_path / skin_name
         wad_path = skin_path / "WAD"
         
-        self.logger.log(f"🔍 Analyzing skin: {skin_name}")
-        self.logger.log(f"   WAD path: {wad_path}")
-        self.logger.log(f"   WAD exists: {wad_path.exists()}")
+        self.logger.debug(f"🔍 Analyzing skin: {skin_name}")
+        self.logger.debug(lambda: f"   WAD path: {wad_path} (exists: {wad_path.exists()})")
         
         if not wad_path.exists():
-            self.logger.log(f"   ⚠️ No WAD directory found for {skin_name}")
+            self.logger.warning(f"   ⚠️ No WAD directory found for {skin_name}")
             return self.extract_champion_name_fallback(skin_name)
         
         wad_files = list(wad_path.glob("*.wad.client"))
-        self.logger.log(f"   WAD files found: {[f.name for f in wad_files]}")
+        self.logger.debug(lambda: f"   WAD files found: {[f.name for f in wad_files]}")
         
         if not wad_files:
-            self.logger.log(f"   ⚠️ No .wad.client files found for {skin_name}")
+            self.logger.warning(f"   ⚠️ No .wad.client files found for {skin_name}")
             return self.extract_champion_name_fallback(skin_name)
         
         wad_file = wad_files[0]
         champion_name = wad_file.stem.replace('.wad', '')
         
-        self.logger.log(f"   ✅ Champion extracted: {champion_name}")
+        self.logger.debug(f"   ✅ Champion extracted: {champion_name}")
         
         return champion_name.title()
     
@@ -269,73 +351,497 @@ class SkinProcessor:
         
         return "Unknown"
     
-    def setup_directories(self):
-        FileManager.cleanup_old_work_directories(Path.cwd(), ["process_*", "backup_*"], self.logger)
+    def setup_directories(self, keep=()):
+        keep = {Path(path).name for path in keep}
+        FileManager.cleanup_old_work_directories(Path.cwd(), ["process_*", "backup_*"], self.logger, keep)
+        if self.scratch.disk_path.exists():
+            FileManager.cleanup_old_work_directories(self.scratch.disk_path, ["process_*", "backup_*"], self.logger, keep)
+        if self.scratch.memory_path and self.scratch.memory_path.exists():
+            FileManager.cleanup_old_work_directories(self.scratch.memory_path, ["work_*"], self.logger, keep)
+        if self.staging_path.exists():
+            FileManager.cleanup_old_work_directories(
+                self.staging_path,
+                ["backup_*", "stage_*", "incoming_*", "outgoing_*", "restore_*"],
+                self.logger,
+                keep
+            )
         
         for directory in [self.backup_path, self.process_path]:
+            if directory.name in keep:
+                directory.mkdir(exist_ok=True)
+                continue
             if directory.exists():
-                self.logger.log(f"⚠ Directory {directory.name} already exists, removing...")
+                self.logger.warning(f"⚠ Directory {directory.name} already exists, removing...")
                 FileManager.force_remove_directory(directory, self.logger)
-            directory.mkdir(exist_ok=True)
-            
-        self.logger.log(f"Directories {self.backup_path.name} and {self.process_path.name} created")
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        self.logger.debug(f"Directories {self.backup_path.name} and {self.process_path.name} created")
+    
+    def pending_batch(self):
+        return self.journal.load()
+    
+    def resume_batch(self, progress_callback=None, max_workers=None, pipeline=None):
+        state = self.journal.load()
+        if state is None:
+            raise Exception("No interrupted batch to resume")
+        return self.process_skins(state.pending, progress_callback, max_workers, state.force, pipeline, resume=state)
     
-    def process_skins(self, selected_skins, progress_callback=None):
+    def discard_batch(self):
+        if not self.batch_lock.acquire(blocking=False):
+            raise Exception("Cannot discard the interrupted batch while a batch is running")
         try:
-            self.logger.log(f"Starting processing of {len(selected_skins)} skins...")
+            state = self.journal.load()
+            self.journal.discard()
+        finally:
+            self.batch_lock.release()
+        
+        if state is not None:
+            self.logger.info(f"🗑 Discarded interrupted {state.describe()}")
+        return state
+    
+    def start_journal(self, selected_skins, force, resume=None):
+        self.resume_state = resume
+        if resume is None:
             self.setup_directories()
+            self.journal.start(selected_skins, force, {'backup': self.backup_path, 'process': self.process_path})
+            return
+        
+        self.logger.info(f"⏯ Resuming {resume.describe()}")
+        directories = resume.directories
+        self.backup_path = Path(directories.get('backup', self.backup_path))
+        self.process_path = Path(directories.get('process', self.process_path))
+        self.staging_backup_path = self.staging_path / self.backup_path.name
+        
+        keep = [self.backup_path, self.process_path, self.staging_backup_path]
+        for work_path in resume.work_paths():
+            keep.extend(parent for parent in [work_path, *work_path.parents] if parent.name)
+        self.setup_directories(keep)
+        self.journal.resume()
+    
+    def process_skins(self, selected_skins, progress_callback=None, max_workers=None, force=False, pipeline=None, resume=None):
+        with self.batch_lock:
+            self.active_skins = frozenset(selected_skins)
+            try:
+                return self.run_batch(selected_skins, progress_callback, max_workers, force, pipeline, resume)
+            finally:
+                self.active_skins = frozenset()
+    
+    def run_batch(self, selected_skins, progress_callback=None, max_workers=None, force=False, pipeline=None, resume=None):
+        if max_workers is None:
+            max_workers = self.config.get_max_workers()
+        max_workers = max(1, min(int(max_workers), len(selected_skins) or 1))
+        if pipeline is None:
+            pipeline = self.config.get_pipeline_enabled()
+        
+        report = BatchReport(selected_skins, max_workers)
+        self.last_report = report
+        self.tracer.reset()
+        self.scratch.reset()
+        
+        try:
+            self.logger.info(f"Starting processing of {len(selected_skins)} skins...")
+            self.logger.info(f"🧮 Using {self.scratch.describe()}")
+            self.start_journal(selected_skins, force, resume)
+            
+            with self.tracer.span("batch", category="batch", skins=len(selected_skins), workers=max_workers):
+                if pipeline:
+                    self.process_skins_pipelined(selected_skins, report, progress_callback, force)
+                elif max_workers > 1:
+                    self.process_skins_parallel(selected_skins, report, max_workers, progress_callback, force)
+                else:
+                    for i, skin in enumerate(selected_skins):
+                        if progress_callback:
+                            progress_callback(f"Processing: {skin} ({i+1}/{len(selected_skins)})")
+                        self.process_skin_into_report(skin, report, self.backup_path, self.process_path, force=force)
+            
+            report.finish()
+            for line in report.summary_lines():
+                self.logger.info(line)
+            if self.wad_tools.texture_cache:
+                self.logger.info(self.wad_tools.texture_cache.summary())
+            self.logger.info(self.scratch.summary())
+            self.report_trace()
             
-            for i, skin in enumerate(selected_skins):
+            if report.failed:
+                self.logger.info(f"⏯ {len(report.failed)} unfinished skin{'s' if len(report.failed) != 1 else ''} can be resumed")
+                raise Exception(report.failure_message())
+            
+            self.journal.finish()
+            self.logger.info("Processing completed successfully!")
+            return report
+            
+        except Exception as e:
+            report.finish()
+            self.logger.error(f"Error: {str(e)}")
+            self.report_trace()
+            raise
+        finally:
+            self.journal.close()
+            self.resume_state = None
+            self.logger.flush()
+    
+    def report_trace(self):
+        if not self.tracer.enabled:
+            return
+        for line in self.tracer.summary_lines():
+            self.logger.info(line)
+        try:
+            trace_file = self.tracer.write_chrome_trace(self.config.get_data_path("traces"))
+            self.logger.info(f"🧭 Trace written to {trace_file} (open it in chrome://tracing or ui.perfetto.dev)")
+        except OSError as e:
+            self.logger.warning(f"⚠ Could not write trace file: {e}")
+    
+    def process_skins_parallel(self, selected_skins, report, max_workers, progress_callback=None, force=False):
+        self.logger.info(f"Running worker pool with {max_workers} workers")
+        self.worker_counter = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="skin-worker") as executor:
+            futures = {
+                executor.submit(self.process_skin_in_worker, skin, report, force): skin
+                for skin in selected_skins
+            }
+            
+            for done, future in enumerate(as_completed(futures), start=1):
+                skin = futures[future]
+                try:
+                    future.result()
+                except Exception:
+                    pass
                 if progress_callback:
-                    progress_callback(f"Processing: {skin} ({i+1}/{len(selected_skins)})")
-                self.process_single_skin(skin)
-                
-            self.logger.log("Processing completed successfully!")
-            return True
+                    progress_callback(f"Processed: {skin} ({done}/{len(selected_skins)})")
+    
+    def process_skins_pipelined(self, selected_skins, report, progress_callback=None, force=False):
+        stage_workers = self.config.get_pipeline_stage_workers()
+        self.logger.info(
+            "Running stage pipeline (" + ", ".join(f"{name}: {stage_workers.get(name, 1)}" for name in StagePipeline.STAGES) + " workers)"
+        )
+        self.worker_counter = 0
+        
+        pipeline = StagePipeline(
+            self,
+            report,
+            stage_workers=stage_workers,
+            queue_size=self.config.get_pipeline_queue_size(),
+            force=force,
+            progress_callback=progress_callback
+        )
+        pipeline.run(selected_skins)
+    
+    def get_worker_directories(self):
+        if not hasattr(self.worker_slots, 'index'):
+            with self.worker_lock:
+                self.worker_counter += 1
+                self.worker_slots.index = self.worker_counter
             
+            worker_name = f"worker_{self.worker_slots.index}"
+            self.worker_slots.backup_path = self.backup_path / worker_name
+            self.worker_slots.process_path = self.process_path / worker_name
+            self.worker_slots.backup_path.mkdir(exist_ok=True)
+            self.worker_slots.process_path.mkdir(exist_ok=True)
+        
+        return self.worker_slots.index, self.worker_slots.backup_path, self.worker_slots.process_path
+    
+    def process_skin_in_worker(self, skin_name, report, force=False):
+        worker, backup_root, process_root = self.get_worker_directories()
+        self.process_skin_into_report(skin_name, report, backup_root, process_root, worker, force)
+    
+    def process_skin_into_report(self, skin_name, report, backup_root, process_root, worker=None, force=False):
+        started = time.perf_counter()
+        try:
+            with self.tracer.span(skin_name, category="skin", skin=skin_name):
+                status = self.process_single_skin(skin_name, backup_root, process_root, force, report)
         except Exception as e:
-            self.logger.log(f"Error: {str(e)}")
+            self.logger.error(f"❌ {skin_name} failed: {e}")
+            self.journal.failed(skin_name, e)
+            report.record_failure(skin_name, e, time.perf_counter() - started, worker)
             raise
+        
+        self.journal.done(skin_name, status)
+        if status == PROCESSED:
+            report.record_success(skin_name, time.perf_counter() - started, worker)
+        else:
+            report.record_skipped(skin_name, status, time.perf_counter() - started, worker)
     
-    def process_single_skin(self, skin_name):
+    def process_single_skin(self, skin_name, backup_root=None, process_root=None, force=False, report=None):
+        job = self.prepare_skin(skin_name, backup_root, process_root, force)
+        if not isinstance(job, SkinJob):
+            return job
+        
+        try:
+            status = self.run_skin_pipeline(job, report)
+        finally:
+            self.release_skin_job(job)
+        
+        if status == PROCESSED:
+            self.record_processed(job)
+        return status
+    
+    def prepare_skin(self, skin_name, backup_root=None, process_root=None, force=False):
         skin_path = self.installed_path / skin_name
-        backup_skin_path = self.backup_path / skin_name
-        process_skin_path = self.process_path / skin_name
+        backup_skin_path = (backup_root or self.backup_path) / skin_name
+        process_skin_path = (process_root or self.process_path) / skin_name
+        
+        self.logger.info(f"=== Processing {skin_name} ===")
+        self.logger.debug(lambda: f"Source path: {skin_path} (exists: {skin_path.exists()})")
         
-        self.logger.log(f"=== Processing {skin_name} ===")
-        self.logger.log(f"Source path: {skin_path}")
-        self.logger.log(f"Exists: {skin_path.exists()}")
+        job = self.resume_skin_job(skin_name)
+        if job:
+            return job
         
         if not skin_path.exists():
-            self.logger.log(f"ERROR: Skin {skin_name} does not exist!")
-            return
+            self.logger.error(f"ERROR: Skin {skin_name} does not exist!")
+            return SKIP_MISSING
         
-        self.logger.log(f"Backing up {skin_name}...")
-        shutil.copytree(skin_path, backup_skin_path)
+        tool_fingerprint = self.wad_tools.tool_fingerprint()
+        with self.tracer.span("check"):
+            if not force and self.manifest.is_up_to_date(skin_name, skin_path, tool_fingerprint):
+                self.logger.info(f"⏭ {skin_name} unchanged since last run, skipping (use force to reprocess)")
+                return SKIP_UNCHANGED
+            
+            source_hash = self.manifest.content_hash(skin_path)
+        
+        if self.backup_store:
+            with self.tracer.span("backup"):
+                self.backup_skin_to_store(skin_name)
+        
+        if not self.use_staging and not self.backup_store:
+            self.logger.info(f"Backing up {skin_name}...")
+            with self.tracer.span("backup") as span:
+                if backup_skin_path.exists():
+                    shutil.rmtree(backup_skin_path)
+                shutil.copytree(skin_path, backup_skin_path)
+                span.add_bytes(lambda: directory_size(backup_skin_path))
+        
+        lease = self.allocate_scratch(skin_name, skin_path)
+        try:
+            if lease.in_memory:
+                self.logger.info(f"Copying {skin_name} to scratch memory...")
+                with self.tracer.span("copy") as span:
+                    work_skin_path = self.stage_skin(skin_name, self.scratch.work_path(FileManager.generate_unique_dir_name(f"work_{skin_name}")))
+                    span.add_bytes(lambda: directory_size(work_skin_path))
+            elif self.use_staging:
+                self.logger.debug(f"Staging {skin_name} next to installed (hardlinked copy)...")
+                with self.tracer.span("stage"):
+                    work_skin_path = self.stage_skin(skin_name)
+            else:
+                self.logger.info(f"Copying {skin_name} to process...")
+                if process_skin_path.exists():
+                    shutil.rmtree(process_skin_path)
+                with self.tracer.span("copy") as span:
+                    shutil.copytree(skin_path, process_skin_path)
+                    span.add_bytes(lambda: directory_size(process_skin_path))
+                work_skin_path = process_skin_path
+        except Exception:
+            self.scratch.release(lease)
+            raise
+        
+        job = SkinJob(skin_name, work_skin_path, source_hash, tool_fingerprint)
+        job.lease = lease
+        self.journal.stage(job, job.stage)
+        return job
+    
+    def allocate_scratch(self, skin_name, skin_path):
+        if self.scratch.memory_path is None:
+            return self.scratch.allocate(skin_name, 0)
+        return self.scratch.allocate(skin_name, ScratchSpace.estimate_work_size(skin_path))
+    
+    def resume_skin_job(self, skin_name):
+        entry = self.resume_state.progress.get(skin_name) if self.resume_state else None
+        if not entry:
+            return None
+        
+        job = SkinJob(skin_name, Path(entry['work_path']), entry['source_hash'], entry['tools'])
+        job.stage = entry['stage']
+        job.resumed = True
+        skin_path = self.installed_path / skin_name
+        in_memory = self.scratch.contains(job.work_path)
+        
+        if job.stage == "rebuilt" and self.use_staging and not in_memory and not job.work_path.exists() and skin_path.exists():
+            job.stage = "installed"
+        if job.reached("installed"):
+            self.logger.info(f"⏯ {skin_name} was already installed, recording it")
+            return job
         
-        self.logger.log(f"Copying {skin_name} to process...")
-        shutil.copytree(skin_path, process_skin_path)
+        if not job.work_path.exists():
+            reason = "work directory is gone"
+        elif job.tool_fingerprint != self.wad_tools.tool_fingerprint():
+            reason = "CSLoL tools changed"
+        elif skin_path.exists() and self.manifest.content_hash(skin_path) != job.source_hash:
+            reason = "installed skin changed"
+        else:
+            if 'outputs' in entry:
+                job.conversion = {'outputs': {
+                    job.wad_dir / dir_name: [job.wad_dir / dir_name / file_name for file_name in files]
+                    for dir_name, files in entry['outputs'].items()
+                }}
+            self.logger.info(f"⏯ Resuming {skin_name} after stage '{job.stage}'")
+            job.lease = self.scratch.adopt(skin_name, job.work_path)
+            return job
         
-        wad_dir = process_skin_path / "WAD"
-        self.logger.log(f"Looking for WAD directory: {wad_dir}")
-        self.logger.log(f"WAD directory exists: {wad_dir.exists()}")
+        self.logger.info(f"⏯ Restarting {skin_name} from scratch ({reason})")
+        if not self.use_staging or in_memory:
+            shutil.rmtree(job.work_path, ignore_errors=True)
+        return None
+    
+    def mark_stage(self, job, stage, **data):
+        job.stage = stage
+        self.journal.stage(job, stage, **data)
+    
+    def release_skin_job(self, job):
+        in_memory = job.lease is not None and job.lease.in_memory
+        if job.lease is not None:
+            if not job.used_bytes:
+                self.measure_scratch(job)
+            self.scratch.release(job.lease, job.used_bytes)
+            job.lease = None
+        if (self.use_staging or in_memory) and job.work_path.exists():
+            shutil.rmtree(job.work_path, ignore_errors=True)
+    
+    def measure_scratch(self, job):
+        if job.lease is not None and (job.lease.in_memory or self.tracer.enabled) and job.work_path.exists():
+            job.used_bytes = directory_size(job.work_path)
+    
+    def record_processed(self, job):
+        self.manifest.record(job.skin_name, job.source_hash, self.installed_path / job.skin_name, job.tool_fingerprint)
+        self.logger.info(f"✅ {job.skin_name} processed successfully")
+    
+    def run_skin_pipeline(self, job, report=None):
+        if not job.reached("installed") and not self.has_wad_dir(job):
+            return SKIP_NO_WAD
+        
+        self.extract_skin(job)
+        self.convert_skin(job)
+        self.rebuild_skin(job, report)
+        self.install_skin(job)
+        return PROCESSED
+    
+    def has_wad_dir(self, job):
+        wad_dir = job.wad_dir
+        self.logger.debug(lambda: f"Looking for WAD directory: {wad_dir} (exists: {wad_dir.exists()})")
         
         if not wad_dir.exists():
-            self.logger.log(f"No WAD directory for {skin_name}, skipping")
+            self.logger.warning(f"No WAD directory for {job.skin_name}, skipping")
+            return False
+        return True
+    
+    def extract_skin(self, job):
+        if job.reached("extracted"):
             return
-            
-        self.logger.log(f"Extracting WADs for {skin_name}...")
-        self.wad_tools.extract_wads(wad_dir)
+        self.logger.info(f"Extracting WADs for {job.skin_name}...")
+        self.wad_tools.extract_wads(job.wad_dir)
+        self.mark_stage(job, "extracted")
+    
+    def convert_skin(self, job):
+        if job.reached("converted"):
+            return
+        self.logger.info(f"Converting .dds files for {job.skin_name}...")
+        job.conversion = self.wad_tools.convert_dds_files(job.wad_dir, track_unchanged=not job.resumed)
+        self.mark_stage(job, "converted", outputs={
+            extracted_dir.name: [tex_file.relative_to(extracted_dir).as_posix() for tex_file in tex_files]
+            for extracted_dir, tex_files in job.conversion['outputs'].items()
+        })
+    
+    def rebuild_skin(self, job, report=None):
+        if job.reached("rebuilt"):
+            return
+        self.logger.info(f"Rebuilding WADs for {job.skin_name}...")
+        rebuild = self.wad_tools.rebuild_wads(job.wad_dir, job.conversion['outputs'])
+        if report:
+            report.add_counter('rebuilds', rebuild['rebuilt'])
+            report.add_counter('rebuilds_avoided', rebuild['avoided'])
+        self.measure_scratch(job)
+        self.mark_stage(job, "rebuilt")
+    
+    def install_skin(self, job):
+        if job.reached("installed"):
+            return
+        self.logger.info(f"Replacing {job.skin_name} in installed...")
+        with self.tracer.span("install") as span:
+            if self.use_staging and self.scratch.contains(job.work_path):
+                self.swap_staged_skin(job.skin_name, self.copy_into_staging(job.skin_name, job.work_path))
+            elif self.use_staging:
+                self.swap_staged_skin(job.skin_name, job.work_path)
+            else:
+                self.replace_installed_skin(job.skin_name, job.work_path)
+                span.add_bytes(lambda: directory_size(self.installed_path / job.skin_name))
+        self.mark_stage(job, "installed")
+    
+    def stage_skin(self, skin_name, staged_path=None):
+        if staged_path is None:
+            self.staging_path.mkdir(exist_ok=True)
+            staged_path = self.staging_path / FileManager.generate_unique_dir_name(f"stage_{skin_name}")
+        
+        try:
+            FileManager.clone_directory(self.installed_path / skin_name, staged_path, copy_if=WadTools.is_extracted_path)
+        except Exception:
+            shutil.rmtree(staged_path, ignore_errors=True)
+            raise
+        return staged_path
+    
+    def swap_staged_skin(self, skin_name, staged_path):
+        if self.backup_store:
+            FileManager.replace_directory(staged_path, self.installed_path / skin_name, self.staging_path, self.logger)
+            return
+        
+        self.staging_backup_path.mkdir(parents=True, exist_ok=True)
+        FileManager.replace_directory(
+            staged_path,
+            self.installed_path / skin_name,
+            self.staging_path,
+            self.logger,
+            backup_target=self.staging_backup_path / skin_name
+        )
+        self.logger.info(f"Original {skin_name} kept as backup in {self.staging_backup_path}")
+    
+    def backup_skin_to_store(self, skin_name):
+        snapshot_id, stats = self.backup_store.backup(self.installed_path / skin_name, skin_name)
+        self.logger.info(
+            f"Backed up {skin_name} as snapshot {snapshot_id} "
+            f"({stats['files']} files, {stats['reused']} already stored, {stats['stored_bytes']} bytes added)"
+        )
+        return snapshot_id
+    
+    def list_backups(self, skin_name):
+        if not self.backup_store:
+            return []
+        return self.backup_store.snapshots(skin_name)
+    
+    def restore_skin(self, skin_name, snapshot_id=None):
+        if not self.backup_store:
+            raise Exception("Backup store is disabled")
+        
+        self.staging_path.mkdir(parents=True, exist_ok=True)
+        restore_path = self.staging_path / FileManager.generate_unique_dir_name(f"restore_{skin_name}")
         
-        self.logger.log(f"Converting .dds files for {skin_name}...")
-        self.wad_tools.convert_dds_files(wad_dir)
+        try:
+            stats = self.backup_store.restore(skin_name, restore_path, snapshot_id)
+            FileManager.replace_directory(restore_path, self.installed_path / skin_name, self.staging_path, self.logger)
+        except Exception:
+            shutil.rmtree(restore_path, ignore_errors=True)
+            raise
         
-        self.logger.log(f"Rebuilding WADs for {skin_name}...")
-        self.wad_tools.rebuild_wads(wad_dir)
+        self.manifest.forget(skin_name)
+        self.logger.info(f"↩️ Restored {skin_name} ({stats['linked']} linked, {stats['copied']} copied, {stats['bytes']} bytes)")
+        return stats
+    
+    def copy_into_staging(self, skin_name, source_path):
+        self.staging_path.mkdir(exist_ok=True)
+        incoming_path = self.staging_path / FileManager.generate_unique_dir_name(f"incoming_{skin_name}")
         
-        self.logger.log(f"Replacing {skin_name} in installed...")
-        if skin_path.exists():
-            shutil.rmtree(skin_path)
-        shutil.copytree(process_skin_path, skin_path)
+        try:
+            shutil.copytree(source_path, incoming_path)
+        except Exception:
+            shutil.rmtree(incoming_path, ignore_errors=True)
+            raise
+        return incoming_path
+    
+    def replace_installed_skin(self, skin_name, process_skin_path):
+        skin_path = self.installed_path / skin_name
+        incoming_path = self.copy_into_staging(skin_name, process_skin_path)
         
-        self.logger.log(f"✅ {skin_name} processed successfully") 
\ No newline at end of file
+        try:
+            FileManager.replace_directory(incoming_path, skin_path, self.staging_path, self.logger)
+        except Exception:
+            if incoming_path.exists():
+                shutil.rmtree(incoming_path, ignore_errors=True)
+            raise
@@ -0,0 +1,166 @@
+import os
+import shutil
+import threading
+from pathlib import Path
+from .wad_file import WadEntry, WadError, WadReader
+from utils.profiling import PipelineTracer, directory_size
+
+class ScratchLease:
+    def __init__(self, skin_name, estimate, in_memory):
+        self.skin_name = skin_name
+        self.estimate = estimate
+        self.in_memory = in_memory
+
+class ScratchSpace:
+    DIR_NAME = "tools_helper_scratch"
+    MEMORY_FILESYSTEMS = ("tmpfs", "ramfs")
+    MEMORY_CANDIDATES = ("/dev/shm",)
+    SYSTEM_MOUNTS = ("/sys", "/proc", "/dev", "/run")
+    USER_MOUNTS = ("/run/user/",)
+    
+    def __init__(self, disk_root=None, memory_root="off", memory_limit=0, memory_reserve=0, logger=None):
+        self.disk_path = (Path(disk_root) if disk_root else Path.cwd()) / self.DIR_NAME
+        self.memory_limit = memory_limit
+        self.memory_reserve = memory_reserve
+        self.logger = logger
+        self.lock = threading.Lock()
+        
+        memory_root = self.find_memory_root(memory_root)
+        self.memory_path = Path(memory_root) / self.DIR_NAME if memory_root else None
+        self.memory_budget = 0
+        self.reset()
+    
+    @classmethod
+    def memory_mounts(cls):
+        mounts = list(cls.MEMORY_CANDIDATES)
+        try:
+            with open("/proc/mounts", 'r') as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 3 or fields[2] not in cls.MEMORY_FILESYSTEMS:
+                        continue
+                    mount_point = fields[1].replace("\\040", " ")
+                    if mount_point.startswith(cls.SYSTEM_MOUNTS) and not mount_point.startswith(cls.USER_MOUNTS):
+                        continue
+                    mounts.append(mount_point)
+        except OSError:
+            pass
+        return list(dict.fromkeys(mounts))
+    
+    @classmethod
+    def find_memory_root(cls, setting):
+        if not setting or setting == "off":
+            return None
+        
+        candidates = cls.memory_mounts() if setting == "auto" else [setting]
+        usable = []
+        for candidate in candidates:
+            if os.path.isdir(candidate) and os.access(candidate, os.W_OK | os.X_OK):
+                try:
+                    usable.append((shutil.disk_usage(candidate).free, candidate))
+                except OSError:
+                    continue
+        return max(usable)[1] if usable else None
+    
+    def free_memory(self):
+        try:
+            return shutil.disk_usage(self.memory_path.parent).free
+        except OSError:
+            return 0
+    
+    def reset(self):
+        with self.lock:
+            self.memory_used = 0
+            self.memory_peak = 0
+            self.bytes_used = {'memory': 0, 'disk': 0}
+            self.leases = {'memory': 0, 'disk': 0}
+            self.fallbacks = 0
+            self.memory_budget = 0
+            if self.memory_path:
+                budget = self.free_memory() - self.memory_reserve
+                if self.memory_limit:
+                    budget = min(budget, self.memory_limit)
+                self.memory_budget = max(0, budget)
+    
+    @staticmethod
+    def estimate_work_size(skin_path):
+        skin_path = Path(skin_path)
+        extracted = 0
+        for wad_file in (skin_path / "WAD").glob("*.wad.client"):
+            try:
+                with WadReader(wad_file) as reader:
+                    extracted += sum(entry.size for entry in reader.entries if entry.type != WadEntry.TYPE_LINK)
+            except (WadError, OSError):
+                extracted += wad_file.stat().st_size * 4
+        return directory_size(skin_path) + extracted * 2
+    
+    def allocate(self, skin_name, estimate):
+        with self.lock:
+            in_memory = (
+                self.memory_path is not None
+                and self.memory_used + estimate <= self.memory_budget
+                and estimate <= self.free_memory() - self.memory_reserve
+            )
+            if in_memory:
+                self.memory_used += estimate
+                self.memory_peak = max(self.memory_peak, self.memory_used)
+            elif self.memory_path is not None:
+                self.fallbacks += 1
+            self.leases['memory' if in_memory else 'disk'] += 1
+        
+        if self.logger and self.memory_path is not None and not in_memory:
+            self.logger.debug(
+                f"💾 {skin_name} needs about {PipelineTracer.format_bytes(estimate)}, "
+                f"more than the free scratch memory, using disk"
+            )
+        return ScratchLease(skin_name, estimate, in_memory)
+    
+    def adopt(self, skin_name, work_path):
+        in_memory = self.contains(work_path)
+        lease = ScratchLease(skin_name, directory_size(work_path) if in_memory else 0, in_memory)
+        with self.lock:
+            if in_memory:
+                self.memory_used += lease.estimate
+                self.memory_peak = max(self.memory_peak, self.memory_used)
+            self.leases['memory' if in_memory else 'disk'] += 1
+        return lease
+    
+    def release(self, lease, used_bytes=0):
+        with self.lock:
+            if lease.in_memory:
+                self.memory_used -= lease.estimate
+            self.bytes_used['memory' if lease.in_memory else 'disk'] += used_bytes
+        
+        if self.logger and used_bytes > lease.estimate > 0:
+            self.logger.debug(
+                f"{lease.skin_name} used {PipelineTracer.format_bytes(used_bytes)} of scratch space, "
+                f"estimated {PipelineTracer.format_bytes(lease.estimate)}"
+            )
+    
+    def contains(self, path):
+        return self.memory_path is not None and self.memory_path in Path(path).parents
+    
+    def work_path(self, name):
+        self.memory_path.mkdir(parents=True, exist_ok=True)
+        return self.memory_path / name
+    
+    def describe(self):
+        if self.memory_path is None:
+            return f"scratch on disk ({self.disk_path.resolve()})"
+        return (
+            f"scratch in memory ({self.memory_path.parent}, {PipelineTracer.format_bytes(self.memory_budget)} usable), "
+            f"disk fallback ({self.disk_path.resolve()})"
+        )
+    
+    def summary(self):
+        with self.lock:
+            disk = f"{self.leases['disk']} on disk"
+            if self.bytes_used['disk']:
+                disk += f" ({PipelineTracer.format_bytes(self.bytes_used['disk'])} used)"
+            if self.memory_path is None:
+                return f"🧮 Scratch: all {disk}"
+            return (
+                f"🧮 Scratch: {self.leases['memory']} skins in memory "
+                f"(peak {PipelineTracer.format_bytes(self.memory_peak)} reserved, {PipelineTracer.format_bytes(self.bytes_used['memory'])} used), "
+                f"{disk}{f', {self.fallbacks} did not fit in memory' if self.fallbacks else ''}"
+            )
@@ -0,0 +1,106 @@
+import re
+
+class SkinSearchIndex:
+    MAX_PREFIX = 6
+    MIN_FUZZY_LENGTH = 3
+    TOKEN_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+    
+    def __init__(self):
+        self.skins = {}
+        self.tokens = {}
+        self.prefixes = {}
+        self.cache = {}
+    
+    @classmethod
+    def tokenize(cls, text):
+        return [token.lower() for token in cls.TOKEN_PATTERN.findall(text)]
+    
+    @staticmethod
+    def squash(text):
+        return re.sub(r"[^a-z0-9]", "", text.lower())
+    
+    def clear(self):
+        self.skins.clear()
+        self.tokens.clear()
+        self.prefixes.clear()
+        self.cache.clear()
+    
+    def add(self, skin_name, champion_name):
+        self.skins[skin_name] = champion_name
+        self.cache.clear()
+        
+        words = self.tokenize(skin_name) + self.tokenize(champion_name)
+        words += [self.squash(skin_name), self.squash(champion_name)]
+        for token in set(words):
+            if not token:
+                continue
+            if token not in self.tokens:
+                self.tokens[token] = set()
+                for length in range(1, min(len(token), self.MAX_PREFIX) + 1):
+                    self.prefixes.setdefault(token[:length], set()).add(token)
+            self.tokens[token].add(skin_name)
+    
+    def add_champions(self, champion_skins):
+        for champion_name, champion_data in champion_skins.items():
+            for skin_name in champion_data['skins']:
+                self.add(skin_name, champion_name)
+    
+    def search(self, text):
+        query_tokens = self.tokenize(text)
+        if not query_tokens:
+            return None
+        
+        result = None
+        for query_token in query_tokens:
+            matches = self.match_token(query_token)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+    
+    def match_token(self, query_token):
+        if query_token in self.cache:
+            return self.cache[query_token]
+        
+        candidates = self.prefixes.get(query_token[:self.MAX_PREFIX], ())
+        matched = [token for token in candidates if token.startswith(query_token)]
+        if not matched and len(query_token) >= self.MIN_FUZZY_LENGTH:
+            matched = self.fuzzy_tokens(query_token)
+        
+        skins = set()
+        for token in matched:
+            skins |= self.tokens[token]
+        self.cache[query_token] = skins
+        return skins
+    
+    def fuzzy_tokens(self, query_token):
+        limit = 1 if len(query_token) <= 5 else 2
+        candidates = self.prefixes.get(query_token[0], set()) | self.prefixes.get(query_token[1], set())
+        heads = {}
+        matched = []
+        for token in candidates:
+            head = token[:len(query_token)]
+            if head not in heads:
+                heads[head] = self.within_distance(query_token, head, limit)
+            if heads[head]:
+                matched.append(token)
+        return matched
+    
+    @staticmethod
+    def within_distance(a, b, limit):
+        if abs(len(a) - len(b)) > limit:
+            return False
+        
+        before_previous = None
+        previous = list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            current = [i] + [0] * len(b)
+            for j in range(1, len(b) + 1):
+                cost = a[i - 1] != b[j - 1]
+                current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+                if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                    current[j] = min(current[j], before_previous[j - 2] + 1)
+            if min(current) > limit:
+                return False
+            before_previous, previous = previous, current
+        return previous[-1] <= limit
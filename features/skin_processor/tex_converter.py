@@ -0,0 +1,138 @@
+import mmap
+import os
+import struct
+from pathlib import Path
+
+class TexConversionError(Exception):
+    pass
+
+class DdsToTexConverter:
+    VERSION = 1
+    DDS_MAGIC = b"DDS "
+    DDS_HEADER = struct.Struct("<4s7I44s2I4s5I5I")
+    DX10_HEADER = struct.Struct("<IIIII")
+    TEX_HEADER = struct.Struct("<4sHHBBBB")
+    TEX_MAGIC = b"TEX\x00"
+    
+    DDSD_MIPMAPCOUNT = 0x20000
+    DDSD_DEPTH = 0x800000
+    DDPF_ALPHAPIXELS = 0x1
+    DDPF_FOURCC = 0x4
+    DDPF_RGB = 0x40
+    DDSCAPS2_CUBEMAP = 0x200
+    DDSCAPS2_VOLUME = 0x200000
+    
+    TEX_BC1 = 10
+    TEX_BC3 = 12
+    TEX_BGRA8 = 20
+    TEX_HAS_MIPMAPS = 0x1
+    
+    FOURCC_FORMATS = {
+        b"DXT1": TEX_BC1,
+        b"DXT5": TEX_BC3,
+    }
+    DXGI_FORMATS = {
+        71: TEX_BC1,
+        72: TEX_BC1,
+        77: TEX_BC3,
+        78: TEX_BC3,
+        87: TEX_BGRA8,
+        91: TEX_BGRA8,
+    }
+    BLOCK_SIZES = {TEX_BC1: 8, TEX_BC3: 16}
+    
+    @classmethod
+    def parse_header(cls, data, name="texture"):
+        if len(data) < cls.DDS_HEADER.size or bytes(data[:4]) != cls.DDS_MAGIC:
+            raise TexConversionError(f"{name} is not a DDS file")
+        
+        (_magic, header_size, flags, height, width, _pitch, depth, mip_count, _reserved,
+         pf_size, pf_flags, fourcc, bit_count, r_mask, g_mask, b_mask, a_mask,
+         _caps, caps2, _caps3, _caps4) = cls.DDS_HEADER.unpack_from(data, 0)[:21]
+        
+        if header_size != 124 or pf_size != 32:
+            raise TexConversionError(f"{name}: malformed DDS header")
+        if (flags & cls.DDSD_DEPTH and depth > 1) or caps2 & (cls.DDSCAPS2_CUBEMAP | cls.DDSCAPS2_VOLUME):
+            raise TexConversionError(f"{name}: cube maps and volume textures are not supported")
+        if not 0 < width <= 0xFFFF or not 0 < height <= 0xFFFF:
+            raise TexConversionError(f"{name}: unsupported dimensions {width}x{height}")
+        
+        offset = cls.DDS_HEADER.size
+        if pf_flags & cls.DDPF_FOURCC and fourcc == b"DX10":
+            if len(data) < offset + cls.DX10_HEADER.size:
+                raise TexConversionError(f"{name}: truncated DX10 header")
+            dxgi_format, dimension, misc_flags, array_size, _ = cls.DX10_HEADER.unpack_from(data, offset)
+            offset += cls.DX10_HEADER.size
+            if dimension != 3 or misc_flags & 0x4 or array_size > 1:
+                raise TexConversionError(f"{name}: only single 2D DX10 textures are supported")
+            tex_format = cls.DXGI_FORMATS.get(dxgi_format)
+            if tex_format is None:
+                raise TexConversionError(f"{name}: unsupported DXGI format {dxgi_format}")
+        elif pf_flags & cls.DDPF_FOURCC:
+            tex_format = cls.FOURCC_FORMATS.get(fourcc)
+            if tex_format is None:
+                raise TexConversionError(f"{name}: unsupported compression {fourcc!r}")
+        elif (pf_flags & cls.DDPF_RGB and pf_flags & cls.DDPF_ALPHAPIXELS and bit_count == 32
+              and (r_mask, g_mask, b_mask, a_mask) == (0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000)):
+            tex_format = cls.TEX_BGRA8
+        else:
+            raise TexConversionError(f"{name}: unsupported uncompressed pixel layout")
+        
+        mip_count = mip_count if flags & cls.DDSD_MIPMAPCOUNT and mip_count > 1 else 1
+        if mip_count > 1 and mip_count != max(width, height).bit_length():
+            raise TexConversionError(f"{name}: partial mip chain ({mip_count} levels) is not supported")
+        
+        return width, height, tex_format, mip_count, offset
+    
+    @classmethod
+    def mip_size(cls, tex_format, width, height):
+        block_size = cls.BLOCK_SIZES.get(tex_format)
+        if block_size:
+            return max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * block_size
+        return width * height * 4
+    
+    @classmethod
+    def mip_levels(cls, width, height, tex_format, mip_count, offset):
+        levels = []
+        for level in range(mip_count):
+            size = cls.mip_size(tex_format, max(1, width >> level), max(1, height >> level))
+            levels.append((offset, size))
+            offset += size
+        return levels, offset
+    
+    @classmethod
+    def convert(cls, dds_file, tex_file=None):
+        dds_file = Path(dds_file)
+        tex_file = Path(tex_file) if tex_file else dds_file.with_suffix(".tex")
+        temp_file = tex_file.with_name(tex_file.name + ".tmp")
+        
+        with open(dds_file, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise TexConversionError(f"{dds_file.name} is empty")
+        
+        try:
+            view = memoryview(data)
+            try:
+                width, height, tex_format, mip_count, offset = cls.parse_header(view, dds_file.name)
+                levels, end = cls.mip_levels(width, height, tex_format, mip_count, offset)
+                if end > len(view):
+                    raise TexConversionError(f"{dds_file.name}: truncated pixel data ({len(view)} of {end} bytes)")
+                
+                flags = cls.TEX_HAS_MIPMAPS if mip_count > 1 else 0
+                with open(temp_file, 'wb') as out:
+                    out.write(cls.TEX_HEADER.pack(cls.TEX_MAGIC, width, height, 1, tex_format, 0, flags))
+                    for level_offset, size in reversed(levels):
+                        out.write(view[level_offset:level_offset + size])
+                os.replace(temp_file, tex_file)
+            finally:
+                view.release()
+        except Exception:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+        finally:
+            data.close()
+        
+        return tex_file
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+class TextureCache:
+    HASH_CHUNK_SIZE = 1024 * 1024
+    EVICTION_TARGET = 0.9
+    
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total_bytes = None
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+    
+    def key_for(self, source_file, converter):
+        digest = hashlib.sha256()
+        with open(source_file, 'rb') as f:
+            while True:
+                chunk = f.read(self.HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+        digest.update(f";converter={converter}".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.tex"
+    
+    def fetch(self, key, target_file):
+        entry = self.entry_path(key)
+        try:
+            if not entry.exists():
+                raise FileNotFoundError(entry)
+            if target_file.exists():
+                target_file.unlink()
+            self.place(entry, target_file)
+            os.utime(entry)
+        except FileNotFoundError:
+            with self.lock:
+                self.misses += 1
+            return False
+        
+        with self.lock:
+            self.hits += 1
+        return True
+    
+    @staticmethod
+    def place(entry, target_file):
+        try:
+            os.link(entry, target_file)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(entry, target_file)
+    
+    def store(self, key, produced_file):
+        entry = self.entry_path(key)
+        if entry.exists():
+            return
+        
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        temp_entry = entry.with_name(f"{entry.name}.{threading.get_ident()}.tmp")
+        shutil.copyfile(produced_file, temp_entry)
+        os.replace(temp_entry, entry)
+        
+        with self.lock:
+            self.stores += 1
+            if self.total_bytes is None:
+                self.total_bytes = self.scan_size()
+            else:
+                self.total_bytes += entry.stat().st_size
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+    
+    def entries(self):
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob("*/*.tex"))
+    
+    def scan_size(self):
+        return sum(path.stat().st_size for path in self.entries())
+    
+    def evict(self):
+        entries = []
+        for path in self.entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * self.EVICTION_TARGET
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self.total_bytes = total
+    
+    def summary(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            rate = (self.hits / lookups * 100) if lookups else 0
+            return (f"🗃 Texture cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate), "
+                    f"{self.stores} stored, {self.evictions} evicted")
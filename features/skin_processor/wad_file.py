@@ -0,0 +1,482 @@
+import gzip
+import hashlib
+import io
+import mmap
+import os
+import struct
+import threading
+import zlib
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+class WadError(Exception):
+    pass
+
+XXH_PRIME64_1 = 0x9E3779B185EBCA87
+XXH_PRIME64_2 = 0xC2B2AE3D27D4EB4F
+XXH_PRIME64_3 = 0x165667B19E3779F9
+XXH_PRIME64_4 = 0x85EBCA77C2B2AE63
+XXH_PRIME64_5 = 0x27D4EB2F165667C5
+XXH_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+def _xxh64_rotl(value, bits):
+    return ((value << bits) | (value >> (64 - bits))) & XXH_MASK64
+
+def _xxh64_round(acc, lane):
+    acc = (acc + lane * XXH_PRIME64_2) & XXH_MASK64
+    return (_xxh64_rotl(acc, 31) * XXH_PRIME64_1) & XXH_MASK64
+
+def xxh64(data, seed=0):
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data, seed)
+    
+    length = len(data)
+    pos = 0
+    if length >= 32:
+        lanes = [
+            (seed + XXH_PRIME64_1 + XXH_PRIME64_2) & XXH_MASK64,
+            (seed + XXH_PRIME64_2) & XXH_MASK64,
+            seed,
+            (seed - XXH_PRIME64_1) & XXH_MASK64
+        ]
+        while pos + 32 <= length:
+            for i, lane in enumerate(struct.unpack_from("<4Q", data, pos)):
+                lanes[i] = _xxh64_round(lanes[i], lane)
+            pos += 32
+        h = (_xxh64_rotl(lanes[0], 1) + _xxh64_rotl(lanes[1], 7) +
+             _xxh64_rotl(lanes[2], 12) + _xxh64_rotl(lanes[3], 18)) & XXH_MASK64
+        for lane in lanes:
+            h ^= _xxh64_round(0, lane)
+            h = (h * XXH_PRIME64_1 + XXH_PRIME64_4) & XXH_MASK64
+    else:
+        h = (seed + XXH_PRIME64_5) & XXH_MASK64
+    
+    h = (h + length) & XXH_MASK64
+    while pos + 8 <= length:
+        h ^= _xxh64_round(0, struct.unpack_from("<Q", data, pos)[0])
+        h = (_xxh64_rotl(h, 27) * XXH_PRIME64_1 + XXH_PRIME64_4) & XXH_MASK64
+        pos += 8
+    if pos + 4 <= length:
+        h ^= (struct.unpack_from("<I", data, pos)[0] * XXH_PRIME64_1) & XXH_MASK64
+        h = (_xxh64_rotl(h, 23) * XXH_PRIME64_2 + XXH_PRIME64_3) & XXH_MASK64
+        pos += 4
+    while pos < length:
+        h ^= (data[pos] * XXH_PRIME64_5) & XXH_MASK64
+        h = (_xxh64_rotl(h, 11) * XXH_PRIME64_1) & XXH_MASK64
+        pos += 1
+    
+    h ^= h >> 33
+    h = (h * XXH_PRIME64_2) & XXH_MASK64
+    h ^= h >> 29
+    h = (h * XXH_PRIME64_3) & XXH_MASK64
+    h ^= h >> 32
+    return h
+
+def path_hash(path):
+    if isinstance(path, int):
+        return path
+    return xxh64(str(path).replace("\\", "/").lower().encode('utf-8'))
+
+class WadEntry:
+    TYPE_RAW = 0
+    TYPE_GZIP = 1
+    TYPE_LINK = 2
+    TYPE_ZSTD = 3
+    TYPE_ZSTD_MULTI = 4
+    
+    __slots__ = (
+        'path_hash', 'offset', 'compressed_size', 'size', 'type',
+        'subchunk_count', 'is_duplicate', 'subchunk_index', 'checksum'
+    )
+    
+    def __init__(self, path_hash, offset, compressed_size, size, entry_type,
+                 subchunk_count=0, is_duplicate=False, subchunk_index=0, checksum=0):
+        self.path_hash = path_hash
+        self.offset = offset
+        self.compressed_size = compressed_size
+        self.size = size
+        self.type = entry_type
+        self.subchunk_count = subchunk_count
+        self.is_duplicate = is_duplicate
+        self.subchunk_index = subchunk_index
+        self.checksum = checksum
+    
+    @property
+    def hex_name(self):
+        return f"{self.path_hash:016x}"
+    
+    def __repr__(self):
+        return f"WadEntry({self.hex_name}, type={self.type}, size={self.size})"
+
+class WadReader:
+    HEADER = struct.Struct("<2sBB256sQI")
+    ENTRY = struct.Struct("<QIIIBBHQ")
+    ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+    
+    EXTENSIONS = (
+        (b"DDS ", "dds"),
+        (b"TEX\x00", "tex"),
+        (b"PROP", "bin"),
+        (b"PTCH", "bin"),
+        (b"r3d2Mesh", "scb"),
+        (b"r3d2anmd", "anm"),
+        (b"r3d2canm", "anm"),
+        (b"r3d2sklt", "skl"),
+        (b"\x33\x22\x11\x00", "skn"),
+        (b"OggS", "ogg"),
+        (b"BKHD", "bnk"),
+        (b"OEGM", "mapgeo"),
+        (b"WGEO", "wgeo"),
+        (b"NVR\x00", "nvr"),
+        (b"PreLoad", "preload"),
+        (b"[ObjectBegin]", "sco"),
+        (b"\x1bLua", "luabin"),
+        (b"RST", "stringtable"),
+        (b"\x89PNG", "png"),
+        (b"\xff\xd8\xff", "jpg"),
+    )
+    
+    @classmethod
+    def read_version(cls, path):
+        with open(path, 'rb') as f:
+            head = f.read(4)
+        if len(head) < 4 or head[:2] != b"RW":
+            raise WadError(f"{Path(path).name} is not a WAD file")
+        return head[2], head[3]
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.file = open(self.path, 'rb')
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise WadError(f"{self.path.name} is empty")
+        
+        try:
+            self.entries = self.parse_toc()
+        except Exception:
+            self.close()
+            raise
+        self.entries_by_hash = {entry.path_hash: entry for entry in self.entries}
+    
+    def parse_toc(self):
+        if len(self.data) < self.HEADER.size:
+            raise WadError(f"{self.path.name} is too small to be a WAD file")
+        
+        magic, major, minor, _signature, checksum, entry_count = self.HEADER.unpack_from(self.data, 0)
+        if magic != b"RW":
+            raise WadError(f"{self.path.name} is not a WAD file")
+        if major != 3:
+            raise WadError(f"{self.path.name}: unsupported WAD version {major}.{minor}")
+        
+        self.version = (major, minor)
+        self.checksum = checksum
+        
+        toc_end = self.HEADER.size + entry_count * self.ENTRY.size
+        if toc_end > len(self.data):
+            raise WadError(f"{self.path.name}: truncated table of contents")
+        
+        entries = []
+        for path_hash, offset, compressed_size, size, type_byte, duplicate, subchunk_index, entry_checksum in \
+                self.ENTRY.iter_unpack(self.data[self.HEADER.size:toc_end]):
+            if offset + compressed_size > len(self.data):
+                raise WadError(f"{self.path.name}: entry {path_hash:016x} points outside the file")
+            entries.append(WadEntry(
+                path_hash, offset, compressed_size, size,
+                type_byte & 0x0F, type_byte >> 4, bool(duplicate), subchunk_index, entry_checksum
+            ))
+        return entries
+    
+    def close(self):
+        try:
+            self.data.close()
+        except BufferError:
+            pass
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __iter__(self):
+        return iter(self.entries)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, path_hash):
+        return self.entries_by_hash.get(path_hash)
+    
+    def read_raw(self, entry):
+        return memoryview(self.data)[entry.offset:entry.offset + entry.compressed_size]
+    
+    def read(self, entry):
+        raw = self.read_raw(entry)
+        try:
+            if entry.type == WadEntry.TYPE_RAW:
+                return bytes(raw)
+            if entry.type == WadEntry.TYPE_GZIP:
+                return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+            if entry.type == WadEntry.TYPE_ZSTD:
+                return self.decompress_zstd(raw, entry)
+            if entry.type == WadEntry.TYPE_ZSTD_MULTI:
+                return self.decompress_zstd_multi(raw, entry)
+            if entry.type == WadEntry.TYPE_LINK:
+                raise WadError(f"Entry {entry.hex_name} is a link entry and has no data")
+            raise WadError(f"Entry {entry.hex_name} has unknown type {entry.type}")
+        finally:
+            raw.release()
+    
+    def decompress_zstd(self, raw, entry):
+        if zstandard is None:
+            raise WadError("zstd-compressed entries require the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompress(raw, max_output_size=entry.size)
+    
+    def decompress_zstd_multi(self, raw, entry):
+        if zstandard is None:
+            raise WadError("zstd-compressed entries require the 'zstandard' package")
+        
+        frame_start = bytes(raw[:min(len(raw), 64 * 1024)]).find(self.ZSTD_MAGIC)
+        if frame_start < 0:
+            return bytes(raw)
+        
+        output = bytearray(raw[:frame_start])
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(raw[frame_start:]), read_across_frames=True)
+        with reader:
+            while len(output) < entry.size:
+                chunk = reader.read(entry.size - len(output))
+                if not chunk:
+                    break
+                output += chunk
+        
+        if len(output) != entry.size:
+            raise WadError(f"Entry {entry.hex_name}: multi-chunk data decompressed to {len(output)} bytes, expected {entry.size}")
+        return bytes(output)
+    
+    @classmethod
+    def guess_extension(cls, data):
+        head = bytes(data[:16])
+        for magic, extension in cls.EXTENSIONS:
+            if head.startswith(magic):
+                return extension
+        if head[4:12] == b"r3d2sklt":
+            return "skl"
+        return "dat"
+    
+    def entry_path(self, entry, data, names=None):
+        name = names.get(entry.path_hash) if names else None
+        if name:
+            return Path(*name.replace("\\", "/").split("/"))
+        return Path(f"{entry.hex_name}.{self.guess_extension(data)}")
+    
+    def extract(self, output_dir, entries=None, names=None):
+        output_dir = Path(output_dir)
+        output_root = output_dir.resolve()
+        written = []
+        
+        for entry in self.entries if entries is None else entries:
+            if entry.type == WadEntry.TYPE_LINK:
+                continue
+            
+            data = self.read(entry)
+            target = output_dir / self.entry_path(entry, data, names)
+            if output_root not in target.resolve().parents:
+                raise WadError(f"Entry {entry.hex_name} resolves outside of {output_dir}")
+            
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.unlink(missing_ok=True)
+            target.write_bytes(data)
+            written.append(target)
+        
+        return written
+
+class HashTable:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.names = {}
+        self.hashes = array('Q')
+        self.offsets = array('Q')
+        self.signature = None
+        self.lock = threading.Lock()
+    
+    def exists(self):
+        return self.path.exists()
+    
+    def load(self):
+        stat = self.path.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if signature == self.signature:
+            return
+        
+        hashes = array('Q')
+        offsets = array('Q')
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    hashes.append(int(line[:16], 16))
+                    offsets.append(offset)
+                except ValueError:
+                    pass
+                offset += len(line)
+        
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self.hashes = array('Q', (hashes[i] for i in order))
+        self.offsets = array('Q', (offsets[i] for i in order))
+        self.names = {}
+        self.signature = signature
+    
+    def resolve(self, hashes):
+        with self.lock:
+            if not self.path.exists():
+                return {}
+            self.load()
+            
+            wanted = sorted({h for h in hashes if h not in self.names})
+            if wanted:
+                with open(self.path, 'rb') as f:
+                    for path_hash in wanted:
+                        index = bisect_left(self.hashes, path_hash)
+                        if index < len(self.hashes) and self.hashes[index] == path_hash:
+                            f.seek(self.offsets[index])
+                            self.names[path_hash] = f.readline()[17:].decode('utf-8', 'replace').strip()
+                        else:
+                            self.names[path_hash] = None
+            return {h: self.names[h] for h in hashes if self.names.get(h)}
+
+class WadWriter:
+    def __init__(self, source=None, version=None):
+        self.source = source
+        if version is None:
+            version = source.version if source is not None else (3, 1)
+        if not self.supports(version):
+            raise WadError(f"Writing WAD {version[0]}.{version[1]} checksums requires the 'xxhash' package")
+        self.version = version
+        self.replacements = {}
+        self.removed = set()
+    
+    @staticmethod
+    def supports(version):
+        return version[1] == 0 or xxhash is not None
+    
+    def replace(self, path, data):
+        entry_hash = path_hash(path)
+        self.removed.discard(entry_hash)
+        self.replacements[entry_hash] = data
+    
+    def remove(self, path):
+        entry_hash = path_hash(path)
+        self.replacements.pop(entry_hash, None)
+        self.removed.add(entry_hash)
+    
+    def checksum(self, data):
+        if self.version[1] == 0:
+            return struct.unpack("<Q", hashlib.sha256(data).digest()[:8])[0]
+        return xxhash.xxh3_64_intdigest(data)
+    
+    def encode(self, data):
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=3).compress(data), WadEntry.TYPE_ZSTD
+        return gzip.compress(data, compresslevel=6, mtime=0), WadEntry.TYPE_GZIP
+    
+    def plan(self):
+        toc = {}
+        if self.source is not None:
+            for entry in self.source:
+                if entry.path_hash not in self.removed and entry.path_hash not in self.replacements:
+                    toc[entry.path_hash] = entry
+        
+        encoded = {}
+        for entry_hash, data in self.replacements.items():
+            if isinstance(data, (str, Path)):
+                data = Path(data).read_bytes()
+            payload, entry_type = self.encode(data)
+            encoded[entry_hash] = payload
+            toc[entry_hash] = WadEntry(entry_hash, 0, len(payload), len(data), entry_type, checksum=self.checksum(payload))
+        return toc, encoded
+    
+    def write(self, output_path):
+        output_path = Path(output_path)
+        toc, encoded = self.plan()
+        hashes = sorted(toc)
+        
+        stats = {'copied': 0, 'encoded': len(encoded), 'bytes_copied': 0, 'bytes_encoded': 0}
+        data_offset = WadReader.HEADER.size + len(hashes) * WadReader.ENTRY.size
+        placed = {}
+        chunks = []
+        entries = []
+        
+        for entry_hash in hashes:
+            entry = toc[entry_hash]
+            if entry_hash in encoded:
+                payload = encoded[entry_hash]
+                key = ('encoded', entry.checksum, len(payload))
+            else:
+                payload = None
+                key = ('source', entry.offset, entry.compressed_size)
+            
+            is_duplicate = key in placed
+            if not is_duplicate:
+                placed[key] = data_offset
+                chunks.append((entry, payload))
+                data_offset += entry.compressed_size
+            entries.append((entry, placed[key], is_duplicate))
+        
+        with open(output_path, 'wb') as f:
+            f.write(WadReader.HEADER.pack(b"RW", self.version[0], self.version[1], b"\x00" * 256, 0, len(entries)))
+            for entry, offset, is_duplicate in entries:
+                f.write(WadReader.ENTRY.pack(
+                    entry.path_hash, offset, entry.compressed_size, entry.size,
+                    entry.type | (entry.subchunk_count << 4), int(is_duplicate),
+                    entry.subchunk_index, entry.checksum
+                ))
+            
+            for entry, payload in chunks:
+                if payload is None:
+                    raw = self.source.read_raw(entry)
+                    try:
+                        f.write(raw)
+                    finally:
+                        raw.release()
+                    stats['copied'] += 1
+                    stats['bytes_copied'] += entry.compressed_size
+                else:
+                    f.write(payload)
+                    stats['bytes_encoded'] += len(payload)
+        
+        return stats
+
+def build_wad(source_path, replacements, output_path=None, removed=()):
+    source_path = Path(source_path)
+    output_path = Path(output_path or source_path)
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    
+    try:
+        with WadReader(source_path) as reader:
+            writer = WadWriter(reader)
+            for path, data in replacements.items():
+                writer.replace(path, data)
+            for path in removed:
+                writer.remove(path)
+            stats = writer.write(temp_path)
+        os.replace(temp_path, output_path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+    
+    return stats
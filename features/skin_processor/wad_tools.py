@@ -1,166 +1,386 @@
+import hashlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from .wad_file import WadReader, WadWriter, WadError, HashTable, build_wad
+from .tex_converter import DdsToTexConverter, TexConversionError
+from utils.file_utils import FileManager
+from utils.profiling import PipelineTracer
 
 class WadTools:
-    def __init__(self, tools_path, logger):
+    CONVERSION_STATUSES = ("success", "native", "failed", "timeout", "error")
+    PIPELINE_VERSION = 1
+    TOOL_NAMES = ("wad-extract.exe", "tex2dds.exe", "wad-make.exe")
+    
+    def __init__(self, tools_path, logger, conversion_workers=1, texture_cache=None, tracer=None):
         self.tools_path = Path(tools_path)
         self.logger = logger
+        self.conversion_workers = max(1, conversion_workers)
+        self.texture_cache = texture_cache
+        self.tracer = tracer or PipelineTracer(enabled=False)
+        self.native_wad = True
+        self.native_tex = True
+        self.checksum_warning_logged = False
+        self.hashtable = HashTable(self.tools_path / "hashes.game.txt")
+        self.converter_fingerprint = self.file_fingerprint(self.tools_path / "tex2dds.exe")
+    
+    @staticmethod
+    def file_fingerprint(path):
+        if not path.exists():
+            return "missing"
+        stat = path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def tool_fingerprint(self):
+        digest = hashlib.sha256((
+            f"pipeline={self.PIPELINE_VERSION};native={self.native_wad};"
+            f"native_tex={DdsToTexConverter.VERSION if self.native_tex else 0}"
+        ).encode('utf-8'))
+        for tool_name in self.TOOL_NAMES:
+            digest.update(f";{tool_name}={self.file_fingerprint(self.tools_path / tool_name)}".encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    @staticmethod
+    def extracted_dir_for(wad_file):
+        return wad_file.with_name(wad_file.name[:-len(".client")])
+    
+    @staticmethod
+    def is_extracted_path(path):
+        return any(parent.suffix == ".wad" and parent.parent.name == "WAD" for parent in path.parents)
+    
+    def extract_wad_native(self, wad_file):
+        output_dir = self.extracted_dir_for(wad_file)
+        try:
+            with WadReader(wad_file) as reader:
+                names = self.hashtable.resolve([entry.path_hash for entry in reader]) if self.hashtable.exists() else {}
+                written = reader.extract(output_dir, names=names)
+        except (WadError, OSError) as e:
+            self.logger.warning(f"In-process extraction of {wad_file.name} not possible ({e}), falling back to wad-extract.exe")
+            return False
+        
+        self.logger.info(f"Extraction of {wad_file.name} successful ({len(written)} files, {len(names)} named, in-process)")
+        return True
     
     def extract_wads(self, wad_dir):
         wad_extract_exe = self.tools_path / "wad-extract.exe"
         
-        self.logger.log(f"wad-extract.exe path: {wad_extract_exe}")
-        self.logger.log(f"Exists: {wad_extract_exe.exists()}")
+        self.logger.debug(lambda: f"wad-extract.exe path: {wad_extract_exe} (exists: {wad_extract_exe.exists()})")
         
         wad_files = list(wad_dir.glob("*.wad.client"))
-        self.logger.log(f"WAD files found: {[f.name for f in wad_files]}")
+        self.logger.debug(lambda: f"WAD files found: {[f.name for f in wad_files]}")
         
         if not wad_files:
-            self.logger.log("No .wad.client files found!")
+            self.logger.warning("No .wad.client files found!")
             return
+        
+        with self.tracer.span("extract") as span:
+            for wad_file in wad_files:
+                span.add_bytes(wad_file.stat().st_size)
+                self.extract_wad(wad_file)
+    
+    def extract_wad(self, wad_file):
+        self.logger.info(f"Extracting {wad_file.name}...")
+        self.logger.debug(lambda: f"File size: {wad_file.stat().st_size} bytes")
+        
+        if self.native_wad and self.extract_wad_native(wad_file):
+            return
+        
+        wad_extract_abs = Path.cwd() / self.tools_path / "wad-extract.exe"
+        wad_file_abs = Path.cwd() / wad_file
+        
+        cmd = [str(wad_extract_abs), str(wad_file_abs)]
+        self.logger.debug(lambda: f"Command: {' '.join(cmd)}")
+        self.logger.debug(lambda: f"Working directory: {Path.cwd()}")
+        
+        try:
+            self.tracer.count_subprocess()
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(Path.cwd()), timeout=120)
             
-        for wad_file in wad_files:
-            self.logger.log(f"Extracting {wad_file.name}...")
-            self.logger.log(f"File size: {wad_file.stat().st_size} bytes")
-            
-            wad_extract_abs = Path.cwd() / self.tools_path / "wad-extract.exe"
-            wad_file_abs = Path.cwd() / wad_file
-            
-            cmd = [str(wad_extract_abs), str(wad_file_abs)]
-            self.logger.log(f"Command: {' '.join(cmd)}")
-            self.logger.log(f"Working directory: {Path.cwd()}")
+            self.logger.debug(lambda: f"Return code: {result.returncode}")
+            if result.stdout:
+                self.logger.debug(lambda: f"Output: {result.stdout[:500]}...")
+            if result.stderr:
+                self.logger.warning(f"Error: {result.stderr}")
             
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(Path.cwd()), timeout=120)
-                
-                self.logger.log(f"Return code: {result.returncode}")
-                if result.stdout:
-                    self.logger.log(f"Output: {result.stdout[:500]}...")
-                if result.stderr:
-                    self.logger.log(f"Error: {result.stderr}")
-                    
-                if result.returncode != 0:
-                    raise Exception(f"Error extracting {wad_file.name}: Code {result.returncode}, {result.stderr}")
-                else:
-                    self.logger.log(f"Extraction of {wad_file.name} successful")
-                    
-            except subprocess.TimeoutExpired:
-                self.logger.log(f"Timeout extracting {wad_file.name} (more than 2 minutes)")
-                raise Exception(f"Timeout extracting {wad_file.name}")
+            if result.returncode != 0:
+                raise Exception(f"Error extracting {wad_file.name}: Code {result.returncode}, {result.stderr}")
+            else:
+                self.logger.info(f"Extraction of {wad_file.name} successful")
+        
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"Timeout extracting {wad_file.name} (more than 2 minutes)")
+            raise Exception(f"Timeout extracting {wad_file.name}")
     
-    def convert_dds_files(self, wad_dir):
+    def convert_dds_files(self, wad_dir, max_workers=None, track_unchanged=True):
         tex2dds_exe = self.tools_path / "tex2dds.exe"
         
-        self.logger.log(f"tex2dds.exe path: {tex2dds_exe}")
-        self.logger.log(f"Exists: {tex2dds_exe.exists()}")
+        self.logger.debug(lambda: f"tex2dds.exe path: {tex2dds_exe} (exists: {tex2dds_exe.exists()})")
         
         extracted_dirs = [d for d in wad_dir.iterdir() if d.is_dir()]
-        self.logger.log(f"Extracted directories found: {[d.name for d in extracted_dirs]}")
+        self.logger.debug(lambda: f"Extracted directories found: {[d.name for d in extracted_dirs]}")
         
+        conversions = []
         for extracted_dir in extracted_dirs:
-            self.logger.log(f"=== Analyzing directory {extracted_dir.name} ===")
-            
-            all_files = list(extracted_dir.rglob("*"))
-            self.logger.log(f"All files in {extracted_dir.name}: {len(all_files)}")
-            
-            file_extensions = {}
-            for f in all_files:
-                if f.is_file():
-                    ext = f.suffix.lower()
-                    file_extensions[ext] = file_extensions.get(ext, 0) + 1
-            
-            self.logger.log(f"Extensions found: {dict(file_extensions)}")
+            self.logger.debug(lambda: self.describe_extracted_dir(extracted_dir))
             
             dds_files = list(extracted_dir.rglob("*.dds"))
-            self.logger.log(f".dds files in {extracted_dir.name}: {len(dds_files)}")
-            
             if dds_files:
-                self.logger.log(f"List of .dds files: {[f.name for f in dds_files[:5]]}{'...' if len(dds_files) > 5 else ''}")
+                self.logger.debug(lambda: (
+                    f".dds files in {extracted_dir.name}: {len(dds_files)} "
+                    f"{[f.name for f in dds_files[:5]]}{'...' if len(dds_files) > 5 else ''}"
+                ))
+            else:
+                self.logger.debug(lambda: f"No .dds files found in {extracted_dir.name}, moving to next step")
             
             for i, dds_file in enumerate(dds_files):
-                self.logger.log(f"=== Conversion {i+1}/{len(dds_files)}: {dds_file.name} ===")
-                self.logger.log(f"Full path: {dds_file.relative_to(wad_dir)}")
-                self.logger.log(f"Size: {dds_file.stat().st_size} bytes")
-                
-                tex2dds_abs = Path.cwd() / self.tools_path / "tex2dds.exe"
-                
-                cmd = [str(tex2dds_abs), dds_file.name]
-                self.logger.log(f"Command: {' '.join(cmd)}")
-                self.logger.log(f"Working directory: {dds_file.parent}")
-                self.logger.log(f"File exists: {dds_file.exists()}")
-                
-                tex_file = dds_file.with_suffix('.tex')
-                self.logger.log(f"Corresponding .tex file: {tex_file.name} (exists: {tex_file.exists()})")
-                
+                conversions.append((dds_file, wad_dir, f"{i+1}/{len(dds_files)}"))
+        
+        results = {status: 0 for status in self.CONVERSION_STATUSES}
+        results['outputs'] = {}
+        if not conversions:
+            return results
+        
+        previous_outputs = {}
+        for dds_file, _, _ in conversions if track_unchanged else []:
+            tex_file = dds_file.with_suffix('.tex')
+            if tex_file.exists():
+                previous_outputs[tex_file] = self.file_digest(tex_file)
+        
+        max_workers = max(1, min(max_workers or self.conversion_workers, len(conversions)))
+        self.logger.info(f"Converting {len(conversions)} .dds files with {max_workers} concurrent conversion{'s' if max_workers != 1 else ''}")
+        
+        with self.tracer.span("convert", files=len(conversions), workers=max_workers) as span:
+            span.add_bytes(sum(dds_file.stat().st_size for dds_file, _, _ in conversions))
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tex2dds") as executor:
+                    statuses = list(executor.map(lambda args: self.tracer.within(span, self.convert_dds_file, *args), conversions))
+            else:
+                statuses = [self.convert_dds_file(*args) for args in conversions]
+        
+        for (dds_file, _, _), status in zip(conversions, statuses):
+            results[status] += 1
+            tex_file = dds_file.with_suffix('.tex')
+            if status in ("success", "native") and tex_file.exists():
+                if tex_file in previous_outputs and previous_outputs[tex_file] == self.file_digest(tex_file):
+                    continue
+                extracted_dir = next(d for d in extracted_dirs if d in dds_file.parents)
+                results['outputs'].setdefault(extracted_dir, []).append(tex_file)
+        
+        self.logger.info(
+            f"Conversion summary: {results['success'] + results['native']} succeeded ({results['native']} in-process), {results['failed']} failed, "
+            f"{results['timeout']} timed out, {results['error']} errors"
+        )
+        self.logger.debug(lambda: f"Modified directories: {[d.name for d in results['outputs']]}")
+        if self.texture_cache:
+            self.logger.debug(self.texture_cache.summary)
+        return results
+    
+    def describe_extracted_dir(self, extracted_dir):
+        file_extensions = {}
+        file_count = 0
+        for f in extracted_dir.rglob("*"):
+            if f.is_file():
+                file_count += 1
+                ext = f.suffix.lower()
+                file_extensions[ext] = file_extensions.get(ext, 0) + 1
+        return f"=== Analyzing directory {extracted_dir.name} ===\nFiles: {file_count}, extensions found: {file_extensions}"
+    
+    def convert_dds_file(self, dds_file, wad_dir, position):
+        tex2dds_abs = Path.cwd() / self.tools_path / "tex2dds.exe"
+        cmd = [str(tex2dds_abs), dds_file.name]
+        tex_file = dds_file.with_suffix('.tex')
+        
+        self.logger.debug(lambda: "\n".join([
+            f"=== Conversion {position}: {dds_file.name} ===",
+            f"Full path: {dds_file.relative_to(wad_dir)}",
+            f"Size: {dds_file.stat().st_size} bytes",
+            f"Command: {' '.join(cmd)}",
+            f"Working directory: {dds_file.parent}",
+            f"Corresponding .tex file: {tex_file.name} (exists: {tex_file.exists()})"
+        ]))
+        
+        if self.native_tex:
+            try:
+                DdsToTexConverter.convert(dds_file, tex_file)
+                self.logger.debug(lambda: f"SUCCESS: {tex_file.name} converted in-process ({tex_file.stat().st_size} bytes)")
+                return "native"
+            except TexConversionError as e:
+                self.logger.debug(lambda: f"In-process conversion not possible ({e}), falling back to tex2dds.exe")
+            except OSError as e:
+                self.logger.warning(f"In-process conversion of {dds_file.name} failed ({e}), falling back to tex2dds.exe")
+        
+        cache_key = None
+        if self.texture_cache:
+            cache_key = self.texture_cache.key_for(dds_file, self.converter_fingerprint)
+            if self.texture_cache.fetch(cache_key, tex_file):
+                self.logger.debug(lambda: f"CACHE HIT: {tex_file.name} reused from texture cache ({tex_file.stat().st_size} bytes)")
+                return "success"
+        
+        try:
+            FileManager.make_private(tex_file)
+            with self.tracer.span("tex2dds", category="tool", file=dds_file.name):
+                self.tracer.count_subprocess()
+                result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(dds_file.parent), timeout=60)
+        except subprocess.TimeoutExpired:
+            self.logger.error(
+                f"TIMEOUT: Conversion {position} of {dds_file.name} (more than 60 seconds)\n"
+                "This may indicate a problem with the tool or file"
+            )
+            return "timeout"
+        except Exception as e:
+            self.logger.error(f"EXCEPTION: Conversion {position} of {dds_file.name}: {str(e)}")
+            return "error"
+        
+        if result.returncode != 0:
+            lines = [f"ERROR: Conversion {position} failed for {dds_file.name} - Code: {result.returncode}"]
+            if result.stdout:
+                lines.append(f"Stdout output: {result.stdout}")
+            if result.stderr:
+                lines.append(f"Stderr output: {result.stderr}")
+            self.logger.error("\n".join(lines))
+            return "failed"
+        
+        if tex_file.exists():
+            self.logger.debug(lambda: f"SUCCESS: {tex_file.name} created ({tex_file.stat().st_size} bytes)")
+            if cache_key:
                 try:
-                    self.logger.log(f"Starting conversion (timeout: 60s)...")
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(dds_file.parent), timeout=60)
-                    
-                    self.logger.log(f"Conversion completed - Code: {result.returncode}")
-                    
-                    if result.stdout:
-                        self.logger.log(f"Stdout output: {result.stdout}")
-                    if result.stderr:
-                        self.logger.log(f"Stderr output: {result.stderr}")
-                    
-                    if result.returncode != 0:
-                        self.logger.log(f"ERROR: Conversion failed for {dds_file.name}")
-                    else:
-                        if tex_file.exists():
-                            self.logger.log(f"SUCCESS: .tex file created ({tex_file.stat().st_size} bytes)")
-                        else:
-                            self.logger.log(f"WARNING: No .tex file created despite success")
-                        
-                except subprocess.TimeoutExpired:
-                    self.logger.log(f"TIMEOUT: Conversion of {dds_file.name} (more than 60 seconds)")
-                    self.logger.log("This may indicate a problem with the tool or file")
-                except Exception as e:
-                    self.logger.log(f"EXCEPTION: {str(e)}")
-            
-            if not dds_files:
-                self.logger.log(f"No .dds files found in {extracted_dir.name}, moving to next step")
+                    self.texture_cache.store(cache_key, tex_file)
+                except OSError as e:
+                    self.logger.warning(f"Could not store {tex_file.name} in texture cache: {e}")
+        else:
+            self.logger.warning(f"WARNING: No .tex file created for {dds_file.name} despite success")
+        return "success"
     
-    def rebuild_wads(self, wad_dir):
+    @staticmethod
+    def file_digest(path):
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).digest()
+    
+    @staticmethod
+    def entry_path_for(extracted_dir, file_path):
+        relative = file_path.relative_to(extracted_dir)
+        if len(relative.parts) == 1 and len(file_path.stem) == 16:
+            try:
+                entry_hash = int(file_path.stem, 16)
+            except ValueError:
+                return relative.as_posix()
+            if file_path.suffix == ".tex" and file_path.with_suffix(".dds").exists():
+                return None
+            return entry_hash
+        return relative.as_posix()
+    
+    def rebuild_wad_native(self, extracted_dir, changed_files):
+        source_wad = extracted_dir.with_name(extracted_dir.name + ".client")
+        if not source_wad.exists():
+            return None
+        
+        replacements = {}
+        for changed_file in changed_files:
+            entry_path = self.entry_path_for(extracted_dir, changed_file)
+            if entry_path is None:
+                self.logger.warning(
+                    f"⚠ Skipping {changed_file.name} in {extracted_dir.name}: converted from an unnamed entry, "
+                    f"its .tex path is unknown and would overwrite the .dds entry"
+                )
+                continue
+            replacements[entry_path] = changed_file
+        
+        if not replacements:
+            self.logger.info(f"No replaceable files in {extracted_dir.name}, keeping original {source_wad.name}")
+            return "kept"
+        
+        try:
+            version = WadReader.read_version(source_wad)
+            if not WadWriter.supports(version):
+                if not self.checksum_warning_logged:
+                    self.checksum_warning_logged = True
+                    self.logger.warning(
+                        f"⚠ In-process rebuild of WAD {version[0]}.{version[1]} files needs the 'xxhash' package "
+                        f"for their checksums, using wad-make.exe (pip install -r requirements-optional.txt)"
+                    )
+                return None
+            stats = build_wad(source_wad, replacements)
+        except (WadError, OSError) as e:
+            self.logger.warning(f"In-process rebuild of {extracted_dir.name} not possible ({e}), falling back to wad-make.exe")
+            return None
+        
+        self.logger.info(
+            f"Rebuild of {extracted_dir.name} successful (in-process: {stats['copied']} chunks passed through, "
+            f"{stats['encoded']} re-encoded, {stats['bytes_encoded']} bytes written)"
+        )
+        return "rebuilt"
+    
+    def rebuild_wads(self, wad_dir, changed_files=None):
+        with self.tracer.span("rebuild") as span:
+            stats = self.rebuild_wad_dirs(wad_dir, changed_files)
+            span.add_bytes(stats['bytes'])
+        return stats
+    
+    def rebuild_wad_dirs(self, wad_dir, changed_files=None):
         wad_make_exe = self.tools_path / "wad-make.exe"
         
-        self.logger.log(f"wad-make.exe path: {wad_make_exe}")
-        self.logger.log(f"Exists: {wad_make_exe.exists()}")
+        self.logger.debug(lambda: f"wad-make.exe path: {wad_make_exe} (exists: {wad_make_exe.exists()})")
         
         extracted_dirs = [d for d in wad_dir.iterdir() if d.is_dir()]
-        self.logger.log(f"Directories to rebuild: {[d.name for d in extracted_dirs]}")
+        self.logger.debug(lambda: f"Directories to rebuild: {[d.name for d in extracted_dirs]}")
         
+        stats = {'rebuilt': 0, 'avoided': 0, 'bytes': 0}
         for extracted_dir in extracted_dirs:
-            self.logger.log(f"=== Rebuilding {extracted_dir.name} ===")
+            self.logger.debug(f"=== Rebuilding {extracted_dir.name} ===")
+            
+            source_wad = extracted_dir.with_name(extracted_dir.name + ".client")
+            if changed_files is not None and not changed_files.get(extracted_dir) and source_wad.exists():
+                self.logger.info(f"No modified files in {extracted_dir.name}, keeping original {source_wad.name}")
+                stats['avoided'] += 1
+                continue
             
-            files_in_dir = list(extracted_dir.rglob("*"))
-            self.logger.log(f"Number of files in {extracted_dir.name}: {len([f for f in files_in_dir if f.is_file()])}")
+            if changed_files is not None and self.native_wad:
+                result = self.rebuild_wad_native(extracted_dir, changed_files.get(extracted_dir, []))
+                if result == "kept":
+                    stats['avoided'] += 1
+                    continue
+                if result == "rebuilt":
+                    stats['rebuilt'] += 1
+                    stats['bytes'] += source_wad.stat().st_size
+                    continue
+            
+            self.logger.debug(lambda: (
+                f"Number of files in {extracted_dir.name}: {sum(1 for f in extracted_dir.rglob('*') if f.is_file())}"
+            ))
+            
+            if source_wad.exists() and source_wad.stat().st_nlink > 1:
+                self.logger.debug(f"Unlinking shared {source_wad.name} before rebuild")
+                source_wad.unlink()
             
             wad_make_abs = Path.cwd() / self.tools_path / "wad-make.exe"
             extracted_dir_abs = Path.cwd() / extracted_dir
             
             cmd = [str(wad_make_abs), str(extracted_dir_abs)]
-            self.logger.log(f"Command: {' '.join(cmd)}")
-            self.logger.log(f"Working directory: {Path.cwd()}")
+            self.logger.debug(lambda: f"Command: {' '.join(cmd)}")
+            self.logger.debug(lambda: f"Working directory: {Path.cwd()}")
             
             try:
-                self.logger.log(f"Starting rebuild (timeout: 3 minutes)...")
+                self.logger.debug(f"Starting rebuild (timeout: 3 minutes)...")
+                self.tracer.count_subprocess()
                 result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(Path.cwd()), timeout=180)
                 
-                self.logger.log(f"Return code: {result.returncode}")
+                self.logger.debug(lambda: f"Return code: {result.returncode}")
                 if result.stdout:
-                    self.logger.log(f"Output: {result.stdout[:500]}...")
+                    self.logger.debug(lambda: f"Output: {result.stdout[:500]}...")
                 if result.stderr:
-                    self.logger.log(f"Error: {result.stderr}")
+                    self.logger.warning(f"Error: {result.stderr}")
                     
                 if result.returncode != 0:
                     raise Exception(f"Error rebuilding {extracted_dir.name}: Code {result.returncode}, {result.stderr}")
                 else:
-                    self.logger.log(f"Rebuild of {extracted_dir.name} successful")
-                    
-                    new_wad_files = list(wad_dir.glob("*.wad.client"))
-                    self.logger.log(f"WAD files after rebuild: {[f.name for f in new_wad_files]}")
+                    self.logger.info(f"Rebuild of {extracted_dir.name} successful")
+                    stats['rebuilt'] += 1
+                    if source_wad.exists():
+                        stats['bytes'] += source_wad.stat().st_size
+                    self.logger.debug(lambda: f"WAD files after rebuild: {[f.name for f in wad_dir.glob('*.wad.client')]}")
                     
             except subprocess.TimeoutExpired:
-                self.logger.log(f"Timeout rebuilding {extracted_dir.name} (more than 3 minutes)")
-                raise Exception(f"Timeout rebuilding {extracted_dir.name}") 
\ No newline at end of file
+                self.logger.error(f"Timeout rebuilding {extracted_dir.name} (more than 3 minutes)")
+                raise Exception(f"Timeout rebuilding {extracted_dir.name}")
+        
+        return stats 
\ No newline at end of file
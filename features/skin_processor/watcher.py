@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .catalog import SkinCatalog
+
+class InstalledWatcher:
+    def __init__(self, processor, logger, poll_interval=2.0, settle_seconds=5.0, max_workers=1, on_processed=None):
+        self.processor = processor
+        self.logger = logger
+        self.poll_interval = max(0.2, poll_interval)
+        self.settle_seconds = max(0.0, settle_seconds)
+        self.max_workers = max(1, max_workers)
+        self.on_processed = on_processed
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.executor = None
+        self.known_skins = set()
+        self.pending = {}
+        self.queued = set()
+        self.installed_mtime = None
+    
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+    
+    def start(self):
+        if self.is_running():
+            return
+        self.stop_event.clear()
+        self.known_skins = set(SkinCatalog.scan_installed(self.processor.installed_path))
+        self.installed_mtime = SkinCatalog.mtime_of(self.processor.installed_path)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="skin-watch")
+        self.thread = threading.Thread(target=self.run, name="skin-watcher", daemon=True)
+        self.thread.start()
+        self.logger.info(f"👁 Watching {self.processor.installed_path} for new skins ({len(self.known_skins)} already installed)")
+    
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(self.poll_interval + 1)
+            self.thread = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.logger.info("👁 Watch mode stopped")
+    
+    def run(self):
+        while not self.stop_event.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception as e:
+                self.logger.warning(f"⚠ Watch mode poll failed: {e}")
+    
+    def poll(self):
+        installed_mtime = SkinCatalog.mtime_of(self.processor.installed_path)
+        if installed_mtime != self.installed_mtime:
+            self.installed_mtime = installed_mtime
+            installed = set(SkinCatalog.scan_installed(self.processor.installed_path))
+            for skin_name in installed - self.known_skins - self.queued:
+                self.pending.setdefault(skin_name, (None, 0.0))
+                self.logger.info(f"👁 New skin detected: {skin_name}, waiting for it to settle...")
+            for skin_name in set(self.pending) - installed:
+                del self.pending[skin_name]
+            self.known_skins = installed - set(self.pending)
+        
+        now = time.monotonic()
+        for skin_name, (signature, changed_at) in list(self.pending.items()):
+            current = self.tree_signature(self.processor.installed_path / skin_name)
+            if current != signature:
+                self.pending[skin_name] = (current, now)
+                continue
+            if now - changed_at >= self.settle_seconds:
+                del self.pending[skin_name]
+                self.queued.add(skin_name)
+                self.executor.submit(self.process_skin, skin_name)
+    
+    @staticmethod
+    def tree_signature(path):
+        file_count, total_size, latest_mtime = 0, 0, 0
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            stat = entry.stat(follow_symlinks=False)
+                            file_count += 1
+                            total_size += stat.st_size
+                            latest_mtime = max(latest_mtime, stat.st_mtime_ns)
+            except FileNotFoundError:
+                continue
+        return file_count, total_size, latest_mtime
+    
+    def process_skin(self, skin_name):
+        if self.stop_event.is_set():
+            return
+        try:
+            if skin_name in self.processor.active_skins:
+                self.logger.info(f"👁 {skin_name} is part of the running batch, leaving it to the batch")
+                return
+            with self.processor.batch_lock:
+                if self.stop_event.is_set():
+                    return
+                self.processor.backup_path.mkdir(parents=True, exist_ok=True)
+                self.processor.process_path.mkdir(parents=True, exist_ok=True)
+                _, backup_root, process_root = self.processor.get_worker_directories()
+                self.logger.info(f"👁 Processing newly installed skin {skin_name}")
+                result = self.processor.process_single_skin(skin_name, backup_root, process_root)
+        except Exception as e:
+            self.logger.error(f"❌ Watch mode could not process {skin_name}: {e}")
+            result = e
+        finally:
+            self.known_skins.add(skin_name)
+            self.queued.discard(skin_name)
+        self.logger.flush()
+        
+        if self.on_processed:
+            self.on_processed(skin_name, result)
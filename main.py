@@ -2,11 +2,16 @@
 
 from config.config_manager import ConfigManager
 from utils.logging_utils import LogHandler
+from utils.file_log import RotatingFileLog
 from ui.main_window import MainWindow
 
 def main():
     config_manager = ConfigManager()
-    logger = LogHandler()
+    logger = LogHandler(config_manager.get_log_level())
+    file_log = RotatingFileLog.from_config(config_manager)
+    if file_log:
+        logger.add_sink(file_log)
+    logger.install_crash_handlers()
     
     app = MainWindow(config_manager, logger)
     app.run()
@@ -0,0 +1,85 @@
+import json
+
+from features.skin_processor import backup_store
+from features.skin_processor.backup_store import BackupStore
+
+def make_skin(path, files):
+    for name, data in files.items():
+        target = path / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    return path
+
+def snapshot_files(store, skin_name, snapshot_id):
+    return {entry['path']: entry['hash'] for entry in store.load_snapshot(skin_name, snapshot_id)['files']}
+
+def test_back_to_back_snapshots_sort_in_creation_order(tmp_path):
+    store = BackupStore(tmp_path / "backups", retention=10)
+    skin = make_skin(tmp_path / "skin", {"WAD/a.wad.client": b"first"})
+    
+    created = []
+    for index in range(5):
+        (skin / "WAD" / "a.wad.client").write_bytes(f"version {index}".encode())
+        created.append(store.backup(skin, "Skin")[0])
+    
+    assert store.snapshots("Skin") == created
+    assert json.loads((store.skin_snapshots_path("Skin") / f"{created[-1]}.json").read_text())['files']
+    assert snapshot_files(store, "Skin", None) == snapshot_files(store, "Skin", created[-1])
+
+def test_snapshot_ids_stay_ordered_when_the_clock_stalls_or_goes_back(tmp_path, monkeypatch):
+    store = BackupStore(tmp_path / "backups", retention=10)
+    skin = make_skin(tmp_path / "skin", {"WAD/a.wad.client": b"data"})
+    clock = [1_700_000_000_999_999_000, 1_700_000_000_999_999_000, 1_700_000_000_000_001_000, 1_699_999_999_000_000_000]
+    real_time_ns = backup_store.time.time_ns
+    monkeypatch.setattr(backup_store.time, "time_ns", lambda: clock.pop(0) if clock else real_time_ns())
+    
+    created = [store.backup(skin, "Skin")[0] for _ in range(4)]
+    
+    assert len(set(created)) == 4
+    assert store.snapshots("Skin") == created
+
+def test_retention_removes_the_oldest_snapshots(tmp_path):
+    store = BackupStore(tmp_path / "backups", retention=2)
+    skin = make_skin(tmp_path / "skin", {"WAD/a.wad.client": b"data"})
+    
+    created = [store.backup(skin, "Skin")[0] for _ in range(4)]
+    
+    assert store.snapshots("Skin") == created[-2:]
+
+def test_restore_hardlinks_uncompressed_objects(tmp_path):
+    store = BackupStore(tmp_path / "backups")
+    skin = make_skin(tmp_path / "skin", {"WAD/a.wad.client": b"wad", "META/info.json": b"{}"})
+    store.backup(skin, "Skin")
+    
+    stats = store.restore("Skin", tmp_path / "restored")
+    
+    restored = tmp_path / "restored" / "WAD" / "a.wad.client"
+    source, _ = store.find_object(store.hash_file(restored))
+    assert stats == {'linked': 2, 'copied': 0, 'bytes': 5}
+    assert restored.read_bytes() == b"wad"
+    assert restored.stat().st_ino == source.stat().st_ino
+
+def test_restore_copies_compressed_objects(tmp_path):
+    store = BackupStore(tmp_path / "backups", compression="zlib")
+    skin = make_skin(tmp_path / "skin", {"WAD/a.wad.client": b"wad" * 100})
+    store.backup(skin, "Skin")
+    
+    stats = store.restore("Skin", tmp_path / "restored")
+    
+    restored = tmp_path / "restored" / "WAD" / "a.wad.client"
+    assert stats == {'linked': 0, 'copied': 1, 'bytes': 300}
+    assert restored.read_bytes() == b"wad" * 100
+    assert restored.stat().st_nlink == 1
+
+def test_backing_up_a_restored_skin_detaches_the_store_object(tmp_path):
+    store = BackupStore(tmp_path / "backups")
+    skin = make_skin(tmp_path / "skin", {"WAD/a.wad.client": b"wad"})
+    store.backup(skin, "Skin")
+    store.restore("Skin", tmp_path / "restored")
+    restored = tmp_path / "restored" / "WAD" / "a.wad.client"
+    
+    store.backup(tmp_path / "restored", "Skin")
+    
+    source, _ = store.find_object(store.hash_file(restored))
+    assert source.stat().st_nlink == 1
+    assert restored.stat().st_ino != source.stat().st_ino
@@ -0,0 +1,17 @@
+from utils.profiling import PipelineTracer
+
+def test_span_bytes_are_only_computed_when_tracing():
+    calls = []
+    def measure():
+        calls.append(1)
+        return 128
+    
+    with PipelineTracer(enabled=False).span("copy") as span:
+        span.add_bytes(measure)
+    assert calls == []
+    
+    tracer = PipelineTracer(enabled=True)
+    with tracer.span("copy") as span:
+        span.add_bytes(measure)
+        span.add_bytes(64)
+    assert calls == [1] and span.bytes == 192
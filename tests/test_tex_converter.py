@@ -0,0 +1,92 @@
+import pytest
+
+from features.skin_processor.tex_converter import DdsToTexConverter, TexConversionError
+
+DDSD_CAPS = 0x1
+DDSD_HEIGHT = 0x2
+DDSD_WIDTH = 0x4
+DDSD_PIXELFORMAT = 0x1000
+
+def dds_header(width, height, mip_count, fourcc=b"\x00\x00\x00\x00", rgba=False, caps2=0):
+    flags = DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT
+    if mip_count > 1:
+        flags |= DdsToTexConverter.DDSD_MIPMAPCOUNT
+    if rgba:
+        pf_flags = DdsToTexConverter.DDPF_RGB | DdsToTexConverter.DDPF_ALPHAPIXELS
+        bit_count, masks = 32, (0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000)
+    else:
+        pf_flags = DdsToTexConverter.DDPF_FOURCC
+        bit_count, masks = 0, (0, 0, 0, 0)
+    return DdsToTexConverter.DDS_HEADER.pack(
+        b"DDS ", 124, flags, height, width, 0, 0, mip_count, b"\x00" * 44,
+        32, pf_flags, fourcc, bit_count, *masks,
+        0x1000, caps2, 0, 0, 0
+    )
+
+def mip_chain(sizes):
+    return [bytes([level + 1]) * size for level, size in enumerate(sizes)]
+
+def write_dds(path, header, levels):
+    path.write_bytes(header + b"".join(levels))
+    return path
+
+def read_tex(path):
+    data = path.read_bytes()
+    return DdsToTexConverter.TEX_HEADER.unpack_from(data, 0), data[DdsToTexConverter.TEX_HEADER.size:]
+
+@pytest.mark.parametrize("name, header, tex_format, sizes", [
+    ("bc1", dds_header(16, 8, 5, fourcc=b"DXT1"), DdsToTexConverter.TEX_BC1, [64, 16, 8, 8, 8]),
+    ("bc3", dds_header(16, 8, 5, fourcc=b"DXT5"), DdsToTexConverter.TEX_BC3, [128, 32, 16, 16, 16]),
+    ("bgra8", dds_header(4, 2, 3, rgba=True), DdsToTexConverter.TEX_BGRA8, [32, 8, 4]),
+    (
+        "dx10_bc3",
+        dds_header(8, 8, 4, fourcc=b"DX10") + DdsToTexConverter.DX10_HEADER.pack(77, 3, 0, 1, 0),
+        DdsToTexConverter.TEX_BC3,
+        [64, 16, 16, 16]
+    ),
+])
+def test_convert_writes_header_and_smallest_mip_first(tmp_path, name, header, tex_format, sizes):
+    levels = mip_chain(sizes)
+    dds_file = write_dds(tmp_path / f"{name}.dds", header, levels)
+    
+    tex_file = DdsToTexConverter.convert(dds_file)
+    (magic, width, height, depth, converted_format, resource_type, flags), body = read_tex(tex_file)
+    dds_height, dds_width = DdsToTexConverter.DDS_HEADER.unpack_from(header, 0)[3:5]
+    
+    assert tex_file == tmp_path / f"{name}.tex"
+    assert magic == DdsToTexConverter.TEX_MAGIC
+    assert (width, height, depth, resource_type) == (dds_width, dds_height, 1, 0)
+    assert converted_format == tex_format
+    assert flags == DdsToTexConverter.TEX_HAS_MIPMAPS
+    assert body == b"".join(reversed(levels))
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_convert_single_level_has_no_mipmap_flag(tmp_path):
+    dds_file = write_dds(tmp_path / "flat.dds", dds_header(8, 4, 1, fourcc=b"DXT1"), mip_chain([16]))
+    (_magic, width, height, _depth, tex_format, _resource_type, flags), body = read_tex(DdsToTexConverter.convert(dds_file))
+    assert (width, height, tex_format, flags) == (8, 4, DdsToTexConverter.TEX_BC1, 0)
+    assert body == b"\x01" * 16
+
+@pytest.mark.parametrize("header, message", [
+    (dds_header(8, 8, 1, fourcc=b"ATI2"), "unsupported compression"),
+    (dds_header(8, 8, 2, fourcc=b"DXT1"), "partial mip chain"),
+    (dds_header(8, 8, 1, fourcc=b"DXT1", caps2=DdsToTexConverter.DDSCAPS2_CUBEMAP), "cube maps"),
+    (dds_header(8, 8, 1, fourcc=b"DX10") + DdsToTexConverter.DX10_HEADER.pack(98, 3, 0, 1, 0), "unsupported DXGI format"),
+])
+def test_unsupported_textures_are_rejected(tmp_path, header, message):
+    dds_file = write_dds(tmp_path / "bad.dds", header, [b"\x00" * 4096])
+    with pytest.raises(TexConversionError, match=message):
+        DdsToTexConverter.convert(dds_file)
+    assert not (tmp_path / "bad.tex").exists()
+
+def test_truncated_pixel_data_leaves_no_output(tmp_path):
+    dds_file = write_dds(tmp_path / "short.dds", dds_header(16, 16, 5, fourcc=b"DXT5"), [b"\x00" * 100])
+    with pytest.raises(TexConversionError, match="truncated pixel data"):
+        DdsToTexConverter.convert(dds_file)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["short.dds"]
+
+def test_non_dds_input_is_rejected(tmp_path):
+    not_dds = tmp_path / "image.dds"
+    not_dds.write_bytes(b"\x89PNG" + b"\x00" * 200)
+    with pytest.raises(TexConversionError, match="not a DDS file"):
+        DdsToTexConverter.convert(not_dds)
@@ -0,0 +1,263 @@
+import gzip
+import hashlib
+import os
+import struct
+
+import pytest
+
+from features.skin_processor import wad_file
+from features.skin_processor.wad_file import WadEntry, WadError, WadReader, WadWriter, build_wad, path_hash, xxh64
+
+XXH64_VECTORS = [
+    (b"", 0, 0xEF46DB3751D8E999),
+    (b"a", 0, 0xD24EC4F1A98C6E5B),
+    (b"abc", 0, 0x44BC2CF5AD770999),
+    (b"Nobody inspects the spammish repetition", 0, 0xFBCEA83C8A378BF1),
+    (b"", 0x9E3779B1, 0xAC75FDA2929B17EF),
+    (b"abc", 0x9E3779B1, 0x1318DF30094A85FD),
+    (b"Nobody inspects the spammish repetition", 0x9E3779B1, 0x56DB22DD5B051147),
+    (bytes(range(256)) * 3 + b"xyz", 0, 0xE921A1B45BD779F8),
+    (bytes(range(256)) * 3 + b"xyz", 0x9E3779B1, 0xF4D70D6F815A5B88),
+]
+
+def pack_wad(path, entries, version=(3, 1)):
+    offset = WadReader.HEADER.size + len(entries) * WadReader.ENTRY.size
+    toc = []
+    blobs = []
+    for entry_hash, entry_type, payload, size, subchunk_count in entries:
+        toc.append(WadReader.ENTRY.pack(entry_hash, offset, len(payload), size, entry_type | (subchunk_count << 4), 0, 0, 0))
+        blobs.append(payload)
+        offset += len(payload)
+    
+    with open(path, 'wb') as f:
+        f.write(WadReader.HEADER.pack(b"RW", version[0], version[1], b"\x00" * 256, 0, len(entries)))
+        f.write(b"".join(toc))
+        f.write(b"".join(blobs))
+
+def read_all(path):
+    with WadReader(path) as reader:
+        return {
+            entry.path_hash: (entry, bytes(reader.read_raw(entry)), reader.read(entry) if entry.type != WadEntry.TYPE_LINK else None)
+            for entry in reader
+        }
+
+def test_reader_decodes_raw_gzip_and_rejects_links(tmp_path):
+    source = tmp_path / "read.wad.client"
+    pack_wad(source, [
+        (1, WadEntry.TYPE_RAW, b"raw payload", 11, 0),
+        (2, WadEntry.TYPE_LINK, b"data/target.bin", 15, 0),
+        (3, WadEntry.TYPE_GZIP, gzip.compress(b"gzip payload", mtime=0), 12, 0),
+    ], version=(3, 0))
+    
+    with WadReader(source) as reader:
+        assert reader.version == (3, 0) and len(reader) == 3
+        assert reader.read(reader.get(1)) == b"raw payload"
+        assert reader.read(reader.get(3)) == b"gzip payload"
+        with pytest.raises(WadError):
+            reader.read(reader.get(2))
+
+def test_reader_decodes_zstd_and_multi_chunk_entries(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    compressor = zstandard.ZstdCompressor(level=3)
+    single = b"single frame " * 40
+    chunks = [b"chunk one " * 30, b"chunk two " * 30]
+    
+    source = tmp_path / "zstd.wad.client"
+    pack_wad(source, [
+        (1, WadEntry.TYPE_ZSTD, compressor.compress(single), len(single), 0),
+        (2, WadEntry.TYPE_ZSTD_MULTI, b"raw prefix" + b"".join(compressor.compress(chunk) for chunk in chunks),
+         len(b"raw prefix") + sum(map(len, chunks)), 3),
+    ])
+    
+    data = read_all(source)
+    assert data[1][2] == single
+    assert data[2][2] == b"raw prefix" + b"".join(chunks)
+    assert data[2][0].subchunk_count == 3
+
+def test_extract_names_entries_and_skips_links(tmp_path):
+    source = tmp_path / "extract.wad.client"
+    pack_wad(source, [
+        (1, WadEntry.TYPE_RAW, b"DDS " + b"\x00" * 16, 20, 0),
+        (2, WadEntry.TYPE_GZIP, gzip.compress(b"TEX\x00" + b"\x01" * 16, mtime=0), 20, 0),
+        (3, WadEntry.TYPE_LINK, b"data/target.bin", 15, 0),
+    ])
+    
+    output = tmp_path / "extract.wad"
+    with WadReader(source) as reader:
+        written = reader.extract(output, names={2: "assets/Ahri/ahri.tex"})
+    
+    assert sorted(path.relative_to(output).as_posix() for path in written) == [
+        "0000000000000001.dds",
+        "assets/Ahri/ahri.tex"
+    ]
+    assert (output / "assets" / "Ahri" / "ahri.tex").read_bytes() == b"TEX\x00" + b"\x01" * 16
+
+def test_truncated_wad_is_rejected(tmp_path):
+    source = tmp_path / "short.wad.client"
+    pack_wad(source, [(1, WadEntry.TYPE_RAW, b"payload", 7, 0)])
+    source.write_bytes(source.read_bytes()[:-4])
+    with pytest.raises(WadError, match="points outside the file"):
+        WadReader(source)
+
+def test_hash_table_indexes_once_and_reloads_when_changed(tmp_path):
+    names = [f"assets/characters/ahri/skins/skin{i:02d}/ahri_{i:02d}.dds" for i in range(40)]
+    table_file = tmp_path / "hashes.game.txt"
+    table_file.write_text("".join(f"{path_hash(name):016x} {name}\n" for name in reversed(names)))
+    
+    table = wad_file.HashTable(table_file)
+    assert table.resolve([path_hash(names[3]), path_hash(names[30]), 42]) == {
+        path_hash(names[3]): names[3],
+        path_hash(names[30]): names[30]
+    }
+    signature = table.signature
+    assert table.resolve([path_hash(names[7])]) == {path_hash(names[7]): names[7]}
+    assert table.signature is signature
+    
+    table_file.write_text(f"{42:016x} data/late.bin\n")
+    os.utime(table_file, ns=(0, 0))
+    assert table.resolve([42, path_hash(names[3])]) == {42: "data/late.bin"}
+
+def test_unnamed_converted_tex_has_no_entry_path(tmp_path):
+    from features.skin_processor.wad_tools import WadTools
+    extracted_dir = tmp_path / "skin.wad"
+    extracted_dir.mkdir()
+    for name in ("0123456789abcdef.dds", "0123456789abcdef.tex", "fedcba9876543210.tex"):
+        (extracted_dir / name).write_bytes(b"data")
+    (extracted_dir / "assets").mkdir()
+    (extracted_dir / "assets" / "ahri.tex").write_bytes(b"data")
+    
+    assert WadTools.entry_path_for(extracted_dir, extracted_dir / "0123456789abcdef.tex") is None
+    assert WadTools.entry_path_for(extracted_dir, extracted_dir / "0123456789abcdef.dds") == 0x0123456789ABCDEF
+    assert WadTools.entry_path_for(extracted_dir, extracted_dir / "fedcba9876543210.tex") == 0xFEDCBA9876543210
+    assert WadTools.entry_path_for(extracted_dir, extracted_dir / "assets" / "ahri.tex") == "assets/ahri.tex"
+
+@pytest.mark.parametrize("data, seed, expected", XXH64_VECTORS)
+def test_xxh64_fallback_matches_known_vectors(monkeypatch, data, seed, expected):
+    monkeypatch.setattr(wad_file, "xxhash", None)
+    assert xxh64(data, seed) == expected
+
+def test_xxh64_fallback_matches_xxhash_package(monkeypatch):
+    xxhash = pytest.importorskip("xxhash")
+    monkeypatch.setattr(wad_file, "xxhash", None)
+    for length in (0, 1, 3, 4, 7, 8, 31, 32, 33, 63, 64, 100, 1000):
+        data = os.urandom(length)
+        assert xxh64(data) == xxhash.xxh64_intdigest(data)
+
+def test_path_hash_normalizes_separators_and_case():
+    assert path_hash("ASSETS\\Characters\\Ahri\\ahri.dds") == xxh64(b"assets/characters/ahri/ahri.dds")
+    assert path_hash(0x1234) == 0x1234
+
+@pytest.mark.parametrize("version", [(3, 0), (3, 1)])
+def test_build_round_trip_keeps_untouched_entries_byte_identical(tmp_path, version):
+    if version == (3, 1):
+        xxhash = pytest.importorskip("xxhash")
+    
+    source = tmp_path / "source.wad.client"
+    writer = WadWriter(version=version)
+    writer.replace("data/a.bin", b"first entry" * 50)
+    writer.replace("data/b.bin", b"second entry" * 50)
+    writer.replace("data/c.bin", b"third entry" * 50)
+    writer.write(source)
+    before = read_all(source)
+    
+    output = tmp_path / "output.wad.client"
+    stats = build_wad(source, {"data/b.bin": b"replaced entry" * 10, "data/d.bin": b"new entry"}, output_path=output)
+    after = read_all(output)
+    
+    assert stats['copied'] == 2 and stats['encoded'] == 2
+    assert set(after) == set(before) | {path_hash("data/d.bin")}
+    for name in ("data/a.bin", "data/c.bin"):
+        entry_hash = path_hash(name)
+        assert after[entry_hash][1] == before[entry_hash][1]
+        assert after[entry_hash][0].checksum == before[entry_hash][0].checksum
+    assert after[path_hash("data/b.bin")][2] == b"replaced entry" * 10
+    assert after[path_hash("data/d.bin")][2] == b"new entry"
+    
+    with WadReader(output) as reader:
+        assert reader.version == version
+        assert [entry.path_hash for entry in reader] == sorted(entry.path_hash for entry in reader)
+    
+    for entry, raw, _data in after.values():
+        if version == (3, 0):
+            assert entry.checksum == struct.unpack("<Q", hashlib.sha256(raw).digest()[:8])[0]
+        else:
+            assert entry.checksum == xxhash.xxh3_64_intdigest(raw)
+
+def test_identical_replacements_share_one_chunk(tmp_path):
+    output = tmp_path / "dedup.wad.client"
+    writer = WadWriter(version=(3, 0))
+    writer.replace("data/one.bin", b"same bytes" * 100)
+    writer.replace("data/two.bin", b"same bytes" * 100)
+    writer.replace("data/three.bin", b"other bytes" * 100)
+    writer.write(output)
+    
+    with WadReader(output) as reader:
+        one = reader.get(path_hash("data/one.bin"))
+        two = reader.get(path_hash("data/two.bin"))
+        three = reader.get(path_hash("data/three.bin"))
+        assert one.offset == two.offset and one.offset != three.offset
+        assert [one.is_duplicate, two.is_duplicate].count(True) == 1
+        assert reader.read(two) == b"same bytes" * 100
+        assert sum(entry.compressed_size for entry in reader if not entry.is_duplicate) < os.path.getsize(output)
+
+def test_link_and_raw_entries_pass_through(tmp_path):
+    source = tmp_path / "links.wad.client"
+    pack_wad(source, [
+        (1, WadEntry.TYPE_RAW, b"raw payload", 11, 0),
+        (2, WadEntry.TYPE_LINK, b"data/target.bin", 15, 0),
+        (3, WadEntry.TYPE_GZIP, gzip.compress(b"gzip payload", mtime=0), 12, 0),
+    ], version=(3, 0))
+    before = read_all(source)
+    
+    build_wad(source, {4: b"added"})
+    after = read_all(source)
+    
+    for entry_hash in (1, 2, 3):
+        assert after[entry_hash][0].type == before[entry_hash][0].type
+        assert after[entry_hash][0].size == before[entry_hash][0].size
+        assert after[entry_hash][1] == before[entry_hash][1]
+    assert after[1][2] == b"raw payload"
+    assert after[3][2] == b"gzip payload"
+    assert after[4][2] == b"added"
+
+def test_zstd_entries_pass_through(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    compressor = zstandard.ZstdCompressor(level=3)
+    single = b"single frame " * 40
+    chunks = [b"chunk one " * 30, b"chunk two " * 30]
+    multi = b"raw prefix" + b"".join(compressor.compress(chunk) for chunk in chunks)
+    
+    source = tmp_path / "zstd.wad.client"
+    pack_wad(source, [
+        (1, WadEntry.TYPE_ZSTD, compressor.compress(single), len(single), 0),
+        (2, WadEntry.TYPE_ZSTD_MULTI, multi, len(b"raw prefix") + sum(map(len, chunks)), 3),
+    ], version=(3, 0))
+    
+    before = read_all(source)
+    assert before[1][2] == single
+    assert before[2][2] == b"raw prefix" + b"".join(chunks)
+    
+    build_wad(source, {"data/new.bin": b"encoded with zstd" * 20})
+    after = read_all(source)
+    assert after[1][1] == before[1][1] and after[2][1] == before[2][1]
+    assert after[2][0].subchunk_count == 3
+    new_entry, _raw, data = after[path_hash("data/new.bin")]
+    assert new_entry.type == WadEntry.TYPE_ZSTD and data == b"encoded with zstd" * 20
+
+def test_writer_falls_back_to_gzip_without_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(wad_file, "zstandard", None)
+    output = tmp_path / "gzip.wad.client"
+    writer = WadWriter(version=(3, 0))
+    writer.replace("data/a.bin", b"gzip fallback" * 20)
+    writer.write(output)
+    
+    with WadReader(output) as reader:
+        entry = reader.get(path_hash("data/a.bin"))
+        assert entry.type == WadEntry.TYPE_GZIP
+        assert reader.read(entry) == b"gzip fallback" * 20
+
+def test_writing_v3_1_without_xxhash_fails_cleanly(tmp_path, monkeypatch):
+    monkeypatch.setattr(wad_file, "xxhash", None)
+    assert WadWriter.supports((3, 0)) and not WadWriter.supports((3, 1))
+    with pytest.raises(WadError, match="xxhash"):
+        WadWriter(version=(3, 1))
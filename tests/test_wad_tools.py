@@ -0,0 +1,68 @@
+from features.skin_processor import wad_file
+from features.skin_processor.wad_file import WadReader, WadWriter, path_hash
+from features.skin_processor.wad_tools import WadTools
+from utils.logging_utils import ConsoleLogHandler
+
+DDS_DATA = b"DDS " + b"\x00" * 124
+UNNAMED_HASH = 0x0123456789ABCDEF
+
+class RecordingLogger(ConsoleLogHandler):
+    def __init__(self):
+        super().__init__("error")
+        self.warnings = []
+    
+    def warning(self, message):
+        self.warnings.append(message)
+
+def make_skin_wad(wad_dir):
+    wad_dir.mkdir(parents=True)
+    source_wad = wad_dir / "skin.wad.client"
+    writer = WadWriter(version=(3, 0))
+    writer.replace(UNNAMED_HASH, DDS_DATA)
+    writer.replace("assets/skin/named.dds", DDS_DATA + b"named")
+    writer.write(source_wad)
+    
+    extracted_dir = wad_dir / "skin.wad"
+    with WadReader(source_wad) as reader:
+        reader.extract(extracted_dir, names={path_hash("assets/skin/named.dds"): "assets/skin/named.dds"})
+    return source_wad, extracted_dir
+
+def test_rebuild_with_only_unnamed_textures_keeps_the_original(tmp_path):
+    source_wad, extracted_dir = make_skin_wad(tmp_path / "WAD")
+    original = source_wad.read_bytes()
+    tex_file = extracted_dir / f"{UNNAMED_HASH:016x}.tex"
+    tex_file.write_bytes(b"TEX\x00converted")
+    
+    tools = WadTools(tmp_path / "tools", ConsoleLogHandler("error"))
+    stats = tools.rebuild_wad_dirs(tmp_path / "WAD", {extracted_dir: [tex_file]})
+    
+    assert stats == {'rebuilt': 0, 'avoided': 1, 'bytes': 0}
+    assert source_wad.read_bytes() == original
+
+def test_rebuild_counts_only_written_wads(tmp_path):
+    source_wad, extracted_dir = make_skin_wad(tmp_path / "WAD")
+    tex_file = extracted_dir / "assets" / "skin" / "named.tex"
+    tex_file.write_bytes(b"TEX\x00converted")
+    
+    tools = WadTools(tmp_path / "tools", ConsoleLogHandler("error"))
+    stats = tools.rebuild_wad_dirs(tmp_path / "WAD", {extracted_dir: [tex_file]})
+    
+    assert stats == {'rebuilt': 1, 'avoided': 0, 'bytes': source_wad.stat().st_size}
+    with WadReader(source_wad) as reader:
+        assert reader.read(reader.get(path_hash("assets/skin/named.tex"))) == b"TEX\x00converted"
+        assert reader.read(reader.get(UNNAMED_HASH)) == DDS_DATA
+
+def test_v3_1_rebuild_without_xxhash_warns_once_and_falls_back(tmp_path, monkeypatch):
+    source_wad, extracted_dir = make_skin_wad(tmp_path / "WAD")
+    with open(source_wad, 'r+b') as f:
+        f.seek(3)
+        f.write(b"\x01")
+    tex_file = extracted_dir / "assets" / "skin" / "named.tex"
+    tex_file.write_bytes(b"TEX\x00converted")
+    monkeypatch.setattr(wad_file, "xxhash", None)
+    
+    logger = RecordingLogger()
+    tools = WadTools(tmp_path / "tools", logger)
+    assert tools.rebuild_wad_native(extracted_dir, [tex_file]) is None
+    assert tools.rebuild_wad_native(extracted_dir, [tex_file]) is None
+    assert len(logger.warnings) == 1 and "xxhash" in logger.warnings[0]
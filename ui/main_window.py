@@ -1,10 +1,15 @@
+import importlib
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from .skin_processor_tab import SkinProcessorTab
 from .theme import AppTheme
 
 class MainWindow:
+    MODULES = {
+        "skin_processor": ("🎨 Skin Processor", ".skin_processor_tab", "SkinProcessorTab"),
+    }
+    DEFAULT_MODULE = "skin_processor"
+    
     def __init__(self, config_manager, logger):
         self.config = config_manager
         self.logger = logger
@@ -13,14 +18,19 @@ class MainWindow:
         self.root.title("Tools Helper - CSLoL Skin Processor")
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
+        self.root.report_callback_exception = self.report_callback_exception
         
         self.current_module = None
-        self.skin_processor_tab = None
+        self.modules = {}
+        self.module_buttons = {}
         
         self.setup_theme()
         self.setup_ui()
         self.check_initial_config()
     
+    def report_callback_exception(self, exc_type, exc_value, exc_traceback):
+        self.logger.log_exception("Unhandled exception in UI callback", exc_type, exc_value, exc_traceback)
+    
     def setup_theme(self):
         AppTheme.configure_style(self.root)
         
@@ -134,7 +144,7 @@ class MainWindow:
         
         self.setup_sidebar(content_frame)
         self.setup_main_content(content_frame)
-        self.switch_module("skin_processor")
+        self.root.after_idle(lambda: self.root.after(0, self.switch_module, self.DEFAULT_MODULE))
     
     def setup_sidebar(self, parent):
         sidebar_frame = self.create_frame(parent, AppTheme.BG_MEDIUM, width=250)
@@ -156,10 +166,14 @@ class MainWindow:
             ("Segoe UI", 12, "bold")
         ).pack(anchor="w", pady=(0, 15))
         
-        self.skin_processor_btn = tk.Button(
+        for module_name, (label, _, _) in self.MODULES.items():
+            self.create_module_button(parent, module_name, label)
+    
+    def create_module_button(self, parent, module_name, label):
+        button = tk.Button(
             parent,
-            text="🎨 Skin Processor",
-            command=lambda: self.switch_module("skin_processor"),
+            text=label,
+            command=lambda: self.switch_module(module_name),
             bg=AppTheme.BG_MEDIUM,
             fg=AppTheme.TEXT_ACCENT,
             activebackground=AppTheme.PRIMARY,
@@ -172,7 +186,8 @@ class MainWindow:
             padx=15,
             pady=12
         )
-        self.skin_processor_btn.pack(fill=tk.X, pady=(0, 5))
+        button.pack(fill=tk.X, pady=(0, 5))
+        self.module_buttons[module_name] = button
     
     def setup_info_section(self, parent):
         separator = self.create_frame(parent, AppTheme.BORDER, height=1)
@@ -207,26 +222,34 @@ class MainWindow:
         if not hasattr(self, 'main_content_frame') or not self.main_content_frame:
             return
             
-        self.update_sidebar_selection(module_name)
-        self.clear_main_content()
-        self.load_module(module_name)
+        module = self.modules.get(module_name) or self.load_module(module_name)
+        if module is None:
+            return
         
+        if self.current_module in self.modules:
+            self.modules[self.current_module].hide()
+        module.show()
+        
+        self.update_sidebar_selection(module_name)
         self.current_module = module_name
     
     def update_sidebar_selection(self, module_name):
-        is_selected = module_name == "skin_processor"
-        self.skin_processor_btn.configure(
-            bg=AppTheme.PRIMARY if is_selected else AppTheme.BG_MEDIUM,
-            fg=AppTheme.TEXT_PRIMARY if is_selected else AppTheme.TEXT_ACCENT
-        )
-    
-    def clear_main_content(self):
-        for widget in self.main_content_frame.winfo_children():
-            widget.destroy()
+        for name, button in self.module_buttons.items():
+            is_selected = name == module_name
+            button.configure(
+                bg=AppTheme.PRIMARY if is_selected else AppTheme.BG_MEDIUM,
+                fg=AppTheme.TEXT_PRIMARY if is_selected else AppTheme.TEXT_ACCENT
+            )
     
     def load_module(self, module_name):
-        if module_name == "skin_processor":
-            self.skin_processor_tab = SkinProcessorTab(self.main_content_frame, self.config, self.logger)
+        _, module_path, class_name = self.MODULES[module_name]
+        try:
+            module_class = getattr(importlib.import_module(module_path, __package__), class_name)
+            self.modules[module_name] = module_class(self.main_content_frame, self.config, self.logger)
+        except Exception as e:
+            self.logger.error(f"❌ Could not load module {module_name}: {e}")
+            return None
+        return self.modules[module_name]
     
     def update_header(self):
         path = self.config.get_cslol_path()
@@ -255,8 +278,9 @@ class MainWindow:
                 self.update_header()
                 self.logger.log(f"CSLoL Manager path set to: {path}")
                 
-                if self.skin_processor_tab and hasattr(self.skin_processor_tab, 'load_skins'):
-                    self.skin_processor_tab.load_skins()
+                for module in self.modules.values():
+                    if hasattr(module, 'load_skins'):
+                        module.load_skins()
             else:
                 messagebox.showerror(
                     "Error", 
@@ -1,21 +1,49 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 import threading
+import queue
+import os
+from pathlib import Path
 from features.skin_processor.processor import SkinProcessor
+from features.skin_processor.watcher import InstalledWatcher
+from features.skin_processor.search_index import SkinSearchIndex
 from .theme import AppTheme
 
 class SkinProcessorTab:
+    GRID_COLUMNS = 4
+    GRID_PREFETCH_FRACTION = 0.85
+    SCAN_POLL_MS = 100
+    SEARCH_DELAY_MS = 50
+    
     def __init__(self, parent, config_manager, logger):
         self.parent = parent
         self.config = config_manager
         self.logger = logger
         self.processor = None
+        self.watcher = None
         self.champion_skins = {}
         self.selected_skins = set()
+        self.total_skins = 0
         self.view_mode = "champion"
+        self.grid_champions = []
+        self.grid_rendered = 0
+        self.grid_dirty = True
+        self.champion_cards = {}
+        self.card_filters = {}
+        self.skin_buttons = {}
+        self.skin_vars = {}
+        self.search_index = SkinSearchIndex()
+        self.search_matches = None
+        self.search_job = None
+        self.card_render_job = None
+        self.grid_placeholder = None
+        self.scanning = False
+        self.scan_cancel = None
+        self.scan_id = 0
+        self.hidden = False
         
         self.setup_ui()
-        self.load_skins()
+        self.frame.after_idle(self.load_skins)
     
     def setup_ui(self):
         self.frame = tk.Frame(self.parent, bg=AppTheme.BG_DARK)
@@ -25,6 +53,19 @@ class SkinProcessorTab:
         self.setup_content_area()
         self.setup_bottom_section()
     
+    def show(self):
+        self.hidden = False
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        if self.view_mode == "champion":
+            self.schedule_card_render()
+    
+    def hide(self):
+        self.hidden = True
+        self.frame.pack_forget()
+        if self.card_render_job is not None:
+            self.frame.after_cancel(self.card_render_job)
+            self.card_render_job = None
+    
     def setup_header_section(self):
         header_card = tk.Frame(self.frame, bg=AppTheme.BG_CARD, relief="flat", bd=0)
         header_card.pack(fill=tk.X, padx=10, pady=(10, 5))
@@ -52,9 +93,42 @@ class SkinProcessorTab:
         )
         self.status_label.pack(anchor="w", pady=(5, 0))
         
+        self.scan_progress = ttk.Progressbar(
+            title_frame,
+            mode='determinate',
+            length=240,
+            style='TProgressbar'
+        )
+        
         controls_frame = tk.Frame(header_content, bg=AppTheme.BG_CARD)
         controls_frame.pack(side=tk.RIGHT, fill=tk.Y)
         
+        search_frame = tk.Frame(header_content, bg=AppTheme.BG_CARD)
+        search_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 20))
+        
+        tk.Label(
+            search_frame,
+            text="🔍 Search:",
+            bg=AppTheme.BG_CARD,
+            fg=AppTheme.TEXT_PRIMARY,
+            font=("Segoe UI", 10, "bold")
+        ).pack(anchor="e")
+        
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self.on_search_changed)
+        search_entry = tk.Entry(
+            search_frame,
+            textvariable=self.search_var,
+            width=26,
+            bg=AppTheme.BG_MEDIUM,
+            fg=AppTheme.TEXT_PRIMARY,
+            insertbackground=AppTheme.TEXT_PRIMARY,
+            relief="flat",
+            font=("Segoe UI", 10)
+        )
+        search_entry.pack(anchor="e", pady=(5, 0), ipady=4)
+        search_entry.bind("<Escape>", lambda event: self.search_var.set(""))
+        
         tk.Label(
             controls_frame,
             text="📊 View Mode:",
@@ -117,7 +191,7 @@ class SkinProcessorTab:
         )
         self.champions_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        canvas_scrollbar = tk.Scrollbar(
+        self.champions_scrollbar = tk.Scrollbar(
             canvas_frame,
             orient=tk.VERTICAL,
             command=self.champions_canvas.yview,
@@ -127,8 +201,8 @@ class SkinProcessorTab:
             highlightthickness=0,
             bd=0
         )
-        canvas_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(5, 0))
-        self.champions_canvas.configure(yscrollcommand=canvas_scrollbar.set)
+        self.champions_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(5, 0))
+        self.champions_canvas.configure(yscrollcommand=self.on_champions_scrolled)
         
         self.champions_grid_frame = tk.Frame(self.champions_canvas, bg=AppTheme.BG_CARD)
         self.champions_canvas_window = self.champions_canvas.create_window(
@@ -208,6 +282,24 @@ class SkinProcessorTab:
             **AppTheme.get_button_style("secondary"),
             padx=15,
             pady=8
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        tk.Button(
+            left_buttons,
+            text="↩️ Restore",
+            command=self.start_restore,
+            **AppTheme.get_button_style("secondary"),
+            padx=15,
+            pady=8
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        tk.Button(
+            left_buttons,
+            text="⏯ Resume",
+            command=self.start_resume,
+            **AppTheme.get_button_style("secondary"),
+            padx=15,
+            pady=8
         ).pack(side=tk.LEFT, padx=(0, 20))
         
         right_buttons = tk.Frame(button_content, bg=AppTheme.BG_CARD)
@@ -222,6 +314,92 @@ class SkinProcessorTab:
         )
         self.selected_count_label.pack(side=tk.LEFT, padx=(0, 15))
         
+        tk.Label(
+            right_buttons,
+            text="⚙️ Workers:",
+            bg=AppTheme.BG_CARD,
+            fg=AppTheme.TEXT_SECONDARY,
+            font=("Segoe UI", 10)
+        ).pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.workers_var = tk.IntVar(value=self.config.get_max_workers())
+        tk.Spinbox(
+            right_buttons,
+            from_=1,
+            to=max(1, os.cpu_count() or 1),
+            width=3,
+            textvariable=self.workers_var,
+            command=self.on_workers_changed,
+            bg=AppTheme.BG_MEDIUM,
+            fg=AppTheme.TEXT_PRIMARY,
+            buttonbackground=AppTheme.BG_LIGHT,
+            relief="flat",
+            font=("Segoe UI", 10)
+        ).pack(side=tk.LEFT, padx=(0, 15))
+        
+        self.force_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            right_buttons,
+            text="🔁 Force",
+            variable=self.force_var,
+            bg=AppTheme.BG_CARD,
+            fg=AppTheme.TEXT_SECONDARY,
+            selectcolor=AppTheme.BG_MEDIUM,
+            activebackground=AppTheme.BG_CARD,
+            activeforeground=AppTheme.TEXT_PRIMARY,
+            font=("Segoe UI", 10),
+            relief="flat",
+            bd=0
+        ).pack(side=tk.LEFT, padx=(0, 15))
+        
+        self.pipeline_var = tk.BooleanVar(value=self.config.get_pipeline_enabled())
+        tk.Checkbutton(
+            right_buttons,
+            text="🔀 Pipeline",
+            variable=self.pipeline_var,
+            command=lambda: self.config.set_pipeline_enabled(self.pipeline_var.get()),
+            bg=AppTheme.BG_CARD,
+            fg=AppTheme.TEXT_SECONDARY,
+            selectcolor=AppTheme.BG_MEDIUM,
+            activebackground=AppTheme.BG_CARD,
+            activeforeground=AppTheme.TEXT_PRIMARY,
+            font=("Segoe UI", 10),
+            relief="flat",
+            bd=0
+        ).pack(side=tk.LEFT, padx=(0, 15))
+        
+        self.trace_var = tk.BooleanVar(value=self.config.get_trace_enabled())
+        tk.Checkbutton(
+            right_buttons,
+            text="📊 Trace",
+            variable=self.trace_var,
+            command=self.on_trace_changed,
+            bg=AppTheme.BG_CARD,
+            fg=AppTheme.TEXT_SECONDARY,
+            selectcolor=AppTheme.BG_MEDIUM,
+            activebackground=AppTheme.BG_CARD,
+            activeforeground=AppTheme.TEXT_PRIMARY,
+            font=("Segoe UI", 10),
+            relief="flat",
+            bd=0
+        ).pack(side=tk.LEFT, padx=(0, 15))
+        
+        self.watch_var = tk.BooleanVar(value=self.config.get_watch_enabled())
+        tk.Checkbutton(
+            right_buttons,
+            text="👁 Watch",
+            variable=self.watch_var,
+            command=self.on_watch_changed,
+            bg=AppTheme.BG_CARD,
+            fg=AppTheme.TEXT_SECONDARY,
+            selectcolor=AppTheme.BG_MEDIUM,
+            activebackground=AppTheme.BG_CARD,
+            activeforeground=AppTheme.TEXT_PRIMARY,
+            font=("Segoe UI", 10),
+            relief="flat",
+            bd=0
+        ).pack(side=tk.LEFT, padx=(0, 15))
+        
         tk.Button(
             right_buttons,
             text="🚀 Process Skins",
@@ -273,6 +451,35 @@ class SkinProcessorTab:
         logs_header = tk.Frame(logs_card, bg=AppTheme.BG_CARD)
         logs_header.pack(fill=tk.X, padx=20, pady=(15, 10))
         
+        filter_frame = tk.Frame(logs_header, bg=AppTheme.BG_CARD)
+        filter_frame.pack(side=tk.RIGHT, anchor="n")
+        
+        tk.Label(
+            filter_frame,
+            text="🔎 Level:",
+            bg=AppTheme.BG_CARD,
+            fg=AppTheme.TEXT_SECONDARY,
+            font=("Segoe UI", 10)
+        ).pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.log_level_var = tk.StringVar(value=self.logger.LEVEL_NAMES[self.logger.view_level])
+        level_menu = tk.OptionMenu(
+            filter_frame,
+            self.log_level_var,
+            *self.logger.LEVEL_NAMES.values(),
+            command=self.on_log_level_changed
+        )
+        level_menu.configure(
+            bg=AppTheme.BG_MEDIUM,
+            fg=AppTheme.TEXT_PRIMARY,
+            activebackground=AppTheme.BG_LIGHT,
+            activeforeground=AppTheme.TEXT_PRIMARY,
+            highlightthickness=0,
+            relief="flat",
+            font=("Segoe UI", 10)
+        )
+        level_menu.pack(side=tk.LEFT)
+        
         tk.Label(
             logs_header,
             text="📝 Activity Log",
@@ -312,9 +519,15 @@ class SkinProcessorTab:
         )
         log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(5, 0))
         self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        self.log_text.tag_configure("debug", foreground=AppTheme.TEXT_MUTED)
+        self.log_text.tag_configure("warning", foreground=AppTheme.WARNING)
+        self.log_text.tag_configure("error", foreground=AppTheme.ERROR)
         
         self.logger.set_log_widget(self.log_text)
     
+    def on_log_level_changed(self, level):
+        self.logger.set_view_level(level)
+    
     def set_view_mode(self, mode):
         self.view_mode = mode
         
@@ -330,7 +543,10 @@ class SkinProcessorTab:
     def show_champion_view(self):
         self.list_card.pack_forget()
         self.champion_card.pack(fill=tk.BOTH, expand=True)
-        self.populate_champions_grid()
+        if self.grid_dirty:
+            self.populate_champions_grid()
+        else:
+            self.schedule_card_render()
     
     def show_list_view(self):
         self.champion_card.pack_forget()
@@ -341,101 +557,204 @@ class SkinProcessorTab:
         for widget in self.champions_grid_frame.winfo_children():
             widget.destroy()
         
-        if not self.champion_skins:
-            no_data_label = tk.Label(
+        self.champion_cards = {}
+        self.card_filters = {}
+        self.skin_buttons = {}
+        self.skin_vars = {}
+        self.grid_dirty = False
+        self.grid_placeholder = None
+        
+        for col in range(self.GRID_COLUMNS):
+            self.champions_grid_frame.columnconfigure(col, weight=1)
+        
+        self.refresh_grid(reset=True)
+    
+    def visible_champions(self):
+        if self.search_matches is None:
+            return sorted(self.champion_skins.keys())
+        return sorted(
+            champion_name for champion_name, champion_data in self.champion_skins.items()
+            if any(skin in self.search_matches for skin in champion_data['skins'])
+        )
+    
+    def visible_skins(self):
+        skins = []
+        for champion_data in self.champion_skins.values():
+            skins.extend(champion_data['skins'])
+        if self.search_matches is not None:
+            skins = [skin for skin in skins if skin in self.search_matches]
+        return sorted(skins)
+    
+    def grid_placeholder_text(self):
+        if self.scanning:
+            return "🔍 Scanning installed skins..."
+        if self.champion_skins and self.search_matches is not None:
+            return f"🔍 No skins match \"{self.search_var.get().strip()}\""
+        return "🔍 No champions found\nConfigure CSLoL path first"
+    
+    def update_grid_placeholder(self):
+        if self.grid_champions:
+            if self.grid_placeholder is not None:
+                self.grid_placeholder.destroy()
+                self.grid_placeholder = None
+            return
+        
+        if self.grid_placeholder is None:
+            self.grid_placeholder = tk.Label(
                 self.champions_grid_frame,
-                text="🔍 No champions found\nConfigure CSLoL path first",
                 bg=AppTheme.BG_CARD,
                 fg=AppTheme.TEXT_SECONDARY,
                 font=("Segoe UI", 12),
                 justify=tk.CENTER
             )
-            no_data_label.pack(expand=True, pady=50)
+            self.grid_placeholder.grid(row=0, column=0, columnspan=self.GRID_COLUMNS, pady=50)
+        self.grid_placeholder.configure(text=self.grid_placeholder_text())
+    
+    def refresh_grid(self, changed_champions=(), reset=False):
+        for champion_name in changed_champions:
+            card = self.champion_cards.pop(champion_name, None)
+            if card is not None:
+                card.destroy()
+        
+        self.grid_champions = self.visible_champions()
+        if reset:
+            self.grid_rendered = 0
+            self.champions_canvas.yview_moveto(0)
+        self.grid_rendered = min(self.grid_rendered, len(self.grid_champions))
+        
+        displayed = self.grid_champions[:self.grid_rendered]
+        displayed_names = set(displayed)
+        for champion_name, card in self.champion_cards.items():
+            if champion_name not in displayed_names:
+                card.grid_remove()
+        for index, champion_name in enumerate(displayed):
+            self.show_champion_card(index, champion_name)
+        
+        self.update_grid_placeholder()
+        self.schedule_card_render()
+        self.champions_canvas.configure(scrollregion=self.champions_canvas.bbox("all"))
+    
+    def render_visible_cards(self):
+        self.card_render_job = None
+        if self.hidden:
             return
+        while self.grid_rendered < len(self.grid_champions) and not self.grid_filled():
+            row_end = min(self.grid_rendered + self.GRID_COLUMNS, len(self.grid_champions))
+            for index in range(self.grid_rendered, row_end):
+                self.show_champion_card(index, self.grid_champions[index])
+            self.grid_rendered = row_end
         
-        champions = sorted(self.champion_skins.keys())
-        columns = 4
+        self.champions_canvas.configure(scrollregion=self.champions_canvas.bbox("all"))
+    
+    def grid_filled(self):
+        self.champions_grid_frame.update_idletasks()
+        view_height = max(self.champions_canvas.winfo_height(), 1)
+        view_bottom = self.champions_canvas.canvasy(0) + view_height
+        return self.champions_grid_frame.winfo_reqheight() > view_bottom + view_height
+    
+    def schedule_card_render(self):
+        if self.card_render_job is None and self.grid_rendered < len(self.grid_champions):
+            self.card_render_job = self.frame.after_idle(self.render_visible_cards)
+    
+    def show_champion_card(self, index, champion_name):
+        card = self.champion_cards.get(champion_name)
+        if card is None:
+            card = self.create_champion_card(champion_name)
+        card.grid(row=index // self.GRID_COLUMNS, column=index % self.GRID_COLUMNS, padx=8, pady=8, sticky="ew")
+        self.apply_card_filter(champion_name)
+    
+    def apply_card_filter(self, champion_name):
+        if champion_name in self.card_filters and self.card_filters[champion_name] is self.search_matches:
+            return
+        self.card_filters[champion_name] = self.search_matches
+        
+        skins = self.champion_skins[champion_name]['skins']
+        for skin in skins:
+            self.skin_buttons[skin].pack_forget()
+        for skin in skins:
+            if self.search_matches is None or skin in self.search_matches:
+                self.skin_buttons[skin].pack(fill=tk.X, pady=1)
+    
+    def create_champion_card(self, champion_name):
+        champion_data = self.champion_skins[champion_name]
+        emoji = champion_data['emoji']
+        skins = champion_data['skins']
+        
+        champion_frame = tk.Frame(
+            self.champions_grid_frame,
+            bg=AppTheme.BG_LIGHT,
+            relief="flat",
+            bd=1,
+            highlightbackground=AppTheme.BORDER,
+            highlightcolor=AppTheme.BORDER_ACCENT,
+            highlightthickness=1
+        )
         
-        for i, champion_name in enumerate(champions):
-            row = i // columns
-            col = i % columns
-            
-            champion_data = self.champion_skins[champion_name]
-            emoji = champion_data['emoji']
-            skins = champion_data['skins']
+        champion_header = tk.Frame(champion_frame, bg=AppTheme.BG_LIGHT)
+        champion_header.pack(fill=tk.X, padx=10, pady=(10, 5))
+        
+        tk.Label(
+            champion_header,
+            text=f"{emoji} {champion_name}",
+            bg=AppTheme.BG_LIGHT,
+            fg=AppTheme.TEXT_ACCENT,
+            font=("Segoe UI", 11, "bold")
+        ).pack()
+        
+        tk.Label(
+            champion_header,
+            text=f"{len(skins)} skin{'s' if len(skins) != 1 else ''}",
+            bg=AppTheme.BG_LIGHT,
+            fg=AppTheme.TEXT_SECONDARY,
+            font=("Segoe UI", 9)
+        ).pack()
+        
+        skins_frame = tk.Frame(champion_frame, bg=AppTheme.BG_LIGHT)
+        skins_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        
+        for skin in skins:
+            is_selected = skin in self.selected_skins
+            skin_var = tk.BooleanVar(value=is_selected)
             
-            champion_frame = tk.Frame(
-                self.champions_grid_frame,
+            skin_button = tk.Checkbutton(
+                skins_frame,
+                text=f"🎨 {skin}",
+                variable=skin_var,
                 bg=AppTheme.BG_LIGHT,
+                fg=AppTheme.TEXT_PRIMARY if is_selected else AppTheme.TEXT_SECONDARY,
+                selectcolor=AppTheme.BG_MEDIUM,
+                activebackground=AppTheme.BG_MEDIUM,
+                activeforeground=AppTheme.TEXT_PRIMARY,
+                font=("Segoe UI", 9),
+                anchor="w",
                 relief="flat",
-                bd=1,
-                highlightbackground=AppTheme.BORDER,
-                highlightcolor=AppTheme.BORDER_ACCENT,
-                highlightthickness=1
+                bd=0,
+                command=lambda s=skin: self.toggle_skin_selection(s)
             )
-            champion_frame.grid(row=row, column=col, padx=8, pady=8, sticky="ew")
-            
-            champion_header = tk.Frame(champion_frame, bg=AppTheme.BG_LIGHT)
-            champion_header.pack(fill=tk.X, padx=10, pady=(10, 5))
-            
-            tk.Label(
-                champion_header,
-                text=f"{emoji} {champion_name}",
-                bg=AppTheme.BG_LIGHT,
-                fg=AppTheme.TEXT_ACCENT,
-                font=("Segoe UI", 11, "bold")
-            ).pack()
             
-            tk.Label(
-                champion_header,
-                text=f"{len(skins)} skin{'s' if len(skins) != 1 else ''}",
-                bg=AppTheme.BG_LIGHT,
-                fg=AppTheme.TEXT_SECONDARY,
-                font=("Segoe UI", 9)
-            ).pack()
-            
-            skins_frame = tk.Frame(champion_frame, bg=AppTheme.BG_LIGHT)
-            skins_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
-            
-            for skin in skins:
-                is_selected = skin in self.selected_skins
-                
-                skin_button = tk.Checkbutton(
-                    skins_frame,
-                    text=f"🎨 {skin}",
-                    bg=AppTheme.BG_LIGHT,
-                    fg=AppTheme.TEXT_PRIMARY if is_selected else AppTheme.TEXT_SECONDARY,
-                    selectcolor=AppTheme.BG_MEDIUM,
-                    activebackground=AppTheme.BG_MEDIUM,
-                    activeforeground=AppTheme.TEXT_PRIMARY,
-                    font=("Segoe UI", 9),
-                    anchor="w",
-                    relief="flat",
-                    bd=0,
-                    command=lambda s=skin: self.toggle_skin_selection(s)
-                )
-                
-                if is_selected:
-                    skin_button.select()
-                
-                skin_button.pack(fill=tk.X, pady=1)
+            self.skin_vars[skin] = skin_var
+            self.skin_buttons[skin] = skin_button
         
-        for col in range(columns):
-            self.champions_grid_frame.columnconfigure(col, weight=1)
+        self.champion_cards[champion_name] = champion_frame
+        self.card_filters.pop(champion_name, None)
+        return champion_frame
+    
+    def update_skin_widget(self, skin_name):
+        skin_var = self.skin_vars.get(skin_name)
+        if skin_var is None:
+            return
         
-        self.champions_grid_frame.update_idletasks()
-        self.champions_canvas.configure(scrollregion=self.champions_canvas.bbox("all"))
+        is_selected = skin_name in self.selected_skins
+        if skin_var.get() != is_selected:
+            skin_var.set(is_selected)
+        self.skin_buttons[skin_name].configure(
+            fg=AppTheme.TEXT_PRIMARY if is_selected else AppTheme.TEXT_SECONDARY
+        )
     
     def populate_skin_list(self):
         self.skin_listbox.delete(0, tk.END)
         
-        all_skins = []
-        for champion_data in self.champion_skins.values():
-            all_skins.extend(champion_data['skins'])
-        
-        all_skins.sort()
-        
-        for skin in all_skins:
+        for skin in self.visible_skins():
             self.skin_listbox.insert(tk.END, f"🎨 {skin}")
             if skin in self.selected_skins:
                 self.skin_listbox.selection_set(tk.END)
@@ -446,10 +765,25 @@ class SkinProcessorTab:
         else:
             self.selected_skins.add(skin_name)
         
+        self.update_skin_widget(skin_name)
         self.update_selection_status()
+    
+    def on_search_changed(self, *args):
+        if self.search_job is not None:
+            self.frame.after_cancel(self.search_job)
+        self.search_job = self.frame.after(self.SEARCH_DELAY_MS, self.apply_search)
+    
+    def apply_search(self):
+        self.search_job = None
+        self.search_matches = self.search_index.search(self.search_var.get())
         
         if self.view_mode == "champion":
-            self.populate_champions_grid()
+            if self.grid_dirty:
+                self.populate_champions_grid()
+            else:
+                self.refresh_grid(reset=True)
+        else:
+            self.populate_skin_list()
     
     def update_selection_status(self):
         count = len(self.selected_skins)
@@ -457,7 +791,7 @@ class SkinProcessorTab:
             text=f"{count} skin{'s' if count != 1 else ''} selected"
         )
         
-        total_skins = sum(len(data['skins']) for data in self.champion_skins.values())
+        total_skins = self.total_skins
         self.status_label.configure(
             text=f"{count} of {total_skins} skins selected for processing"
         )
@@ -468,52 +802,216 @@ class SkinProcessorTab:
     def on_champions_canvas_configure(self, event):
         canvas_width = event.width
         self.champions_canvas.itemconfig(self.champions_canvas_window, width=canvas_width)
+        self.schedule_card_render()
+    
+    def on_champions_scrolled(self, first, last):
+        self.champions_scrollbar.set(first, last)
+        if float(last) >= self.GRID_PREFETCH_FRACTION:
+            self.schedule_card_render()
     
     def on_mousewheel(self, event):
         if self.view_mode == "champion" and self.champions_canvas.winfo_viewable():
             self.champions_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
     
     def load_skins(self):
+        self.cancel_scan()
         if not self.config.validate_cslol_path():
-            self.logger.log("⚠️ CSLoL Manager path not configured!")
+            self.logger.warning("⚠️ CSLoL Manager path not configured!")
             return
         
-        self.processor = SkinProcessor(self.config, self.logger)
-        self.champion_skins = self.processor.get_skins_by_champion()
+        self.get_processor()
+        if self.watch_var.get() and not self.watcher:
+            self.start_watcher()
         
-        total_skins = sum(len(data['skins']) for data in self.champion_skins.values())
-        champion_count = len(self.champion_skins)
+        pending = self.processor.pending_batch()
+        if pending:
+            self.logger.info(f"⏯ Interrupted {pending.describe()} - use Resume to continue or discard it")
         
-        self.logger.log(f"✅ Found {total_skins} skins from {champion_count} champions")
+        self.champion_skins = {}
+        self.total_skins = 0
+        self.search_index.clear()
+        self.search_matches = self.search_index.search(self.search_var.get())
+        self.grid_dirty = True
+        self.scanning = True
         
         if self.view_mode == "champion":
             self.populate_champions_grid()
         else:
             self.populate_skin_list()
         
+        self.scan_id += 1
+        self.scan_cancel = threading.Event()
+        scan_queue = queue.Queue()
+        
+        self.status_label.configure(text="🔍 Scanning installed skins...")
+        self.scan_progress.configure(value=0, maximum=1)
+        self.scan_progress.pack(anchor="w", pady=(5, 0))
+        
+        threading.Thread(
+            target=self.scan_skins_thread,
+            args=(self.processor, self.scan_cancel, scan_queue),
+            name="skin-scan",
+            daemon=True
+        ).start()
+        self.frame.after(self.SCAN_POLL_MS, self.poll_scan, self.scan_id, scan_queue)
+    
+    def cancel_scan(self):
+        if self.scan_cancel is not None:
+            self.scan_cancel.set()
+            self.scan_cancel = None
+        self.scan_id += 1
+        self.scanning = False
+        self.scan_progress.pack_forget()
+    
+    def scan_skins_thread(self, processor, cancel_event, scan_queue):
+        try:
+            processor.get_skins_by_champion(
+                on_batch=lambda batch, scanned, total: scan_queue.put(('batch', batch, scanned, total)),
+                cancel_event=cancel_event
+            )
+            scan_queue.put(('done', None, 0, 0))
+        except Exception as e:
+            scan_queue.put(('error', e, 0, 0))
+    
+    def poll_scan(self, scan_id, scan_queue):
+        if scan_id != self.scan_id:
+            return
+        
+        changed = set()
+        finished = False
+        while not finished:
+            try:
+                kind, payload, scanned, total = scan_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'batch':
+                changed.update(self.add_discovered_skins(payload))
+                self.scan_progress.configure(maximum=max(total, 1), value=scanned)
+                self.status_label.configure(text=f"🔍 Scanning installed skins... {scanned}/{total}")
+            else:
+                if kind == 'error':
+                    self.logger.error(f"❌ Skin scan failed: {payload}")
+                finished = True
+        
+        if changed:
+            if self.search_matches is not None:
+                self.search_matches = self.search_index.search(self.search_var.get())
+            if self.view_mode == "champion" and not self.grid_dirty:
+                self.refresh_grid(changed)
+            else:
+                self.grid_dirty = True
+                if self.view_mode != "champion":
+                    self.populate_skin_list()
+        
+        if not finished:
+            self.frame.after(self.SCAN_POLL_MS, self.poll_scan, scan_id, scan_queue)
+            return
+        
+        self.scan_cancel = None
+        self.scanning = False
+        self.scan_progress.pack_forget()
+        if self.grid_placeholder is not None:
+            self.grid_placeholder.configure(text=self.grid_placeholder_text())
+        
+        self.logger.log(f"✅ Found {self.total_skins} skins from {len(self.champion_skins)} champions")
         self.update_selection_status()
     
-    def select_all(self):
-        for champion_data in self.champion_skins.values():
+    def add_discovered_skins(self, batch):
+        for champion_name, champion_data in batch.items():
+            entry = self.champion_skins.get(champion_name)
+            if entry is None:
+                entry = self.champion_skins[champion_name] = {'emoji': champion_data['emoji'], 'skins': []}
+            entry['skins'].extend(champion_data['skins'])
+            entry['skins'].sort()
+            self.total_skins += len(champion_data['skins'])
             for skin in champion_data['skins']:
+                self.search_index.add(skin, champion_name)
+        return batch.keys()
+    
+    def select_all(self):
+        changed = []
+        for skin in self.visible_skins():
+            if skin not in self.selected_skins:
                 self.selected_skins.add(skin)
+                changed.append(skin)
         
+        for skin in changed:
+            self.update_skin_widget(skin)
         self.update_selection_status()
         
-        if self.view_mode == "champion":
-            self.populate_champions_grid()
-        else:
+        if self.view_mode != "champion":
             self.skin_listbox.select_set(0, tk.END)
     
     def clear_all(self):
+        changed = list(self.selected_skins)
         self.selected_skins.clear()
+        
+        for skin in changed:
+            self.update_skin_widget(skin)
         self.update_selection_status()
         
-        if self.view_mode == "champion":
-            self.populate_champions_grid()
-        else:
+        if self.view_mode != "champion":
             self.skin_listbox.selection_clear(0, tk.END)
     
+    def get_processor(self):
+        installed_path = Path(self.config.get_cslol_path()) / "installed"
+        if self.processor and self.processor.installed_path == installed_path:
+            return self.processor
+        if self.processor and self.processor.batch_lock.locked():
+            self.logger.warning(f"⚠️ Still processing skins in {self.processor.installed_path}, the new CSLoL path applies once it finishes")
+            return self.processor
+        
+        self.processor = SkinProcessor(self.config, self.logger)
+        if self.watcher:
+            self.start_watcher()
+        return self.processor
+    
+    def on_workers_changed(self):
+        try:
+            self.config.set_max_workers(self.workers_var.get())
+        except (tk.TclError, ValueError):
+            pass
+    
+    def on_trace_changed(self):
+        enabled = self.trace_var.get()
+        self.config.set_trace_enabled(enabled)
+        if self.processor:
+            self.processor.tracer.enabled = enabled
+    
+    def on_watch_changed(self):
+        enabled = self.watch_var.get()
+        self.config.set_watch_enabled(enabled)
+        
+        if not enabled:
+            self.stop_watcher()
+        elif not self.processor:
+            self.logger.warning("⚠️ CSLoL Manager path not configured!")
+        else:
+            self.start_watcher()
+    
+    def start_watcher(self):
+        self.stop_watcher()
+        self.watcher = InstalledWatcher(
+            self.processor,
+            self.logger,
+            poll_interval=self.config.get_watch_poll_interval(),
+            settle_seconds=self.config.get_watch_settle_seconds(),
+            on_processed=lambda skin, result: self.frame.after(0, self.on_watched_skin, skin, result)
+        )
+        self.watcher.start()
+    
+    def stop_watcher(self):
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+    
+    def on_watched_skin(self, skin_name, result):
+        if isinstance(result, Exception):
+            self.progress_var.set(f"👁 Watch mode: ❌ {skin_name} failed: {result}")
+        else:
+            self.progress_var.set(f"👁 Watch mode: {skin_name} {result}")
+    
     def start_processing(self):
         if not self.config.validate_cslol_path():
             messagebox.showerror("Error", "CSLoL Manager path not configured!")
@@ -524,28 +1022,140 @@ class SkinProcessorTab:
             return
         
         selected_list = list(self.selected_skins)
+        self.on_workers_changed()
         self.progress_var.set(f"Processing {len(selected_list)} skins...")
         self.progress_bar.start(10)
         
         processing_thread = threading.Thread(
             target=self.process_skins_thread,
-            args=(selected_list,),
+            args=(selected_list, self.force_var.get()),
             daemon=True
         )
         processing_thread.start()
     
-    def process_skins_thread(self, selected_skins):
+    def start_resume(self):
+        if not self.config.validate_cslol_path():
+            messagebox.showerror("Error", "CSLoL Manager path not configured!")
+            return
+        
+        self.get_processor()
+        
+        pending = self.processor.pending_batch()
+        if pending is None:
+            messagebox.showinfo("Resume", "There is no interrupted batch to resume.")
+            return
+        
+        answer = messagebox.askyesnocancel(
+            "Resume Batch",
+            f"Resume the interrupted {pending.describe()}?\n\nChoose No to discard it instead.",
+            icon="question"
+        )
+        if answer is None:
+            return
+        if not answer:
+            try:
+                self.processor.discard_batch()
+            except Exception as e:
+                messagebox.showerror("Resume Batch", str(e))
+            return
+        
+        self.on_workers_changed()
+        self.progress_var.set(f"Resuming {len(pending.pending)} skins...")
+        self.progress_bar.start(10)
+        
+        threading.Thread(target=self.process_skins_thread, args=(None, False, True), daemon=True).start()
+    
+    def process_skins_thread(self, selected_skins, force=False, resume=False):
         try:
-            if not self.processor:
-                self.processor = SkinProcessor(self.config, self.logger)
+            self.get_processor()
             
-            self.processor.process_skins(selected_skins)
+            if resume:
+                report = self.processor.resume_batch(max_workers=self.config.get_max_workers())
+            else:
+                report = self.processor.process_skins(
+                    selected_skins,
+                    max_workers=self.config.get_max_workers(),
+                    force=force
+                )
             
-            self.frame.after(0, lambda: self.progress_var.set("✅ Processing completed successfully!"))
+            summary = f"✅ Processing completed successfully! ({len(report.processed)} processed, {len(report.skipped)} skipped)"
+            self.frame.after(0, lambda: self.progress_var.set(summary))
             self.frame.after(0, self.progress_bar.stop)
             
         except Exception as e:
             error_msg = f"❌ Processing failed: {str(e)}"
             self.frame.after(0, lambda: self.progress_var.set(error_msg))
             self.frame.after(0, self.progress_bar.stop)
-            self.frame.after(0, lambda: messagebox.showerror("Processing Error", str(e))) 
\ No newline at end of file
+            self.frame.after(0, lambda: messagebox.showerror("Processing Error", str(e)))
+    
+    def start_restore(self):
+        if not self.config.validate_cslol_path():
+            messagebox.showerror("Error", "CSLoL Manager path not configured!")
+            return
+        
+        if not self.selected_skins:
+            messagebox.showwarning("Warning", "Please select at least one skin to restore!")
+            return
+        
+        self.get_processor()
+        
+        selected_list = sorted(self.selected_skins)
+        snapshot_id = None
+        if len(selected_list) == 1:
+            snapshot_id = self.ask_snapshot(selected_list[0])
+            if snapshot_id is None:
+                return
+        elif not messagebox.askyesno(
+            "Restore Skins",
+            f"Restore {len(selected_list)} skins to their latest backup?",
+            icon="question"
+        ):
+            return
+        
+        self.progress_var.set(f"Restoring {len(selected_list)} skins...")
+        self.progress_bar.start(10)
+        
+        threading.Thread(target=self.restore_skins_thread, args=(selected_list, snapshot_id), daemon=True).start()
+    
+    def ask_snapshot(self, skin_name):
+        snapshots = self.processor.list_backups(skin_name)
+        if len(snapshots) <= 1:
+            if messagebox.askyesno("Restore Skin", f"Restore {skin_name} to its latest backup?", icon="question"):
+                return snapshots[-1] if snapshots else ""
+            return None
+        
+        snapshots = snapshots[::-1]
+        choices = "\n".join(f"{i + 1}. {snapshot}{' (latest)' if i == 0 else ''}" for i, snapshot in enumerate(snapshots))
+        while True:
+            answer = simpledialog.askstring(
+                "Restore Skin",
+                f"Backups of {skin_name}:\n{choices}\n\nRestore which backup (number or id)?",
+                initialvalue="1",
+                parent=self.frame
+            )
+            if answer is None:
+                return None
+            answer = answer.strip()
+            if answer.isdigit() and 1 <= int(answer) <= len(snapshots):
+                return snapshots[int(answer) - 1]
+            if answer in snapshots:
+                return answer
+            messagebox.showwarning("Restore Skin", f"Unknown backup: {answer}")
+    
+    def restore_skins_thread(self, selected_skins, snapshot_id=None):
+        self.get_processor()
+        
+        failed = []
+        for skin in selected_skins:
+            try:
+                self.processor.restore_skin(skin, snapshot_id or None)
+            except Exception as e:
+                self.logger.error(f"❌ Could not restore {skin}: {e}")
+                failed.append(skin)
+        
+        if failed:
+            message = f"❌ Restore failed for {len(failed)} of {len(selected_skins)} skins"
+        else:
+            message = f"✅ Restored {len(selected_skins)} skins"
+        self.frame.after(0, lambda: self.progress_var.set(message))
+        self.frame.after(0, self.progress_bar.stop)
\ No newline at end of file
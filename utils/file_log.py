@@ -0,0 +1,156 @@
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+class RotatingFileLog:
+    MAX_QUEUE_SIZE = 50000
+    MAX_BATCH_SIZE = 5000
+    FLUSH = "flush"
+    STOP = "stop"
+    
+    def __init__(self, log_dir, file_name="tools_helper.log", max_bytes=5 * 1024 * 1024, backup_count=5):
+        self.log_dir = Path(log_dir)
+        self.log_file = self.log_dir / file_name
+        self.max_bytes = max(1024, max_bytes)
+        self.backup_count = max(0, backup_count)
+        self.queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self.lock = threading.Lock()
+        self.dropped = 0
+        self.reported_dropped = 0
+        self.stream = None
+        self.current_size = 0
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="log-writer", daemon=True)
+        self.thread.start()
+    
+    @classmethod
+    def from_config(cls, config_manager):
+        if not config_manager.get_file_log_enabled():
+            return None
+        return cls(
+            config_manager.get_data_path("logs"),
+            max_bytes=config_manager.get_log_max_size_mb() * 1024 * 1024,
+            backup_count=config_manager.get_log_backup_count()
+        )
+    
+    def write(self, level_name, message):
+        try:
+            self.queue.put_nowait((time.time(), level_name, threading.current_thread().name, message))
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+    
+    def flush(self, timeout=5.0):
+        return self.send_control(self.FLUSH, timeout)
+    
+    def close(self, timeout=5.0):
+        if self.closed:
+            return True
+        self.closed = self.send_control(self.STOP, timeout)
+        self.thread.join(timeout)
+        return self.closed
+    
+    def send_control(self, command, timeout):
+        if not self.thread.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            self.queue.put((None, command, done, None), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                if not self.write_batch(batch):
+                    return
+            except OSError:
+                self.close_stream()
+    
+    def write_batch(self, batch):
+        lines = []
+        for created, level_name, thread_name, message in batch:
+            if created is not None:
+                lines.append(self.format_record(created, level_name, thread_name, message))
+                continue
+            
+            command, done = level_name, thread_name
+            self.write_lines(lines)
+            lines = []
+            self.sync()
+            done.set()
+            if command == self.STOP:
+                self.close_stream()
+                return False
+        
+        with self.lock:
+            newly_dropped = self.dropped - self.reported_dropped
+            self.reported_dropped = self.dropped
+        if newly_dropped:
+            lines.append(self.format_record(time.time(), "warning", "log-writer", f"{newly_dropped} log records dropped (file log queue full)"))
+        
+        self.write_lines(lines)
+        if self.stream:
+            self.stream.flush()
+        return True
+    
+    @staticmethod
+    def format_record(created, level_name, thread_name, message):
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created)) + f".{int(created * 1000) % 1000:03d}"
+        text = str(message).replace("\n", "\n    ")
+        return f"{timestamp} [{level_name.upper():7}] [{thread_name}] {text}\n"
+    
+    def write_lines(self, lines):
+        if not lines:
+            return
+        data = "".join(lines).encode('utf-8')
+        if self.stream is None:
+            self.open_stream()
+        if self.current_size and self.current_size + len(data) > self.max_bytes:
+            self.rotate()
+        self.stream.write(data)
+        self.current_size += len(data)
+    
+    def open_stream(self):
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.stream = open(self.log_file, 'ab', buffering=64 * 1024)
+        self.current_size = self.stream.tell()
+    
+    def close_stream(self):
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError:
+                pass
+            self.stream = None
+    
+    def sync(self):
+        if self.stream is not None:
+            self.stream.flush()
+            os.fsync(self.stream.fileno())
+    
+    def rotated_file(self, index):
+        return self.log_file.with_name(f"{self.log_file.name}.{index}")
+    
+    def rotate(self):
+        self.close_stream()
+        if self.backup_count:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.rotated_file(index)
+                if source.exists():
+                    os.replace(source, self.rotated_file(index + 1))
+            if self.log_file.exists():
+                os.replace(self.log_file, self.rotated_file(1))
+        elif self.log_file.exists():
+            self.log_file.unlink()
+        self.open_stream()
@@ -1,3 +1,4 @@
+import os
 import shutil
 import threading
 import time
@@ -72,10 +73,56 @@ class FileManager:
         return f"{base_name}_{timestamp}_{random_id}"
     
     @staticmethod
-    def cleanup_old_work_directories(base_path, patterns, logger=None):
+    def link_or_copy(source, destination):
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+        return destination
+    
+    @staticmethod
+    def make_private(path):
+        if not path.exists() or path.stat().st_nlink <= 1:
+            return path
+        temp_path = path.with_name(path.name + ".private")
+        shutil.copy2(path, temp_path)
+        os.replace(temp_path, path)
+        return path
+    
+    @staticmethod
+    def clone_directory(source, destination, copy_if=None):
+        def clone_file(source_file, destination_file):
+            if copy_if and copy_if(Path(source_file)):
+                return shutil.copy2(source_file, destination_file)
+            return FileManager.link_or_copy(source_file, destination_file)
+        
+        shutil.copytree(source, destination, copy_function=clone_file)
+    
+    @staticmethod
+    def replace_directory(source, target, trash_dir, logger=None, backup_target=None):
+        trash_dir.mkdir(parents=True, exist_ok=True)
+        outgoing = backup_target or trash_dir / FileManager.generate_unique_dir_name(f"outgoing_{target.name}")
+        
+        if target.exists():
+            target.rename(outgoing)
+        
+        try:
+            source.rename(target)
+        except OSError:
+            if outgoing.exists() and not target.exists():
+                outgoing.rename(target)
+            raise
+        
+        if outgoing.exists() and backup_target is None:
+            FileManager.force_remove_directory(outgoing, logger)
+    
+    @staticmethod
+    def cleanup_old_work_directories(base_path, patterns, logger=None, keep=()):
         for pattern in patterns:
             old_dirs = list(base_path.glob(pattern))
             for old_dir in old_dirs:
+                if old_dir.name in keep:
+                    continue
                 try:
                     shutil.rmtree(old_dir)
                     if logger:
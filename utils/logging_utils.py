@@ -1,29 +1,246 @@
-import tkinter as tk
+import atexit
+import queue
+import sys
+import threading
+import traceback
+from collections import deque
 
 class LogHandler:
-    def __init__(self):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning", ERROR: "error"}
+    
+    FLUSH_INTERVAL_MS = 100
+    MAX_QUEUE_SIZE = 20000
+    MAX_BATCH_SIZE = 2000
+    MAX_LINES = 5000
+    
+    def __init__(self, level="info"):
         self.log_widget = None
-        self.pending_logs = []
+        self.drain_job = None
+        self.queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self.lock = threading.Lock()
+        self.dropped = 0
+        self.coalesced = 0
+        self.reported_dropped = 0
+        self.base_level = self.parse_level(level)
+        self.level = self.base_level
+        self.view_level = self.base_level
+        self.history = deque(maxlen=self.MAX_LINES)
+        self.sinks = []
+    
+    @classmethod
+    def parse_level(cls, level):
+        if isinstance(level, int):
+            return level
+        for value, name in cls.LEVEL_NAMES.items():
+            if name == str(level).lower():
+                return value
+        return cls.INFO
     
     def set_log_widget(self, widget):
+        self.cancel_drain()
         self.log_widget = widget
+        self.render_history()
         self.flush_pending_logs()
+        self.schedule_drain()
+    
+    def is_enabled(self, level):
+        return level >= self.level
+    
+    def log(self, message, level=INFO):
+        if level < self.level:
+            return
+        if callable(message):
+            try:
+                message = message()
+            except Exception as e:
+                message = f"⚠ Could not format log message: {e}"
+        
+        for sink in self.sinks:
+            sink.write(self.LEVEL_NAMES.get(level, "info"), message)
+        self.enqueue(level, message)
+    
+    def enqueue(self, level, message):
+        try:
+            self.queue.put_nowait((level, message))
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+    
+    def debug(self, message):
+        self.log(message, self.DEBUG)
+    
+    def info(self, message):
+        self.log(message, self.INFO)
+    
+    def warning(self, message):
+        self.log(message, self.WARNING)
+    
+    def error(self, message):
+        self.log(message, self.ERROR)
+    
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+    
+    def flush(self, timeout=5.0):
+        for sink in self.sinks:
+            sink.flush(timeout)
+    
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+    
+    def log_exception(self, context, exc_type, exc_value, exc_traceback):
+        details = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback)).rstrip()
+        self.error(f"💥 {context}: {exc_value}\n{details}")
+        self.flush()
+    
+    def install_crash_handlers(self):
+        previous_hook = sys.excepthook
+        previous_thread_hook = threading.excepthook
+        
+        def handle_exception(exc_type, exc_value, exc_traceback):
+            self.log_exception("Unhandled exception", exc_type, exc_value, exc_traceback)
+            previous_hook(exc_type, exc_value, exc_traceback)
+        
+        def handle_thread_exception(args):
+            thread_name = args.thread.name if args.thread else "unknown thread"
+            self.log_exception(f"Unhandled exception in {thread_name}", args.exc_type, args.exc_value, args.exc_traceback)
+            previous_thread_hook(args)
+        
+        sys.excepthook = handle_exception
+        threading.excepthook = handle_thread_exception
+        atexit.register(self.close)
+    
+    def set_view_level(self, level):
+        self.view_level = self.parse_level(level)
+        self.level = min(self.base_level, self.view_level)
+        self.render_history()
+    
+    def get_stats(self):
+        with self.lock:
+            return {
+                'queued': self.queue.qsize(),
+                'dropped': self.dropped,
+                'coalesced': self.coalesced,
+                'history': len(self.history)
+            }
     
-    def log(self, message):
+    def schedule_drain(self):
         if self.log_widget is None:
-            self.pending_logs.append(message)
             return
+        try:
+            self.drain_job = self.log_widget.after(self.FLUSH_INTERVAL_MS, self.drain)
+        except Exception:
+            self.log_widget = None
+            self.drain_job = None
+    
+    def cancel_drain(self):
+        if self.log_widget is not None and self.drain_job is not None:
+            try:
+                self.log_widget.after_cancel(self.drain_job)
+            except Exception:
+                pass
+        self.drain_job = None
+    
+    def drain(self):
+        self.drain_job = None
+        self.flush_pending_logs()
+        self.schedule_drain()
+    
+    def take_batch(self):
+        messages = []
+        while len(messages) < self.MAX_BATCH_SIZE:
+            try:
+                messages.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        entries = []
+        previous, repeats = None, 0
+        for message in messages + [None]:
+            if message == previous:
+                repeats += 1
+                continue
+            if previous is not None:
+                level, line = previous
+                entries.append((level, line if repeats == 1 else f"{line} (×{repeats})"))
+            previous, repeats = message, 1
+        
+        with self.lock:
+            self.coalesced += len(messages) - len(entries)
+            newly_dropped = self.dropped - self.reported_dropped
+            self.reported_dropped = self.dropped
         
-        self.log_widget.config(state=tk.NORMAL)
-        self.log_widget.insert(tk.END, f"{message}\n")
-        self.log_widget.see(tk.END)
-        self.log_widget.config(state=tk.DISABLED)
+        if newly_dropped:
+            entries.append((self.WARNING, f"⚠ {newly_dropped} log messages dropped (log queue full)"))
+        return entries
+    
+    def visible_chunks(self, entries):
+        chunks = []
+        for level, line in entries:
+            if level >= self.view_level:
+                chunks.extend((f"{line}\n", self.LEVEL_NAMES.get(level, "info")))
+        return chunks
+    
+    def trim_widget(self):
+        line_count = int(self.log_widget.index("end-1c").split(".")[0]) - 1
+        if line_count > self.MAX_LINES:
+            self.log_widget.delete("1.0", f"{line_count - self.MAX_LINES + 1}.0")
+    
+    def render_history(self):
+        if self.log_widget is None:
+            return
         
-        if hasattr(self.log_widget, 'master'):
-            self.log_widget.master.update()
+        chunks = self.visible_chunks(list(self.history))
+        try:
+            self.log_widget.config(state="normal")
+            self.log_widget.delete("1.0", "end")
+            if chunks:
+                self.log_widget.insert("end", *chunks)
+                self.trim_widget()
+            self.log_widget.see("end")
+            self.log_widget.config(state="disabled")
+        except Exception:
+            self.log_widget = None
     
     def flush_pending_logs(self):
-        if self.log_widget and self.pending_logs:
-            for message in self.pending_logs:
-                self.log(message)
-            self.pending_logs.clear() 
\ No newline at end of file
+        if self.log_widget is None:
+            return
+        
+        entries = self.take_batch()
+        if not entries:
+            return
+        
+        self.history.extend(entries)
+        chunks = self.visible_chunks(entries)
+        if not chunks:
+            return
+        
+        try:
+            self.log_widget.config(state="normal")
+            self.log_widget.insert("end", *chunks)
+            self.trim_widget()
+            self.log_widget.see("end")
+            self.log_widget.config(state="disabled")
+        except Exception:
+            self.log_widget = None
+
+
+class ConsoleLogHandler(LogHandler):
+    def __init__(self, level="info", stream=None):
+        super().__init__(level)
+        self.stream = stream or sys.stderr
+        self.write_lock = threading.Lock()
+    
+    def enqueue(self, level, message):
+        prefix = "" if level == self.INFO else f"[{self.LEVEL_NAMES.get(level, 'info').upper()}] "
+        with self.write_lock:
+            try:
+                self.stream.write(f"{prefix}{message}\n")
+                self.stream.flush()
+            except (OSError, ValueError):
+                pass
@@ -0,0 +1,234 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+class Span:
+    def __init__(self, tracer, name, category, parent, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.args = args
+        self.skin = args.get('skin') or (parent.skin if parent else None)
+        self.bytes = 0
+        self.subprocesses = 0
+        self.thread = threading.current_thread()
+        self.start_ns = 0
+        self.end_ns = 0
+    
+    def add_bytes(self, amount):
+        if callable(amount):
+            amount = amount()
+        with self.tracer.lock:
+            self.bytes += amount
+    
+    def add_subprocess(self, count=1):
+        with self.tracer.lock:
+            span = self
+            while span is not None:
+                span.subprocesses += count
+                span = span.parent
+    
+    @property
+    def duration(self):
+        return (self.end_ns - self.start_ns) / 1e9
+    
+    def __enter__(self):
+        self.tracer.push(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.pop(self)
+        return False
+
+class NullSpan:
+    skin = None
+    
+    def add_bytes(self, amount):
+        pass
+    
+    def add_subprocess(self, count=1):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+class PipelineTracer:
+    MAX_SPANS = 200000
+    MAX_TRACE_FILES = 10
+    NULL_SPAN = NullSpan()
+    
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.spans = []
+        self.dropped = 0
+        self.origin_ns = time.perf_counter_ns()
+        self.origin_time = time.time()
+    
+    def reset(self):
+        with self.lock:
+            self.spans = []
+            self.dropped = 0
+            self.origin_ns = time.perf_counter_ns()
+            self.origin_time = time.time()
+    
+    def stack(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+    
+    def current(self):
+        stack = self.stack()
+        return stack[-1] if stack else None
+    
+    def span(self, name, category="stage", **args):
+        if not self.enabled:
+            return self.NULL_SPAN
+        return Span(self, name, category, self.current(), args)
+    
+    def push(self, span):
+        self.stack().append(span)
+    
+    def pop(self, span):
+        stack = self.stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        with self.lock:
+            if len(self.spans) < self.MAX_SPANS:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+    
+    def within(self, span, function, *args):
+        if not isinstance(span, Span):
+            return function(*args)
+        stack = self.stack()
+        stack.append(span)
+        try:
+            return function(*args)
+        finally:
+            stack.remove(span)
+    
+    def count_subprocess(self, count=1):
+        span = self.current()
+        if span is not None:
+            span.add_subprocess(count)
+    
+    def stage_totals(self):
+        totals = {}
+        with self.lock:
+            spans = list(self.spans)
+        for span in spans:
+            if span.category != "stage":
+                continue
+            total = totals.setdefault(span.name, {'count': 0, 'seconds': 0.0, 'bytes': 0, 'subprocesses': 0})
+            total['count'] += 1
+            total['seconds'] += span.duration
+            total['bytes'] += span.bytes
+            total['subprocesses'] += span.subprocesses
+        return totals
+    
+    def skin_totals(self):
+        totals = {}
+        with self.lock:
+            spans = [span for span in self.spans if span.category == "skin"]
+        for span in spans:
+            totals[span.skin] = totals.get(span.skin, 0.0) + span.duration
+        return totals
+    
+    @staticmethod
+    def format_bytes(amount):
+        for unit in ("B", "KB", "MB", "GB"):
+            if amount < 1024 or unit == "GB":
+                return f"{amount:.0f} {unit}" if unit == "B" else f"{amount:.1f} {unit}"
+            amount /= 1024
+    
+    def summary_lines(self, slowest=5):
+        stages = self.stage_totals()
+        if not stages:
+            return []
+        
+        lines = ["⏱ Stage timings (wall time summed over workers):"]
+        for name, total in sorted(stages.items(), key=lambda item: -item[1]['seconds']):
+            lines.append(
+                f"   {name:<10} {total['count']:>5}×  {total['seconds']:8.2f}s total  "
+                f"{total['seconds'] / total['count']:7.3f}s avg  {self.format_bytes(total['bytes']):>9}  "
+                f"{total['subprocesses']} subprocess{'es' if total['subprocesses'] != 1 else ''}"
+            )
+        
+        skins = sorted(self.skin_totals().items(), key=lambda item: -item[1])[:slowest]
+        if skins:
+            lines.append("   Slowest skins: " + ", ".join(f"{skin} {seconds:.2f}s" for skin, seconds in skins))
+        if self.dropped:
+            lines.append(f"   {self.dropped} spans not recorded (trace limit reached)")
+        return lines
+    
+    def chrome_trace(self):
+        with self.lock:
+            spans = list(self.spans)
+            origin_ns = self.origin_ns
+        
+        pid = os.getpid()
+        threads = {}
+        events = []
+        for span in sorted(spans, key=lambda span: span.start_ns):
+            tid = threads.setdefault(span.thread.ident, (len(threads) + 1, span.thread.name))[0]
+            args = dict(span.args, bytes=span.bytes, subprocesses=span.subprocesses)
+            if span.skin:
+                args['skin'] = span.skin
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': "X",
+                'ts': (span.start_ns - origin_ns) / 1000,
+                'dur': (span.end_ns - span.start_ns) / 1000,
+                'pid': pid,
+                'tid': tid,
+                'args': args
+            })
+        
+        for tid, thread_name in threads.values():
+            events.append({'name': "thread_name", 'ph': "M", 'pid': pid, 'tid': tid, 'args': {'name': thread_name}})
+        return {'traceEvents': events, 'displayTimeUnit': "ms", 'otherData': {'started_at': self.origin_time}}
+    
+    def write_chrome_trace(self, trace_dir, prefix="batch"):
+        trace_dir = Path(trace_dir)
+        trace_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.origin_time)) + f"-{int(self.origin_time * 1000) % 1000:03d}"
+        trace_file = trace_dir / f"{prefix}_{timestamp}.json"
+        with open(trace_file, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+        
+        old_traces = sorted(trace_dir.glob(f"{prefix}_*.json"))[:-self.MAX_TRACE_FILES]
+        for old_trace in old_traces:
+            try:
+                old_trace.unlink()
+            except OSError:
+                pass
+        return trace_file
+
+def directory_size(path):
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total